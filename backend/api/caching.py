@@ -0,0 +1,72 @@
+"""Versioned caching for read-mostly API resources.
+
+Each cached resource belongs to a namespace with a version number stored in
+the shared cache. Entries are keyed by that version, so invalidating a
+namespace is a single ``incr``: stale entries are never read again and simply
+expire. Admin saves bump the namespaces they affect (see the admin classes).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+T = TypeVar("T")
+
+# Namespaces of cached API resources
+PROCESS_LIST = "processes"
+QUESTIONNAIRE_LIST = "questionnaires"
+
+
+def _version_key(namespace: str) -> str:
+    return f"api-cache:{namespace}:version"
+
+
+def get_version(namespace: str) -> int:
+    """Return the current version of ``namespace``, initialising it on first use."""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so an evicted version never revives stale entries.
+        cache.add(key, time.time_ns() // 1000, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace: str) -> None:
+    """Invalidate every entry cached under ``namespace``."""
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        # Never initialised, or evicted: the next read seeds a fresh version.
+        pass
+
+
+def invalidate(*namespaces: str) -> None:
+    """Invalidate ``namespaces`` once the current transaction commits.
+
+    Bumping inside the transaction would let a concurrent request re-cache
+    the pre-commit state under the new version. Outside a transaction (or
+    in autocommit) the bump happens immediately; on rollback it never does.
+    """
+
+    def _bump() -> None:
+        for namespace in namespaces:
+            bump_version(namespace)
+
+    transaction.on_commit(_bump)
+
+
+def get_or_set(namespace: str, name: str, build: Callable[[], T], timeout: int | None = None) -> T:
+    """Return the cached value ``name`` for the current version, building it on a miss."""
+    key = f"api-cache:{namespace}:{get_version(namespace)}:{name}"
+    value: Any = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value, timeout=settings.API_CACHE_TIMEOUT if timeout is None else timeout)
+    return value
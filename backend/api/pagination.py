@@ -0,0 +1,164 @@
+"""Keyset (cursor) pagination for application listings.
+
+DRF's ``CursorPagination`` positions on the first ordering field only and
+cannot handle NULLs, but the queues here sort on nullable timestamps such as
+``submitted_at``. These classes paginate on ``(<field>, id)`` instead, so each
+page is a single index range scan regardless of how deep the client pages.
+
+Views opt in by setting ``keyset_ordering_fields`` (allowed ``?ordering=``
+values, the first being the default) and adding ``KeysetOrderingFilter``:
+
+    filter_backends = [KeysetOrderingFilter]
+    pagination_class = KeysetPagination
+    keyset_ordering_fields = ("-submitted_at", "submitted_at")
+
+NULLs sort last ascending and first descending (PostgreSQL's default), so both
+directions can be served by one ascending B-tree index on ``(<field>, id)``.
+"""
+
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework import filters
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def get_keyset_ordering(request, view) -> str:
+    """Return the validated ``?ordering=`` value for the view (e.g. ``-submitted_at``)."""
+    allowed = view.keyset_ordering_fields
+    ordering = request.query_params.get("ordering") or allowed[0]
+    if ordering not in allowed:
+        raise ValidationError({"ordering": f"Must be one of: {', '.join(allowed)}."})
+    return ordering
+
+
+def _split_ordering(ordering: str) -> tuple[str, bool]:
+    """Split ``-field`` into ``("field", True)``."""
+    return ordering.lstrip("-"), ordering.startswith("-")
+
+
+class KeysetOrderingFilter(filters.BaseFilterBackend):
+    """
+    Order by the requested keyset field with ``id`` as the tie-breaker.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        field, descending = _split_ordering(get_keyset_ordering(request, view))
+        if descending:
+            return queryset.order_by(F(field).desc(nulls_first=True), "-id")
+        return queryset.order_by(F(field).asc(nulls_last=True), "id")
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only cursor pagination on ``(<ordering field>, id)``.
+
+    Pagination is opt-in: requests without ``cursor`` or ``page_size`` get the
+    plain list the endpoints have always returned, so existing clients keep
+    working. Paginated responses are ``{"next": <url or null>, "results": [...]}``.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 200
+
+    def get_page_size(self, request) -> int:
+        value = request.query_params.get(self.page_size_query_param)
+        if value is None:
+            return self.page_size
+        try:
+            page_size = int(value)
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: "Must be an integer."})
+        if page_size < 1:
+            raise ValidationError({self.page_size_query_param: "Must be at least 1."})
+        return min(page_size, self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.request = request
+        self.ordering = get_keyset_ordering(request, view)
+        field, descending = _split_ordering(self.ordering)
+        page_size = self.get_page_size(request)
+
+        cursor = params.get(self.cursor_query_param)
+        if cursor:
+            value, last_id = self.decode_cursor(cursor, queryset.model, field)
+            queryset = queryset.filter(self._after(field, descending, value, last_id))
+
+        # Fetch one extra row to learn whether there is a next page.
+        rows = list(queryset[: page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+
+        if self.has_next:
+            last = self.page[-1]
+            self.next_cursor = self.encode_cursor(getattr(last, field), last.pk)
+        return self.page
+
+    @staticmethod
+    def _after(field: str, descending: bool, value, last_id: int) -> Q:
+        """Return the filter selecting rows strictly after the cursor position."""
+        is_null = Q(**{f"{field}__isnull": True})
+        if descending:
+            if value is None:
+                return (is_null & Q(id__lt=last_id)) | ~is_null
+            return Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": last_id})
+        if value is None:
+            return is_null & Q(id__gt=last_id)
+        return (
+            Q(**{f"{field}__gt": value})
+            | Q(**{field: value, "id__gt": last_id})
+            | is_null
+        )
+
+    def encode_cursor(self, value, last_id: int) -> str:
+        payload = {
+            "o": self.ordering,
+            "v": value.isoformat() if value is not None else None,
+            "id": last_id,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    def decode_cursor(self, cursor: str, model, field: str):
+        """Return ``(value, id)`` from a cursor issued for the same ordering."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            if payload["o"] != self.ordering:
+                raise ValueError("Cursor was issued for a different ordering.")
+            value = payload["v"]
+            if value is not None:
+                value = model._meta.get_field(field).to_python(value)
+            return value, int(payload["id"])
+        except (binascii.Error, DjangoValidationError, ValueError, KeyError, TypeError, UnicodeError):
+            raise NotFound("Invalid cursor.")
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,81 @@
+"""Process-wide registry of compiled JSON Schema validators.
+
+``jsonschema.validate()`` re-runs ``check_schema`` and builds a fresh validator
+on every call, and the ``get_*_schema()`` helpers deepcopy their frozen schema
+each time. Both are wasted work on hot paths such as the applicant autosave, so
+each schema is checked and compiled once at import time and the resulting
+``Draft202012Validator`` is shared by every caller.
+
+Validators are keyed by schema title and ``schema_version`` so documents saved
+under an older schema version can be validated against it once schema
+versioning lands.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import Draft202012Validator
+
+_validators: dict[tuple[str, str], Draft202012Validator] = {}
+_lock = threading.Lock()
+
+
+def schema_key(schema: Mapping[str, Any]) -> tuple[str, str]:
+    """Return the registry key (title, schema version) of a schema definition."""
+    return (
+        schema["title"],
+        schema["properties"]["schema_version"]["default"],
+    )
+
+
+def register_schema(schema: Mapping[str, Any]) -> Draft202012Validator:
+    """Check and compile ``schema`` once, returning the shared validator.
+
+    Registering the same schema again returns the existing validator, so
+    modules can call this at import time without coordinating.
+    """
+    key = schema_key(schema)
+    with _lock:
+        validator = _validators.get(key)
+        if validator is None:
+            # Fail loudly at startup rather than on the first request.
+            Draft202012Validator.check_schema(schema)
+            validator = Draft202012Validator(schema)
+            _validators[key] = validator
+    return validator
+
+
+def get_validator(title: str, version: str) -> Draft202012Validator:
+    """Return the compiled validator for a registered schema.
+
+    Raises:
+        KeyError: When no schema with this title and version was registered.
+    """
+    return _validators[(title, version)]
+
+
+def get_validator_for_schema(schema: Mapping[str, Any]) -> Draft202012Validator:
+    """Return the compiled validator for ``schema``, registering it if needed."""
+    try:
+        return get_validator(*schema_key(schema))
+    except KeyError:
+        return register_schema(schema)
+
+
+def validate_document(value: Any, validator: Draft202012Validator) -> None:
+    """Validate ``value`` with a compiled validator.
+
+    Mirrors ``jsonschema.validate()`` by raising the most relevant error
+    (``best_match``) rather than the first one encountered.
+
+    Raises:
+        jsonschema.ValidationError: When the value violates the schema.
+    """
+    error: ValidationError | None = best_match(validator.iter_errors(value))
+    if error is not None:
+        raise error
@@ -1,8 +1,10 @@
 from rest_framework import serializers
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.validators import Draft202012Validator
 from django.conf import settings
 
 from api.models import ClientConfig
+from api.schema_registry import validate_document
 
 
 class JsonSchemaSerialiserMixin(serializers.Serializer):
@@ -12,12 +14,13 @@ class JsonSchemaSerialiserMixin(serializers.Serializer):
     conflicts with rest_framework serializers, therefore using a mixin.
     """
 
-    def _validate_document(self, value, schema):
+    def _validate_document(self, value, validator: Draft202012Validator):
         """
-        Validate the answers field against its schema.
+        Validate the answers field with a compiled schema validator
+        (see ``api.schema_registry``).
         """
         # Check if the schema version is same as the value's schema version
-        expected_version = schema["properties"]["schema_version"]["default"]
+        expected_version = validator.schema["properties"]["schema_version"]["default"]
         if value["schema_version"] != expected_version:
             raise serializers.ValidationError(
                 f"Schema version mismatch: expected {expected_version}, got {value['schema_version']}"
@@ -25,7 +28,7 @@ class JsonSchemaSerialiserMixin(serializers.Serializer):
 
         # Perform validation
         try:
-            validate(value, schema)
+            validate_document(value, validator)
         except ValidationError as e:
             # Get the exact coordinate from error path
             coor: str = ".".join(str(x) for x in e.absolute_path)
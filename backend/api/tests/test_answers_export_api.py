@@ -0,0 +1,178 @@
+"""API tests for the streamed CSV export of answers per questionnaire version."""
+
+import csv
+import io
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from applications.models import ApplicationStatus
+
+
+pytestmark = [pytest.mark.api]
+
+DOCUMENT = {
+    "schema_version": "2025.07-1",
+    "steps": [
+        {
+            "title": "Step 1",
+            "sections": [
+                {
+                    "title": "Section 1",
+                    "questions": [
+                        {"label": "Site", "type": "text"},
+                        {"label": "Agreed", "type": "checkbox"},
+                        {
+                            "label": "Species",
+                            "type": "grid",
+                            "grid_columns": [{"label": "Name"}, {"label": "Count", "type": "number"}],
+                        },
+                        {"label": "Evidence", "type": "file"},
+                    ],
+                }
+            ],
+        }
+    ],
+}
+
+
+@pytest.fixture
+def reviewed_questionnaire(assessor_group, process_factory, questionnaire_factory):
+    """Return a questionnaire of a process the assessor group reviews."""
+    process = process_factory(slug="fauna")
+    process.assessor_groups.add(assessor_group)
+    return questionnaire_factory(process=process, code="survey", document=DOCUMENT)
+
+
+def _submitted(application_factory, questionnaire, answers):
+    """Create a submitted application of ``questionnaire`` with the given answers."""
+    return application_factory(
+        questionnaire=questionnaire,
+        status=ApplicationStatus.SUBMITTED,
+        document={
+            "schema_version": "2025.07-1",
+            "active_step": 0,
+            "steps": [{"is_valid": True, "answers": answers}],
+        },
+    )
+
+
+def _export(api_client, **params):
+    """Request the export and return the response and its parsed rows."""
+    response = api_client.get("/api/assessment/answers-export", params)
+    if response.status_code != status.HTTP_200_OK:
+        return response, None
+    text = b"".join(response.streaming_content).decode("utf-8-sig")
+    return response, list(csv.reader(io.StringIO(text)))
+
+
+@pytest.mark.django_db
+def test_answers_are_flattened_into_columns(
+    api_client, assessor_user, reviewed_questionnaire, application_factory, attachment_factory
+):
+    """Expand grid columns, name attached files and render checkboxes as Yes/No."""
+    application = _submitted(application_factory, reviewed_questionnaire, {})
+    attachment = attachment_factory(application=application, question="0.0-3", name="map.pdf")
+    application.document["steps"][0]["answers"] = {
+        "0-0": "=HYPERLINK(1)",
+        "0-1": True,
+        "0-2": [{"Name": "Quokka", "Count": 3}, {"Name": "Numbat", "Count": 1}],
+        "0-3": [str(attachment.key)],
+    }
+    application.save()
+    api_client.force_authenticate(user=assessor_user)
+
+    response, rows = _export(api_client, process_slug="fauna", questionnaire_code="survey")
+
+    assert response["Content-Disposition"] == 'attachment; filename="fauna-survey-v1-answers.csv"'
+    header, row = rows
+    assert header[6:] == [
+        "0.0-0 Site",
+        "0.0-1 Agreed",
+        "0.0-2 Species: Name",
+        "0.0-2 Species: Count",
+        "0.0-3 Evidence",
+    ]
+    assert row[:2] == [application.internal_id, str(application.key)]
+    # Formulas typed by applicants are neutralised for spreadsheets.
+    assert row[6:] == ["'=HYPERLINK(1)", "Yes", "Quokka\nNumbat", "3\n1", "map.pdf"]
+
+
+@pytest.mark.django_db
+def test_export_streams_with_a_fixed_number_of_queries(
+    api_client, assessor_user, reviewed_questionnaire, application_factory
+):
+    """Read applications in chunks instead of querying per row."""
+    api_client.force_authenticate(user=assessor_user)
+    _submitted(application_factory, reviewed_questionnaire, {"0-0": "A"})
+    # The first export also compiles (and caches) the questionnaire.
+    _export(api_client, process_slug="fauna", questionnaire_code="survey")
+    with CaptureQueriesContext(connection) as one:
+        _export(api_client, process_slug="fauna", questionnaire_code="survey")
+
+    for index in range(5):
+        _submitted(application_factory, reviewed_questionnaire, {"0-0": f"B{index}"})
+    with CaptureQueriesContext(connection) as six:
+        _, rows = _export(api_client, process_slug="fauna", questionnaire_code="survey")
+
+    assert len(rows) == 7
+    assert len(six) == len(one)
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_export_streams_asynchronously_under_asgi(assessor_user, reviewed_questionnaire, application_factory):
+    """Stream rows as an async iterator under ASGI instead of buffering the whole export."""
+    _submitted(application_factory, reviewed_questionnaire, {"0-0": "Lake"})
+    client = AsyncClient()
+    client.force_login(assessor_user)
+
+    async def _export_async():
+        response = await client.get(
+            "/api/assessment/answers-export", {"process_slug": "fauna", "questionnaire_code": "survey"}
+        )
+        return response, b"".join([chunk async for chunk in response.streaming_content])
+
+    response, content = async_to_sync(_export_async)()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.is_async
+    rows = list(csv.reader(io.StringIO(content.decode("utf-8-sig"))))
+    assert [row[6] for row in rows[1:]] == ["Lake"]
+
+
+@pytest.mark.django_db
+def test_export_selects_the_version_and_skips_drafts(
+    api_client, assessor_user, reviewed_questionnaire, questionnaire_factory, application_factory
+):
+    """Export only the requested version's queued applications (the latest by default)."""
+    newer = questionnaire_factory(
+        process=reviewed_questionnaire.process, code="survey", version=2, document=DOCUMENT
+    )
+    old = _submitted(application_factory, reviewed_questionnaire, {"0-0": "old"})
+    new = _submitted(application_factory, newer, {"0-0": "new"})
+    application_factory(questionnaire=newer, status=ApplicationStatus.DRAFT)
+    api_client.force_authenticate(user=assessor_user)
+
+    _, latest = _export(api_client, process_slug="fauna", questionnaire_code="survey")
+    _, first = _export(api_client, process_slug="fauna", questionnaire_code="survey", version=1)
+
+    assert [row[1] for row in latest[1:]] == [str(new.key)]
+    assert [row[1] for row in first[1:]] == [str(old.key)]
+
+
+@pytest.mark.django_db
+@pytest.mark.security
+def test_export_requires_a_reviewable_questionnaire(api_client, user, reviewed_questionnaire, assessor_user):
+    """Hide questionnaires of processes the user does not review and require the selectors."""
+    api_client.force_authenticate(user=user)
+    hidden, _ = _export(api_client, process_slug="fauna", questionnaire_code="survey")
+    assert hidden.status_code == status.HTTP_404_NOT_FOUND
+
+    api_client.force_authenticate(user=assessor_user)
+    missing, _ = _export(api_client, process_slug="fauna")
+    assert missing.status_code == status.HTTP_400_BAD_REQUEST
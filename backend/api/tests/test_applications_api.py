@@ -3,11 +3,13 @@
 from datetime import timedelta
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
 
 import applications.serialisers as application_serialisers
-from applications.models import ApplicationStatus
+from applications.models import ApplicationStatus, PdfRenderJobStatus
 
 
 pytestmark = [pytest.mark.api]
@@ -80,6 +82,63 @@ def test_applications_list_omits_document_but_retrieve_includes_it(
     assert "document" in retrieve_response.data
 
 
+@pytest.mark.django_db
+def test_applications_list_paginates_newest_first_with_cursor(api_client, user, application_factory):
+    """Page through the owner's applications on (created_at, id), newest first by default."""
+    created = [application_factory(owner=user) for _ in range(5)]
+
+    api_client.force_authenticate(user=user)
+    keys, url = [], "/api/applications?page_size=2"
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) <= 2
+        keys += [row["key"] for row in response.data["results"]]
+        url = response.data["next"]
+
+    assert keys == [str(application.key) for application in reversed(created)]
+
+
+@pytest.mark.django_db
+def test_applications_list_filters_by_status_and_process(
+    api_client,
+    user,
+    process_factory,
+    questionnaire_factory,
+    application_factory,
+):
+    """Narrow the owner's list with status and process_slug filters."""
+    questionnaire = questionnaire_factory(process=process_factory(slug="wanted"))
+    match = application_factory(owner=user, questionnaire=questionnaire, status=ApplicationStatus.SUBMITTED)
+    application_factory(owner=user, questionnaire=questionnaire, status=ApplicationStatus.DRAFT)
+    application_factory(owner=user, status=ApplicationStatus.SUBMITTED)
+
+    api_client.force_authenticate(user=user)
+    response = api_client.get("/api/applications?status=SUBMITTED&process_slug=wanted")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [row["key"] for row in response.data] == [str(match.key)]
+
+
+@pytest.mark.django_db
+def test_applications_list_does_not_select_document_column(
+    api_client,
+    user,
+    application_factory,
+):
+    """Skip the answers JSONB column entirely when listing applications."""
+    application_factory(owner=user)
+    api_client.force_authenticate(user=user)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get("/api/applications")
+
+    assert response.status_code == status.HTTP_200_OK
+    list_sql = [q["sql"] for q in queries if 'FROM "applications_application"' in q["sql"]]
+    assert list_sql
+    assert all('"applications_application"."document"' not in sql for sql in list_sql)
+
+
 @pytest.mark.django_db
 def test_application_create_requires_privacy_consent(
     api_client,
@@ -261,3 +320,175 @@ def test_application_put_rejects_document_with_schema_version_mismatch(
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "Schema version mismatch" in str(response.data)
+
+
+@pytest.mark.django_db
+def test_application_submit_queues_pdf_prerender(
+    api_client,
+    user,
+    application_factory,
+    monkeypatch,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    """Queue a background render once a draft is submitted so reviewers get a cache hit."""
+    settings.PDF_PRERENDER_ON_STATUS_CHANGE = True
+    monkeypatch.setattr(application_serialisers, "verify_turnstile_token", lambda *_args, **_kwargs: True)
+    application = application_factory(owner=user, status=ApplicationStatus.DRAFT)
+
+    api_client.force_authenticate(user=user)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.patch(
+            f"/api/applications/{application.key}",
+            {"status": ApplicationStatus.SUBMITTED, "turnstile_token": "patch-token"},
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert list(application.pdf_jobs.values_list("status", flat=True)) == [PdfRenderJobStatus.QUEUED]
+
+
+@pytest.mark.django_db
+def test_application_submit_skips_prerender_when_disabled(
+    api_client,
+    user,
+    application_factory,
+    monkeypatch,
+    django_capture_on_commit_callbacks,
+):
+    """Leave pre-rendering off by default, for deployments without a PDF worker."""
+    monkeypatch.setattr(application_serialisers, "verify_turnstile_token", lambda *_args, **_kwargs: True)
+    application = application_factory(owner=user, status=ApplicationStatus.DRAFT)
+
+    api_client.force_authenticate(user=user)
+    with django_capture_on_commit_callbacks(execute=True):
+        api_client.patch(
+            f"/api/applications/{application.key}",
+            {"status": ApplicationStatus.SUBMITTED, "turnstile_token": "patch-token"},
+            format="json",
+        )
+
+    assert not application.pdf_jobs.exists()
+
+
+def _two_step_questionnaire(questionnaire_factory):
+    """Create a questionnaire with two steps so answer deltas can start step 1."""
+    questionnaire = questionnaire_factory()
+    questionnaire.document["steps"].append(dict(questionnaire.document["steps"][0], title="Step 2"))
+    questionnaire.save(update_fields=["document"])
+    return questionnaire
+
+
+@pytest.mark.django_db
+def test_application_answers_delta_updates_single_answer_in_place(
+    api_client,
+    user,
+    application_factory,
+):
+    """Write only the touched answer and keep the rest of the document."""
+    application = application_factory(
+        owner=user,
+        document={
+            "schema_version": "2025.07-1",
+            "active_step": 0,
+            "steps": [{"is_valid": None, "answers": {"0-0": "kept", "0-1": "old"}}],
+        },
+    )
+
+    api_client.force_authenticate(user=user)
+    response = api_client.patch(
+        f"/api/applications/{application.key}/answers",
+        {"step": 0, "answers": {"0-1": "new", "0-2": [{"col": 1}]}, "is_valid": True},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    application.refresh_from_db()
+    assert application.document["steps"] == [
+        {"is_valid": True, "answers": {"0-0": "kept", "0-1": "new", "0-2": [{"col": 1}]}}
+    ]
+    assert application.document["schema_version"] == "2025.07-1"
+
+
+@pytest.mark.django_db
+def test_application_answers_delta_starts_next_step(
+    api_client,
+    user,
+    application_factory,
+    questionnaire_factory,
+):
+    """Append the next step state when the delta targets one past the stored steps."""
+    application = application_factory(owner=user, questionnaire=_two_step_questionnaire(questionnaire_factory))
+
+    api_client.force_authenticate(user=user)
+    response = api_client.patch(
+        f"/api/applications/{application.key}/answers",
+        {"step": 1, "answers": {"0-0": False}, "active_step": 1},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    application.refresh_from_db()
+    assert application.document["active_step"] == 1
+    assert application.document["steps"][1] == {"is_valid": None, "answers": {"0-0": False}}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "payload, message",
+    [
+        ({"step": 0, "answers": {"bad-key": "x"}}, "Invalid answers"),
+        ({"step": 0, "answers": {"0-0": {"nested": "object"}}}, "Invalid answers"),
+        ({"step": 1, "answers": {"0-0": "x"}}, "out of range"),
+        ({"step": 0}, "At least one of"),
+    ],
+)
+def test_application_answers_delta_rejects_invalid_payloads(
+    api_client,
+    user,
+    application_factory,
+    payload,
+    message,
+):
+    """Validate the delta against the answers schema and questionnaire step bounds."""
+    application = application_factory(owner=user)
+
+    api_client.force_authenticate(user=user)
+    response = api_client.patch(f"/api/applications/{application.key}/answers", payload, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert message in str(response.data)
+    application.refresh_from_db()
+    assert application.document["steps"] == [{"is_valid": None, "answers": {}}]
+
+
+@pytest.mark.django_db
+def test_application_answers_delta_rejects_submitted_applications(api_client, user, application_factory):
+    """Keep submitted answers immutable on the delta endpoint too."""
+    application = application_factory(owner=user, status=ApplicationStatus.SUBMITTED)
+
+    api_client.force_authenticate(user=user)
+    response = api_client.patch(
+        f"/api/applications/{application.key}/answers",
+        {"step": 0, "answers": {"0-0": "x"}},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Cannot modify document" in str(response.data)
+
+
+@pytest.mark.django_db
+@pytest.mark.security
+def test_application_answers_delta_is_owner_scoped(api_client, user, other_user, application_factory):
+    """Hide other users' applications from the delta endpoint."""
+    application = application_factory(owner=other_user)
+
+    api_client.force_authenticate(user=user)
+    response = api_client.patch(
+        f"/api/applications/{application.key}/answers",
+        {"step": 0, "answers": {"0-0": "x"}},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
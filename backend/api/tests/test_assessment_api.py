@@ -1,9 +1,12 @@
 """API tests for assessor queue list/retrieve/update endpoints."""
 
+from datetime import timedelta
+
 import pytest
+from django.utils import timezone
 from rest_framework import status
 
-from applications.models import ApplicationStatus
+from applications.models import ApplicationStatus, PdfRenderJobStatus
 
 
 pytestmark = [pytest.mark.api]
@@ -290,3 +293,188 @@ def test_assessment_patch_non_status_fields_are_not_persisted(
     assert response.status_code == status.HTTP_200_OK
     assert application.status == ApplicationStatus.UNDER_REVIEW
     assert application.document == original_document
+
+
+@pytest.mark.django_db
+def test_assessment_status_change_queues_pdf_rerender(
+    api_client,
+    assessor_user,
+    assessor_group,
+    process_factory,
+    questionnaire_factory,
+    application_factory,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    """Re-render the PDF in the background after an assessor changes the status."""
+    settings.PDF_PRERENDER_ON_STATUS_CHANGE = True
+    process = process_factory(slug="rerender-process")
+    process.assessor_groups.add(assessor_group)
+    application = application_factory(
+        questionnaire=questionnaire_factory(process=process),
+        status=ApplicationStatus.SUBMITTED,
+    )
+
+    api_client.force_authenticate(user=assessor_user)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.patch(
+            f"/api/assessment/{application.key}",
+            {"status": ApplicationStatus.UNDER_REVIEW},
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert list(application.pdf_jobs.values_list("status", flat=True)) == [PdfRenderJobStatus.QUEUED]
+
+
+@pytest.fixture
+def review_queue(assessor_group, process_factory, questionnaire_factory, application_factory):
+    """Create a reviewable queue of five submissions, including a tie and a legacy NULL."""
+    process = process_factory(slug="queue")
+    process.assessor_groups.add(assessor_group)
+    questionnaire = questionnaire_factory(process=process)
+    base = timezone.now()
+
+    submitted_at = [base, base + timedelta(hours=1), base + timedelta(hours=1), None, base - timedelta(days=1)]
+    return [
+        application_factory(
+            questionnaire=questionnaire,
+            status=ApplicationStatus.SUBMITTED,
+            submitted_at=value,
+        )
+        for value in submitted_at
+    ]
+
+
+def _walk_pages(api_client, url):
+    """Follow ``next`` links and return the keys of every page."""
+    pages = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append([row["key"] for row in response.data["results"]])
+        url = response.data["next"]
+    return pages
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["submitted_at", "-submitted_at"])
+def test_assessment_list_cursor_pagination_walks_queue_in_keyset_order(
+    api_client,
+    assessor_user,
+    review_queue,
+    ordering,
+):
+    """Page through the queue on (submitted_at, id) without gaps or duplicates."""
+    oldest, mid, tie, legacy, older = review_queue
+    # NULL submitted_at sorts last ascending and first descending.
+    expected = [older, oldest, mid, tie, legacy]
+    if ordering.startswith("-"):
+        expected.reverse()
+
+    api_client.force_authenticate(user=assessor_user)
+    pages = _walk_pages(api_client, f"/api/assessment?page_size=2&ordering={ordering}")
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert sum(pages, []) == [str(application.key) for application in expected]
+
+
+@pytest.mark.django_db
+def test_assessment_list_defaults_to_newest_first(api_client, assessor_user, review_queue):
+    """Keep the pre-pagination newest-first order when no ordering is given."""
+    api_client.force_authenticate(user=assessor_user)
+
+    default = api_client.get("/api/assessment?page_size=10").data["results"]
+    newest = api_client.get("/api/assessment?page_size=10&ordering=-submitted_at").data["results"]
+
+    assert [row["key"] for row in default] == [row["key"] for row in newest]
+
+
+@pytest.mark.django_db
+def test_assessment_list_filters_by_status_process_and_questionnaire(
+    api_client,
+    assessor_user,
+    assessor_group,
+    process_factory,
+    questionnaire_factory,
+    application_factory,
+):
+    """Narrow the queue with status, process_slug and questionnaire_code filters."""
+    first = process_factory(slug="first")
+    second = process_factory(slug="second")
+    first.assessor_groups.add(assessor_group)
+    second.assessor_groups.add(assessor_group)
+    first_form = questionnaire_factory(process=first, code="first-form")
+
+    match = application_factory(questionnaire=first_form, status=ApplicationStatus.UNDER_REVIEW)
+    application_factory(questionnaire=first_form, status=ApplicationStatus.SUBMITTED)
+    application_factory(questionnaire=questionnaire_factory(process=second), status=ApplicationStatus.UNDER_REVIEW)
+
+    api_client.force_authenticate(user=assessor_user)
+    response = api_client.get(
+        "/api/assessment?status=UNDER_REVIEW,ACTION_REQUIRED&process_slug=first&questionnaire_code=first-form"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [row["key"] for row in response.data] == [str(match.key)]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query",
+    ["ordering=created_at", "status=NOT_A_STATUS", "page_size=0"],
+)
+def test_assessment_list_rejects_invalid_query_params(api_client, assessor_user, query):
+    """Reject unsupported ordering, statuses and page sizes."""
+    api_client.force_authenticate(user=assessor_user)
+
+    response = api_client.get(f"/api/assessment?{query}")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_assessment_list_rejects_cursor_from_another_ordering(api_client, assessor_user, review_queue):
+    """Treat a cursor reused with a different ordering as invalid."""
+    api_client.force_authenticate(user=assessor_user)
+    next_url = api_client.get("/api/assessment?page_size=2").data["next"]
+    cursor = next_url.split("cursor=")[1]
+
+    response = api_client.get(f"/api/assessment?cursor={cursor}&ordering=submitted_at")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_assessment_list_filters_by_search_query(
+    api_client,
+    assessor_user,
+    assessor_group,
+    process_factory,
+    questionnaire_factory,
+    application_factory,
+):
+    """Narrow the queue to applications whose answers match ``q``."""
+    process = process_factory()
+    process.assessor_groups.add(assessor_group)
+    questionnaire = questionnaire_factory(process=process)
+
+    def _submitted(answer):
+        return application_factory(
+            questionnaire=questionnaire,
+            status=ApplicationStatus.SUBMITTED,
+            document={
+                "schema_version": "2025.07-1",
+                "active_step": 0,
+                "steps": [{"is_valid": True, "answers": {"0-0": answer}}],
+            },
+        )
+
+    match = _submitted("Trapping near Shark Bay")
+    _submitted("Trapping near Esperance")
+    api_client.force_authenticate(user=assessor_user)
+
+    response = api_client.get("/api/assessment", {"q": "shark bay"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["key"] for item in response.data] == [str(match.key)]
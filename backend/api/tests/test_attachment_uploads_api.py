@@ -0,0 +1,194 @@
+"""API tests for resumable, chunked attachment uploads."""
+
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from storages.backends.azure_storage import AzureStorage
+
+from applications import uploads
+from applications.models import ApplicationAttachment, AttachmentUpload
+
+
+pytestmark = [pytest.mark.api, pytest.mark.django_db]
+
+CONTENT = b"%PDF-1.4\n" + b"0" * 100
+
+
+@pytest.fixture
+def start_upload(api_client, user, application_factory):
+    """Log in and return a function that starts an upload for a new application."""
+    api_client.force_authenticate(user=user)
+
+    def _start(application=None, **overrides):
+        application = application or application_factory(owner=user)
+        payload = {
+            "application_key": str(application.key),
+            "question": "0.0-0",
+            "name": "evidence.pdf",
+            "size": len(CONTENT),
+        }
+        payload.update(overrides)
+        return api_client.post("/api/attachment-uploads", payload, format="json")
+
+    return _start
+
+
+def _put_chunk(api_client, key, first, data, size=len(CONTENT)):
+    """PUT one chunk with its Content-Range header."""
+    return api_client.put(
+        f"/api/attachment-uploads/{key}",
+        data=data,
+        content_type="application/octet-stream",
+        headers={"Content-Range": f"bytes {first}-{first + len(data) - 1}/{size}"},
+    )
+
+
+def test_upload_in_chunks_then_finalise_creates_the_attachment(api_client, start_upload):
+    """Assemble the chunks in storage and create the attachment on finalise."""
+    started = start_upload()
+    key = started.data["key"]
+
+    assert started.status_code == status.HTTP_201_CREATED
+    assert started.data["offset"] == 0
+    assert _put_chunk(api_client, key, 0, CONTENT[:40]).data["offset"] == 40
+    assert _put_chunk(api_client, key, 40, CONTENT[40:]).data["offset"] == len(CONTENT)
+
+    response = api_client.post(f"/api/attachment-uploads/{key}/finalise")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    attachment = ApplicationAttachment.objects.get(key=response.data["key"])
+    assert attachment.name == "evidence.pdf"
+    assert attachment.file.read() == CONTENT
+    assert not AttachmentUpload.objects.exists()
+
+
+def test_upload_resumes_from_the_reported_offset(api_client, start_upload):
+    """Report the offset and reject chunks that do not start there."""
+    key = start_upload().data["key"]
+    _put_chunk(api_client, key, 0, CONTENT[:40])
+
+    progress = api_client.get(f"/api/attachment-uploads/{key}")
+    skipped = _put_chunk(api_client, key, 60, CONTENT[60:])
+
+    assert progress.data["offset"] == 40
+    assert skipped.status_code == status.HTTP_409_CONFLICT
+    assert skipped.data["offset"] == 40
+
+
+def test_upload_rejects_a_disallowed_type_from_the_first_chunk(api_client, start_upload):
+    """Check the magic bytes of the first chunk before storing anything."""
+    key = start_upload().data["key"]
+
+    response = _put_chunk(api_client, key, 0, b"MZ" + b"\0" * 60, size=len(CONTENT))
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert AttachmentUpload.objects.get(key=key).received == 0
+
+
+def test_upload_rejects_files_over_the_size_limit(start_upload, settings):
+    """Refuse to start uploads larger than UPLOAD_MAX_SIZE."""
+    response = start_upload(size=settings.UPLOAD_MAX_SIZE + 1)
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+@override_settings(ATTACHMENT_UPLOAD_CHUNK_SIZE=16)
+def test_upload_rejects_chunks_over_the_chunk_size(api_client, start_upload):
+    """Keep each request body within the advertised chunk size."""
+    key = start_upload().data["key"]
+
+    response = _put_chunk(api_client, key, 0, CONTENT[:40])
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_finalise_requires_every_byte(api_client, start_upload):
+    """Refuse to finalise an incomplete upload and report the offset."""
+    key = start_upload().data["key"]
+    _put_chunk(api_client, key, 0, CONTENT[:40])
+
+    response = api_client.post(f"/api/attachment-uploads/{key}/finalise")
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.data["offset"] == 40
+
+
+def test_finalise_enforces_file_max_attachments(
+    api_client, start_upload, application_factory, attachment_factory, user
+):
+    """Recheck the question's attachment limit when the upload completes."""
+    application = application_factory(owner=user)
+    key = start_upload(application=application).data["key"]
+    _put_chunk(api_client, key, 0, CONTENT)
+    # Another request filled the only slot while this upload was in flight.
+    attachment_factory(application=application, question="0.0-0")
+
+    response = api_client.post(f"/api/attachment-uploads/{key}/finalise")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "file" in response.data
+    assert AttachmentUpload.objects.filter(key=key).exists()
+
+
+@pytest.mark.security
+def test_uploads_are_private_to_the_application_owner(api_client, start_upload, other_user):
+    """Hide other users' uploads, including from chunk PUTs."""
+    key = start_upload().data["key"]
+    api_client.force_authenticate(user=other_user)
+
+    assert api_client.get(f"/api/attachment-uploads/{key}").status_code == status.HTTP_404_NOT_FOUND
+    assert _put_chunk(api_client, key, 0, CONTENT).status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_abandoning_an_upload_deletes_its_bytes(api_client, start_upload):
+    """Delete the session and the partially written file."""
+    key = start_upload().data["key"]
+    _put_chunk(api_client, key, 0, CONTENT[:40])
+    upload = AttachmentUpload.objects.get(key=key)
+    storage = ApplicationAttachment._meta.get_field("file").storage
+    assert storage.exists(upload.file_name)
+
+    response = api_client.delete(f"/api/attachment-uploads/{key}")
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert not storage.exists(upload.file_name)
+
+
+def test_purge_command_deletes_stale_uploads(api_client, start_upload):
+    """Purge uploads that have been idle for longer than the expiry."""
+    stale_key = start_upload().data["key"]
+    fresh_key = start_upload().data["key"]
+    AttachmentUpload.objects.filter(key=stale_key).update(
+        updated_at=timezone.now() - timedelta(hours=48)
+    )
+
+    call_command("purge_attachment_uploads", "--older-than", "24", stdout=mock.Mock())
+
+    assert [str(key) for key in AttachmentUpload.objects.values_list("key", flat=True)] == [fresh_key]
+
+
+@pytest.mark.unit
+def test_azure_chunks_are_staged_and_committed_as_blocks(application_factory):
+    """Stage each chunk as a block and commit them in order on finalise."""
+    storage = mock.MagicMock(spec=AzureStorage)
+    storage._get_valid_path.side_effect = lambda name: name
+    blob_client = storage.client.get_blob_client.return_value
+    upload = AttachmentUpload.objects.create(
+        application=application_factory(), question="0.0-0", name="evidence.pdf", size=6
+    )
+
+    with mock.patch.object(uploads, "_storage", return_value=storage):
+        uploads.write_chunk(upload, b"abc")
+        uploads.write_chunk(upload, b"def")
+        uploads.commit(upload)
+
+    block_ids = [call.args[0] for call in blob_client.stage_block.call_args_list]
+    committed = blob_client.commit_block_list.call_args.args[0]
+    assert len(set(block_ids)) == 2
+    assert [block.id for block in committed] == block_ids
+    assert upload.received == 6
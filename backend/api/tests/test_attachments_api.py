@@ -1,9 +1,16 @@
 """API tests for application attachment CRUD and access boundaries."""
 
+from unittest import mock
+
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
+from applications import serialisers as application_serialisers
+from applications.models import ApplicationAttachment
+
 
 pytestmark = [pytest.mark.api]
 
@@ -178,3 +185,160 @@ def test_attachment_patch_rejects_file_mutation(
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "name" in response.data
+
+
+@pytest.fixture
+def multi_file_application(application_factory, questionnaire_factory, user):
+    """Return an application whose question 0.0-0 accepts up to three files."""
+    questionnaire = questionnaire_factory()
+    question = questionnaire.document["steps"][0]["sections"][0]["questions"][0]
+    question.update(type="file", file_max_attachments=3)
+    questionnaire.save(update_fields=["document"])
+    return application_factory(owner=user, questionnaire=questionnaire)
+
+
+def _batch(api_client, application, files, **extra):
+    """POST a batch upload of ``files`` to question 0.0-0 of ``application``."""
+    return api_client.post(
+        "/api/attachments/batch",
+        {"application_key": str(application.key), "question": "0.0-0", "files": files, **extra},
+        format="multipart",
+    )
+
+
+@pytest.mark.django_db
+def test_attachment_batch_creates_every_file(api_client, user, multi_file_application):
+    """Attach all files of a batch, named after the uploads unless names are given."""
+    api_client.force_authenticate(user=user)
+
+    response = _batch(
+        api_client,
+        multi_file_application,
+        [_pdf_upload("a.pdf"), _pdf_upload("b.pdf")],
+        names=["First.pdf", "Second.pdf"],
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [item["name"] for item in response.data] == ["First.pdf", "Second.pdf"]
+    assert multi_file_application.attachments.count() == 2
+
+
+@pytest.mark.django_db
+def test_attachment_batch_counts_and_inserts_once(api_client, user, multi_file_application):
+    """Check the limit up front and under the lock, then insert once for the whole batch."""
+    api_client.force_authenticate(user=user)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = _batch(
+            api_client, multi_file_application, [_pdf_upload(f"{i}.pdf") for i in range(3)]
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    sql = [query["sql"] for query in queries.captured_queries]
+    assert sum("COUNT(" in statement for statement in sql) == 2
+    assert sum(statement.startswith("INSERT") for statement in sql) == 1
+
+
+@pytest.mark.django_db
+def test_attachment_batch_over_the_limit_attaches_nothing(
+    api_client, user, multi_file_application, attachment_factory
+):
+    """Reject the whole batch when it would exceed file_max_attachments."""
+    existing = attachment_factory(application=multi_file_application, question="0.0-0")
+    storage = ApplicationAttachment._meta.get_field("file").storage
+    api_client.force_authenticate(user=user)
+
+    with mock.patch.object(storage, "save", wraps=storage.save) as save:
+        response = _batch(
+            api_client, multi_file_application, [_pdf_upload("a.pdf"), _pdf_upload("b.pdf"), _pdf_upload("c.pdf")]
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "file" in response.data
+    assert multi_file_application.attachments.count() == 1
+    # The batch was rejected in validation, before any file was stored.
+    save.assert_not_called()
+    folder, stored_name = existing.file.name.rsplit("/", 1)
+    assert storage.listdir(folder)[1] == [stored_name]
+
+
+@pytest.mark.django_db
+def test_attachment_batch_rechecks_the_limit_under_the_lock(
+    api_client, user, multi_file_application, attachment_factory
+):
+    """Reject a batch that a concurrent upload pushed over the limit after validation."""
+    existing = attachment_factory(application=multi_file_application, question="0.0-0")
+    storage = ApplicationAttachment._meta.get_field("file").storage
+    api_client.force_authenticate(user=user)
+    real_reserve = application_serialisers.reserve_attachment_slots
+    calls = []
+
+    def _reserve(*args, **kwargs):
+        # The check in validate() passes; the locked re-check in create() is real.
+        calls.append(args)
+        if len(calls) > 1:
+            real_reserve(*args, **kwargs)
+
+    with mock.patch.object(application_serialisers, "reserve_attachment_slots", _reserve):
+        response = _batch(
+            api_client, multi_file_application, [_pdf_upload("a.pdf"), _pdf_upload("b.pdf"), _pdf_upload("c.pdf")]
+        )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert multi_file_application.attachments.count() == 1
+    # The files stored before the locked check were removed from storage again.
+    folder, stored_name = existing.file.name.rsplit("/", 1)
+    assert storage.listdir(folder)[1] == [stored_name]
+
+
+@pytest.mark.django_db
+def test_attachment_batch_rejects_a_disallowed_file(api_client, user, multi_file_application):
+    """Validate every file before any is stored."""
+    api_client.force_authenticate(user=user)
+    executable = SimpleUploadedFile("run.exe", b"MZ" + b"\0" * 60, content_type="application/octet-stream")
+
+    response = _batch(api_client, multi_file_application, [_pdf_upload(), executable])
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not multi_file_application.attachments.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.security
+def test_attachment_batch_rejects_application_not_owned_by_user(
+    api_client, user, other_user, application_factory
+):
+    """Block batch uploads to another user's application."""
+    api_client.force_authenticate(user=user)
+
+    response = _batch(api_client, application_factory(owner=other_user), [_pdf_upload()])
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "application_key" in response.data
+
+
+@pytest.mark.django_db
+def test_attachment_create_does_not_load_the_questionnaire_document(
+    api_client, user, multi_file_application
+):
+    """Look questions up in the compiled questionnaire rather than the document JSON."""
+    api_client.force_authenticate(user=user)
+    _batch(api_client, multi_file_application, [_pdf_upload("warm.pdf")])
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.post(
+            "/api/attachments",
+            {
+                "application_key": str(multi_file_application.key),
+                "question": "0.0-0",
+                "name": "Evidence.pdf",
+                "file": _pdf_upload("evidence.pdf"),
+            },
+            format="multipart",
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert not any(
+        '"questionnaires_questionnaire"."document"' in query["sql"]
+        for query in queries.captured_queries
+    )
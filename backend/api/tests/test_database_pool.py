@@ -0,0 +1,88 @@
+"""Tests for database connection reuse settings and pool metrics."""
+
+import os
+
+import environ
+import pytest
+from rest_framework import status
+
+from config import database
+from config.database import configure_connection_reuse, get_pool_stats
+
+
+POSTGRESQL = {"ENGINE": "django.db.backends.postgresql", "NAME": "authorisations"}
+
+
+@pytest.mark.unit
+def test_postgresql_uses_a_connection_pool_by_default(monkeypatch):
+    """Pool connections, with env overrides, and leave persistence to the pool."""
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "8")
+
+    configured = configure_connection_reuse(dict(POSTGRESQL), environ.Env())
+
+    assert configured["CONN_MAX_AGE"] == 0
+    assert configured["CONN_HEALTH_CHECKS"] is True
+    assert configured["OPTIONS"]["pool"]["max_size"] == 8
+    assert configured["OPTIONS"]["pool"]["min_size"] == 1
+
+
+@pytest.mark.unit
+def test_postgresql_without_pool_keeps_persistent_connections(monkeypatch):
+    """Fall back to CONN_MAX_AGE persistent connections when pooling is disabled."""
+    monkeypatch.setenv("DB_POOL", "False")
+    monkeypatch.setenv("CONN_MAX_AGE", "120")
+    monkeypatch.setenv("CONN_HEALTH_CHECKS", "False")
+
+    configured = configure_connection_reuse(dict(POSTGRESQL), environ.Env())
+
+    assert configured["CONN_MAX_AGE"] == 120
+    assert configured["CONN_HEALTH_CHECKS"] is False
+    assert "pool" not in configured.get("OPTIONS", {})
+
+
+@pytest.mark.unit
+def test_other_engines_are_left_unchanged():
+    """Leave SQLite (tests, local tooling) exactly as parsed from the URL."""
+    sqlite = {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+
+    assert configure_connection_reuse(dict(sqlite), environ.Env()) == sqlite
+
+
+@pytest.mark.unit
+def test_pool_stats_report_only_pooled_connections(monkeypatch):
+    """Collect psycopg pool counters per alias, skipping unpooled databases."""
+
+    class FakePool:
+        def get_stats(self):
+            return {"pool_size": 2, "pool_available": 1, "requests_num": 10}
+
+    class FakeConnection:
+        def __init__(self, pool):
+            self.pool = pool
+
+    monkeypatch.setattr(
+        database,
+        "connections",
+        {"default": FakeConnection(FakePool()), "replica": FakeConnection(None)},
+    )
+
+    assert get_pool_stats() == {
+        "pid": os.getpid(),
+        "pools": {"default": {"pool_size": 2, "pool_available": 1, "requests_num": 10}},
+    }
+
+
+@pytest.mark.api
+@pytest.mark.django_db
+def test_pool_stats_endpoint_is_restricted_to_staff(api_client, user, admin_user):
+    """Hide worker internals from applicants and expose them to staff."""
+    url = "/api/metrics/db-pool"
+
+    api_client.force_authenticate(user=user)
+    assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
+
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    # The test database is SQLite, which has no pool.
+    assert response.data == {"pid": os.getpid(), "pools": {}}
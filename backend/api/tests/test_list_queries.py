@@ -0,0 +1,93 @@
+"""Query regression tests for application list endpoints.
+
+Guards that list responses neither select the answers/questionnaire JSONB
+documents nor lazily load them per row.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from applications.models import ApplicationStatus
+
+
+pytestmark = [pytest.mark.api, pytest.mark.django_db]
+
+DOCUMENT_COLUMNS = (
+    '"applications_application"."document"',
+    '"questionnaires_questionnaire"."document"',
+)
+
+
+@pytest.fixture
+def list_setup(
+    user,
+    assessor_user,
+    assessor_group,
+    process_factory,
+    questionnaire_factory,
+    application_factory,
+):
+    """Return (user, url, factory) per list endpoint; rows carry a large answers document."""
+    process = process_factory()
+    process.assessor_groups.add(assessor_group)
+    questionnaire = questionnaire_factory(process=process)
+    large_document = {
+        "schema_version": "2025.07-1",
+        "active_step": 0,
+        "steps": [{"is_valid": True, "answers": {f"0-{i}": "x" * 200 for i in range(50)}}],
+    }
+
+    def _create():
+        return application_factory(
+            owner=user,
+            questionnaire=questionnaire,
+            status=ApplicationStatus.SUBMITTED,
+            document=large_document,
+        )
+
+    return {
+        "applications": (user, "/api/applications", _create),
+        "assessment": (assessor_user, "/api/assessment", _create),
+    }
+
+
+def _list(api_client, url):
+    """GET the list endpoint and return (response, captured SQL statements)."""
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    return response, [query["sql"] for query in queries]
+
+
+@pytest.mark.parametrize("endpoint", ["applications", "assessment"])
+def test_list_query_count_does_not_grow_with_rows(api_client, list_setup, endpoint):
+    """Serialise any number of rows without per-row (deferred field) queries."""
+    user, url, create = list_setup[endpoint]
+    api_client.force_authenticate(user=user)
+
+    # Warm the reviewer access cache so both measured requests hit it.
+    _list(api_client, url)
+    create()
+    _, single = _list(api_client, url)
+    for _ in range(4):
+        create()
+    response, many = _list(api_client, url)
+
+    assert len(response.data) == 5
+    assert len(many) == len(single)
+
+
+@pytest.mark.parametrize("endpoint", ["applications", "assessment"])
+def test_list_does_not_select_document_columns(api_client, list_setup, endpoint):
+    """Keep both JSONB documents out of the SQL (bytes read from the database)."""
+    user, url, create = list_setup[endpoint]
+    api_client.force_authenticate(user=user)
+    application = create()
+
+    response, statements = _list(api_client, url)
+
+    assert all(column not in sql for sql in statements for column in DOCUMENT_COLUMNS)
+    # The multi-kilobyte answers never reach the response either.
+    assert len(response.content) < len(str(application.document))
@@ -0,0 +1,279 @@
+"""API tests for bulk PDF exports from the assessment queue and the admin."""
+
+import threading
+import time
+import zipfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.messages import get_messages
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import AsyncClient
+from django.utils import timezone
+from rest_framework import status
+
+from applications import models as application_models
+from applications.models import ApplicationStatus, PdfExportJob, PdfRenderJobStatus
+from applications.pdf_cache import get_cached_pdf
+
+
+pytestmark = [pytest.mark.api]
+
+
+@pytest.fixture
+def fake_converter(monkeypatch):
+    """Replace Prince with fixed bytes (failing on "BROKEN" HTML) and record the converting threads."""
+    threads = []
+
+    def _fake_convert(html, base_url=None):
+        if "BROKEN" in html:
+            raise RuntimeError("prince exploded")
+        threads.append(threading.get_ident())
+        return b"%PDF-1.4 export"
+
+    monkeypatch.setattr(application_models, "convert_html_to_pdf", _fake_convert)
+    return threads
+
+
+@pytest.fixture
+def queue(assessor_group, process_factory, questionnaire_factory, application_factory, other_user):
+    """Return three applications in the assessor's queue, one of them under assessment."""
+    process = process_factory()
+    process.assessor_groups.add(assessor_group)
+    questionnaire = questionnaire_factory(process=process)
+    return [
+        application_factory(owner=other_user, questionnaire=questionnaire, status=application_status)
+        for application_status in (
+            ApplicationStatus.SUBMITTED,
+            ApplicationStatus.SUBMITTED,
+            ApplicationStatus.UNDER_ASSESSMENT,
+        )
+    ]
+
+
+def _run_worker():
+    """Drain the queues once and return the command output."""
+    out = StringIO()
+    call_command("run_pdf_worker", "--once", stdout=out)
+    return out.getvalue()
+
+
+def _archive(response):
+    """Return the ZIP archive served by a download response."""
+    return zipfile.ZipFile(BytesIO(b"".join(response.streaming_content)))
+
+
+@pytest.mark.django_db
+def test_export_lifecycle_queue_poll_and_download(api_client, assessor_user, queue, fake_converter):
+    """Queue an export of selected keys, poll its progress to DONE and download the ZIP."""
+    api_client.force_authenticate(user=assessor_user)
+    keys = [str(application.key) for application in queue[:2]]
+
+    response = api_client.post("/api/assessment/export", {"keys": keys}, format="json")
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert (response.data["status"], response.data["total"]) == (PdfRenderJobStatus.QUEUED, 2)
+    job_key = response.data["key"]
+
+    assert api_client.get(f"/api/pdf-exports/{job_key}/download").status_code == status.HTTP_409_CONFLICT
+
+    assert "PDF export" in _run_worker()
+
+    polled = api_client.get(f"/api/pdf-exports/{job_key}")
+    assert polled.data["status"] == PdfRenderJobStatus.DONE
+    assert (polled.data["completed"], polled.data["failed"]) == (2, 0)
+
+    download = api_client.get(f"/api/pdf-exports/{job_key}/download")
+    assert download.status_code == status.HTTP_200_OK
+    assert download["Content-Type"] == "application/zip"
+    names = _archive(download).namelist()
+    assert sorted(names) == sorted(f"{a.internal_id.replace('/', '_')}.pdf" for a in queue[:2])
+
+    # Rendered PDFs land in the PDF cache, so single downloads reuse them.
+    assert get_cached_pdf(queue[0]) is not None
+    assert len(fake_converter) == 2
+
+
+@pytest.mark.django_db
+def test_export_of_the_filtered_queue_reuses_cached_pdfs(
+    api_client, assessor_user, queue, fake_converter, settings
+):
+    """Export every application matching the queue filters, rendering only uncached ones."""
+    settings.PDF_EXPORT_CONCURRENCY = 2
+    api_client.force_authenticate(user=assessor_user)
+    application_models.store_pdf(queue[0], b"%PDF-1.4 cached")
+
+    response = api_client.post("/api/assessment/export?status=SUBMITTED", {}, format="json")
+    assert response.data["total"] == 2
+    _run_worker()
+
+    download = api_client.get(f"/api/pdf-exports/{response.data['key']}/download")
+    archive = _archive(download)
+    assert archive.read(PdfExportJob.archive_name(queue[0])) == b"%PDF-1.4 cached"
+    assert archive.read(PdfExportJob.archive_name(queue[1])) == b"%PDF-1.4 export"
+    # Only the uncached application went to Prince, on a pool thread.
+    assert len(fake_converter) == 1
+    assert fake_converter[0] != threading.get_ident()
+
+
+@pytest.mark.django_db
+def test_export_runs_no_more_conversions_than_warm_renderers(assessor_user, queue, monkeypatch, settings):
+    """Cap the export threads at PRINCE_POOL_SIZE so none fails waiting for a renderer."""
+    settings.PRINCE_POOL_SIZE = 1
+    settings.PDF_EXPORT_CONCURRENCY = 4
+    renderer = threading.BoundedSemaphore(settings.PRINCE_POOL_SIZE)
+
+    def _slow_convert(html, base_url=None):
+        # Stands in for a pool of one renderer whose queue timeout has run out.
+        if not renderer.acquire(blocking=False):
+            raise RuntimeError("no Prince renderer became free")
+        try:
+            time.sleep(0.05)
+            return b"%PDF-1.4 export"
+        finally:
+            renderer.release()
+
+    monkeypatch.setattr(application_models, "convert_html_to_pdf", _slow_convert)
+    job = PdfExportJob.objects.enqueue(queue, requested_by=assessor_user)
+
+    _run_worker()
+
+    job.refresh_from_db()
+    assert job.status == PdfRenderJobStatus.DONE
+    assert (job.completed, job.failed) == (3, 0)
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_export_download_streams_asynchronously_under_asgi(assessor_user, queue, fake_converter):
+    """Read the ZIP archive off the event loop under ASGI."""
+    job = PdfExportJob.objects.enqueue(queue[:1], requested_by=assessor_user)
+    _run_worker()
+    client = AsyncClient()
+    client.force_login(assessor_user)
+
+    async def _download():
+        response = await client.get(f"/api/pdf-exports/{job.key}/download")
+        return response, b"".join([chunk async for chunk in response.streaming_content])
+
+    response, content = async_to_sync(_download)()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.is_async
+    assert zipfile.ZipFile(BytesIO(content)).namelist() == [PdfExportJob.archive_name(queue[0])]
+
+
+@pytest.mark.django_db
+def test_expired_exports_are_purged_with_their_archives(
+    api_client, assessor_user, queue, fake_converter, django_capture_on_commit_callbacks
+):
+    """Delete exports finished before the expiry, and their archives, but nothing pending."""
+    expired = PdfExportJob.objects.enqueue(queue[:1], requested_by=assessor_user)
+    recent = PdfExportJob.objects.enqueue(queue[1:2], requested_by=assessor_user)
+    _run_worker()
+    pending = PdfExportJob.objects.enqueue(queue[2:], requested_by=assessor_user)
+    expired.refresh_from_db()
+    PdfExportJob.objects.filter(pk=expired.pk).update(finished_at=timezone.now() - timedelta(hours=73))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("purge_pdf_exports", stdout=StringIO())
+
+    assert set(PdfExportJob.objects.values_list("pk", flat=True)) == {recent.pk, pending.pk}
+    assert not default_storage.exists(expired.file_name)
+    api_client.force_authenticate(user=assessor_user)
+    download = api_client.get(f"/api/pdf-exports/{expired.key}/download")
+    assert download.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_deleting_an_export_deletes_its_archive(
+    assessor_user, queue, fake_converter, django_capture_on_commit_callbacks
+):
+    """Remove the stored ZIP once the job row's deletion commits."""
+    job = PdfExportJob.objects.enqueue(queue[:1], requested_by=assessor_user)
+    _run_worker()
+    job.refresh_from_db()
+    assert default_storage.exists(job.file_name)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        job.delete()
+
+    assert not default_storage.exists(job.file_name)
+
+
+@pytest.mark.django_db
+def test_export_lists_applications_that_failed_to_render(queue, assessor_user, monkeypatch, fake_converter):
+    """Keep exporting past a broken application and list it in errors.txt."""
+    original = application_models.Application.render_pdf_html
+
+    def _render(self):
+        return "BROKEN" if self.pk == queue[1].pk else original(self)
+
+    monkeypatch.setattr(application_models.Application, "render_pdf_html", _render)
+    job = PdfExportJob.objects.enqueue(queue, requested_by=assessor_user)
+
+    _run_worker()
+    job.refresh_from_db()
+
+    assert job.status == PdfRenderJobStatus.DONE
+    assert (job.total, job.completed, job.failed) == (3, 2, 1)
+    with job.open_archive() as stored:
+        errors = zipfile.ZipFile(stored).read("errors.txt").decode()
+    assert errors == f"{queue[1].internal_id}: prince exploded\n"
+
+
+@pytest.mark.django_db
+@pytest.mark.security
+def test_export_is_limited_to_the_users_queue_and_own_jobs(
+    api_client, user, assessor_user, queue, application_factory
+):
+    """Reject keys outside the assessment queue and hide other users' exports."""
+    api_client.force_authenticate(user=assessor_user)
+    foreign = application_factory(status=ApplicationStatus.SUBMITTED)
+
+    response = api_client.post(
+        "/api/assessment/export",
+        {"keys": [str(queue[0].key), str(foreign.key)]},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "keys" in response.data
+    assert PdfExportJob.objects.count() == 0
+
+    job = PdfExportJob.objects.enqueue(queue, requested_by=assessor_user)
+    api_client.force_authenticate(user=user)
+    assert api_client.get(f"/api/pdf-exports/{job.key}").status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_export_rejects_oversized_and_empty_selections(api_client, assessor_user, queue, settings):
+    """Cap the number of applications per export and refuse empty ones."""
+    settings.PDF_EXPORT_MAX_APPLICATIONS = 2
+    api_client.force_authenticate(user=assessor_user)
+
+    oversized = api_client.post("/api/assessment/export", {}, format="json")
+    empty = api_client.post("/api/assessment/export?status=APPROVED", {}, format="json")
+
+    assert oversized.status_code == status.HTTP_400_BAD_REQUEST
+    assert empty.status_code == status.HTTP_400_BAD_REQUEST
+    assert PdfExportJob.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_admin_action_queues_an_export(client, admin_user, queue):
+    """Queue an export of the selected applications from the admin changelist."""
+    client.force_login(admin_user)
+
+    response = client.post(
+        "/admin/applications/application/",
+        {"action": "export_pdfs", "_selected_action": [application.pk for application in queue]},
+    )
+
+    job = PdfExportJob.objects.get()
+    assert job.requested_by == admin_user
+    assert set(job.applications.values_list("pk", flat=True)) == {application.pk for application in queue}
+    assert response.status_code == 302
+    [message] = get_messages(response.wsgi_request)
+    assert f"/api/pdf-exports/{job.key}" in str(message)
@@ -0,0 +1,185 @@
+"""API tests for background PDF render jobs and the worker command."""
+
+from datetime import timedelta
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+
+from applications.models import Application, ApplicationStatus, PdfRenderJob, PdfRenderJobStatus
+
+
+pytestmark = [pytest.mark.api]
+
+
+@pytest.fixture
+def fake_renderer(monkeypatch):
+    """Replace Prince with deterministic bytes and count renders."""
+    calls = []
+
+    def _fake_generate_pdf(self, request=None):
+        calls.append(self.pk)
+        return BytesIO(b"%PDF-1.4 job")
+
+    monkeypatch.setattr(Application, "generate_pdf", _fake_generate_pdf)
+    return calls
+
+
+def _run_worker():
+    """Drain the queue once and return the command output."""
+    out = StringIO()
+    call_command("run_pdf_worker", "--once", stdout=out)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+def test_pdf_job_lifecycle_queue_poll_and_download(api_client, user, application_factory, fake_renderer):
+    """Queue a render, poll it to DONE after the worker runs, then download the PDF."""
+    application = application_factory(status=ApplicationStatus.SUBMITTED)
+    api_client.force_authenticate(user=user)
+
+    response = api_client.post("/api/pdf-jobs", {"application_key": str(application.key)}, format="json")
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data["status"] == PdfRenderJobStatus.QUEUED
+    job_key = response.data["key"]
+
+    pending = api_client.get(f"/api/pdf-jobs/{job_key}/download")
+    assert pending.status_code == status.HTTP_409_CONFLICT
+
+    assert "attempt 1" in _run_worker()
+
+    polled = api_client.get(f"/api/pdf-jobs/{job_key}")
+    assert polled.data["status"] == PdfRenderJobStatus.DONE
+    assert polled.data["download_url"].endswith(f"/api/pdf-jobs/{job_key}/download")
+
+    download = api_client.get(f"/api/pdf-jobs/{job_key}/download")
+    assert download.status_code == status.HTTP_200_OK
+    assert b"".join(download.streaming_content) == b"%PDF-1.4 job"
+    assert fake_renderer == [application.pk]
+
+
+@pytest.mark.django_db
+def test_pdf_job_reuses_pending_job_and_short_circuits_cache_hits(
+    api_client,
+    user,
+    application_factory,
+    fake_renderer,
+):
+    """Return the pending job for repeat requests and finish instantly on a cache hit."""
+    application = application_factory(status=ApplicationStatus.SUBMITTED)
+    api_client.force_authenticate(user=user)
+    payload = {"application_key": str(application.key)}
+
+    first = api_client.post("/api/pdf-jobs", payload, format="json")
+    second = api_client.post("/api/pdf-jobs", payload, format="json")
+    assert first.data["key"] == second.data["key"]
+
+    _run_worker()
+
+    cached = api_client.post("/api/pdf-jobs", payload, format="json")
+    assert cached.data["key"] != first.data["key"]
+    assert cached.data["status"] == PdfRenderJobStatus.DONE
+    assert fake_renderer == [application.pk]
+
+
+@pytest.mark.django_db
+def test_pdf_job_rejects_drafts(api_client, user, application_factory):
+    """Keep drafts on the synchronous path because their PDFs are never cached."""
+    application = application_factory(status=ApplicationStatus.DRAFT)
+    api_client.force_authenticate(user=user)
+
+    response = api_client.post("/api/pdf-jobs", {"application_key": str(application.key)}, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "application_key" in response.data
+
+
+@pytest.mark.django_db
+@pytest.mark.security
+def test_pdf_jobs_are_hidden_from_users_without_read_access(
+    api_client,
+    user,
+    other_user,
+    application_factory,
+):
+    """Treat foreign applications and their jobs as not found."""
+    application = application_factory(owner=other_user, status=ApplicationStatus.SUBMITTED)
+    job = PdfRenderJob.objects.enqueue(application, requested_by=other_user)
+    api_client.force_authenticate(user=user)
+
+    create = api_client.post("/api/pdf-jobs", {"application_key": str(application.key)}, format="json")
+    retrieve = api_client.get(f"/api/pdf-jobs/{job.key}")
+
+    assert create.status_code == status.HTTP_400_BAD_REQUEST
+    assert retrieve.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_pdf_job_is_visible_to_process_reviewers(
+    api_client,
+    assessor_user,
+    assessor_group,
+    other_user,
+    process_factory,
+    questionnaire_factory,
+    application_factory,
+):
+    """Let reviewers of the application's process queue and poll renders."""
+    process = process_factory()
+    process.assessor_groups.add(assessor_group)
+    application = application_factory(
+        owner=other_user,
+        questionnaire=questionnaire_factory(process=process),
+        status=ApplicationStatus.SUBMITTED,
+    )
+    api_client.force_authenticate(user=assessor_user)
+
+    response = api_client.post("/api/pdf-jobs", {"application_key": str(application.key)}, format="json")
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert api_client.get(f"/api/pdf-jobs/{response.data['key']}").status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_worker_requeues_failures_until_max_attempts(application_factory, monkeypatch, settings):
+    """Retry failing renders and mark them FAILED once attempts are exhausted."""
+    settings.PDF_JOB_MAX_ATTEMPTS = 2
+
+    def _broken_generate_pdf(self, request=None):
+        raise RuntimeError("prince exploded")
+
+    monkeypatch.setattr(Application, "generate_pdf", _broken_generate_pdf)
+    job = PdfRenderJob.objects.enqueue(application_factory(status=ApplicationStatus.SUBMITTED))
+
+    _run_worker()
+    job.refresh_from_db()
+
+    assert job.status == PdfRenderJobStatus.FAILED
+    assert job.attempts == 2
+    assert job.error == "prince exploded"
+
+
+@pytest.mark.django_db
+def test_stale_jobs_are_reclaimed_until_max_attempts(application_factory, settings):
+    """Reclaim jobs abandoned by a dead worker, then give up on ones that keep killing it."""
+    settings.PDF_JOB_MAX_ATTEMPTS = 2
+    stale = timezone.now() - timedelta(seconds=settings.PDF_JOB_STALE_AFTER + 1)
+    retry = PdfRenderJob.objects.enqueue(application_factory(status=ApplicationStatus.SUBMITTED))
+    exhausted = PdfRenderJob.objects.enqueue(application_factory(status=ApplicationStatus.SUBMITTED))
+    PdfRenderJob.objects.filter(pk=retry.pk).update(
+        status=PdfRenderJobStatus.RUNNING, started_at=stale, attempts=1
+    )
+    PdfRenderJob.objects.filter(pk=exhausted.pk).update(
+        status=PdfRenderJobStatus.RUNNING, started_at=stale, attempts=2
+    )
+
+    claimed = PdfRenderJob.objects.claim_next(stale_after=settings.PDF_JOB_STALE_AFTER, max_attempts=2)
+
+    assert claimed.pk == retry.pk
+    assert claimed.attempts == 2
+    exhausted.refresh_from_db()
+    assert exhausted.status == PdfRenderJobStatus.FAILED
+    assert exhausted.finished_at is not None
+    assert PdfRenderJob.objects.claim_next(stale_after=settings.PDF_JOB_STALE_AFTER, max_attempts=2) is None
@@ -75,3 +75,36 @@ def test_processes_retrieve_unknown_slug_returns_404(api_client, user):
     response = api_client.get("/api/processes/missing-proc")
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_processes_list_is_cached_and_invalidated_by_admin_save(
+    api_client,
+    user,
+    admin_user,
+    process_factory,
+    rf,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """Serve the process list from the cache until an admin save commits."""
+    from django.contrib import admin
+
+    from processes.admin import AuthorisationProcessAdmin
+
+    process = process_factory(name="Before")
+    api_client.force_authenticate(user=user)
+    api_client.get("/api/processes")
+
+    # Both the rows and the user's reviewer access come from the cache.
+    with django_assert_num_queries(0):
+        cached = api_client.get("/api/processes")
+    assert cached.data[0]["name"] == "Before"
+
+    process.name = "After"
+    request = rf.post("/admin/")
+    request.user = admin_user
+    with django_capture_on_commit_callbacks(execute=True):
+        AuthorisationProcessAdmin(type(process), admin.site).save_model(request, process, None, True)
+
+    assert api_client.get("/api/processes").data[0]["name"] == "After"
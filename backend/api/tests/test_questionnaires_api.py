@@ -134,3 +134,114 @@ def test_questionnaires_retrieve_unknown_id_returns_404(api_client, user):
     response = api_client.get("/api/questionnaires/999999")
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_questionnaires_list_is_cached_and_invalidated_by_admin_save(
+    api_client,
+    user,
+    admin_user,
+    process_factory,
+    questionnaire_factory,
+    rf,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    """Serve the questionnaire list from the cache until an admin save commits."""
+    from django.contrib import admin
+
+    from questionnaires.admin import QuestionnaireAdmin
+    from questionnaires.models import Questionnaire
+
+    process = process_factory()
+    questionnaire_factory(process=process, code="first")
+    api_client.force_authenticate(user=user)
+    api_client.get("/api/questionnaires")
+
+    with django_assert_num_queries(0):
+        assert len(api_client.get("/api/questionnaires").data) == 1
+
+    added = Questionnaire(
+        process=process,
+        code="second",
+        name="Second",
+        description="Second",
+        version=1,
+        document=Questionnaire.objects.get(code="first").document,
+    )
+    request = rf.post("/admin/")
+    request.user = admin_user
+    with django_capture_on_commit_callbacks(execute=True):
+        QuestionnaireAdmin(Questionnaire, admin.site).save_model(request, added, None, False)
+
+    assert len(api_client.get("/api/questionnaires").data) == 2
+
+
+@pytest.mark.django_db
+def test_questionnaires_retrieve_supports_conditional_get(api_client, user, questionnaire_factory):
+    """Answer a matching If-None-Match with 304 and let the browser cache privately."""
+    questionnaire = questionnaire_factory()
+    api_client.force_authenticate(user=user)
+    url = f"/api/questionnaires/{questionnaire.id}"
+
+    first = api_client.get(url)
+    etag = first["ETag"]
+    revalidated = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert first.status_code == status.HTTP_200_OK
+    assert "private" in first["Cache-Control"]
+    assert "no-store" not in first["Cache-Control"]
+    assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+    assert revalidated.content == b""
+    assert revalidated["ETag"] == etag
+    assert "no-store" not in revalidated["Cache-Control"]
+
+
+@pytest.mark.django_db
+def test_questionnaires_etag_changes_with_displayed_metadata(api_client, user, questionnaire_factory):
+    """Issue a new ETag when the questionnaire or its process is edited in place."""
+    questionnaire = questionnaire_factory()
+    api_client.force_authenticate(user=user)
+    url = f"/api/questionnaires/{questionnaire.id}"
+    etag = api_client.get(url)["ETag"]
+
+    questionnaire.process.slug = "renamed"
+    questionnaire.process.save()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["process_slug"] == "renamed"
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_questionnaires_admin_new_version_becomes_the_listed_latest(
+    api_client,
+    user,
+    admin_user,
+    questionnaire_factory,
+    rf,
+):
+    """Move the latest flag to the version cloned by an admin document edit."""
+    from types import SimpleNamespace
+
+    from django.contrib import admin
+
+    from questionnaires.admin import QuestionnaireAdmin
+    from questionnaires.models import Questionnaire
+
+    original = questionnaire_factory(code="lineage")
+    edited = Questionnaire.objects.get(pk=original.pk)
+    edited.document = {**edited.document, "steps": edited.document["steps"] * 2}
+    form = SimpleNamespace(changed_data=["document"], cleaned_data={"document": edited.document})
+    request = rf.post("/admin/")
+    request.user = admin_user
+    QuestionnaireAdmin(Questionnaire, admin.site).save_model(request, edited, form, True)
+
+    original.refresh_from_db()
+    api_client.force_authenticate(user=user)
+    listed = api_client.get("/api/questionnaires").data
+
+    assert edited.version == 2 and edited.is_latest
+    assert not original.is_latest
+    assert [row["id"] for row in listed] == [edited.pk]
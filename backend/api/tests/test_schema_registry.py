@@ -0,0 +1,61 @@
+"""Unit tests for the compiled JSON Schema validator registry."""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from jsonschema import ValidationError, validate
+
+from api.schema_registry import get_validator, get_validator_for_schema, validate_document
+from applications.schema import ANSWERS_SCHEMA_VERSION, get_answers_schema, get_answers_validator
+from questionnaires.schema import get_questionnaire_schema, get_questionnaire_validator
+
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_schemas_are_compiled_once_per_version():
+    """Share one validator per schema title and version across callers."""
+    assert get_validator("Application Answers Schema", ANSWERS_SCHEMA_VERSION) is get_answers_validator()
+    assert get_validator_for_schema(get_answers_schema()) is get_answers_validator()
+    assert get_validator_for_schema(get_questionnaire_schema()) is get_questionnaire_validator()
+    assert get_answers_validator() is not get_questionnaire_validator()
+
+
+def test_unknown_schema_version_is_not_registered():
+    """Raise KeyError rather than silently validating against another version."""
+    with pytest.raises(KeyError):
+        get_validator("Application Answers Schema", "1999.01-1")
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"schema_version": ANSWERS_SCHEMA_VERSION, "active_step": 0, "steps": []},
+        {"schema_version": ANSWERS_SCHEMA_VERSION, "active_step": 0, "steps": [{"is_valid": None}]},
+        {
+            "schema_version": ANSWERS_SCHEMA_VERSION,
+            "active_step": 0,
+            "steps": [{"is_valid": None, "answers": {"bad-key": "x"}}],
+        },
+    ],
+)
+def test_compiled_validator_reports_the_same_error_as_validate(document):
+    """Keep jsonschema.validate() error semantics (best match) for API messages."""
+    with pytest.raises(ValidationError) as expected:
+        validate(document, get_answers_schema())
+    with pytest.raises(ValidationError) as actual:
+        validate_document(document, get_answers_validator())
+
+    assert actual.value.message == expected.value.message
+    assert list(actual.value.absolute_path) == list(expected.value.absolute_path)
+
+
+def test_benchmark_command_reports_both_variants():
+    """Run the validation micro-benchmark end to end."""
+    out = StringIO()
+    call_command("benchmark_document_validation", "--iterations", "2", "--steps", "1", stdout=out)
+
+    output = out.getvalue()
+    assert "validate(get_answers_schema())" in output
+    assert "compiled validator" in output
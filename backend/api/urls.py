@@ -4,9 +4,14 @@ from rest_framework import routers
 from .views import (
     ApplicationViewSet,
     AssessmentViewSet,
+    AttachmentUploadViewSet,
     AttachmentViewSet,
     AuthorisationProcessViewSet,
+    DatabasePoolStatsView,
+    PdfExportJobViewSet,
+    PdfRenderJobViewSet,
     QuestionnaireViewSet,
+    TurnstileStatsView,
 )
 
 # Routers provide an easy way of automatically determining the URL conf.
@@ -15,10 +20,15 @@ router.register("processes", AuthorisationProcessViewSet)
 router.register("questionnaires", QuestionnaireViewSet)
 router.register("applications", ApplicationViewSet)
 router.register("attachments", AttachmentViewSet)
+router.register("attachment-uploads", AttachmentUploadViewSet, basename="attachment-uploads")
 router.register("assessment", AssessmentViewSet, basename="assessment")
+router.register("pdf-jobs", PdfRenderJobViewSet, basename="pdf-jobs")
+router.register("pdf-exports", PdfExportJobViewSet, basename="pdf-exports")
 
 # Wire up our API using automatic URL routing.
 # Additionally, we include login URLs for the browsable API.
 urlpatterns = [
     path("", include(router.urls)),
+    path("metrics/db-pool", DatabasePoolStatsView.as_view(), name="db-pool-stats"),
+    path("metrics/turnstile", TurnstileStatsView.as_view(), name="turnstile-stats"),
 ]
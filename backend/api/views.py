@@ -1,25 +1,116 @@
+import hashlib
+import json
+import re
 import uuid
 
+from applications import uploads
+from applications.downloads import stream_off_event_loop
+from applications.exports import answer_rows, csv_lines
+from applications.search import search_applications
 from applications.models import (
     Application,
     ApplicationAttachment,
     ApplicationStatus,
+    AttachmentUpload,
+    PdfExportJob,
+    PdfRenderJob,
+    PdfRenderJobStatus,
     REVIEW_QUEUE_STATUSES,
 )
+from api import caching
+from api.pagination import KeysetOrderingFilter, KeysetPagination
+from applications.turnstile import get_turnstile_stats
+from config.database import get_pool_stats
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 from applications.serialisers import (
+    AnswersDeltaSerialiser,
     ApplicationSerialiser,
+    AttachmentBatchSerialiser,
     AttachmentSerialiser,
+    AttachmentUploadSerialiser,
     AssessmentSerialiser,
+    check_file_type,
+    get_question_definition,
+    reserve_attachment_slots,
+    PdfExportJobSerialiser,
+    PdfExportRequestSerialiser,
+    PdfRenderJobSerialiser,
 )
-from django.db.models import BooleanField, Exists, F, OuterRef, Value, Window
-from django.db.models.functions import RowNumber
+from django.db.models import BooleanField, ExpressionWrapper, Q, Value
+from processes.access import get_reviewable_process_ids
 from processes.models import AuthorisationProcess
 from processes.serialisers import AuthorisationProcessSerialiser
 from questionnaires.models import Questionnaire, QuestionnaireSerialiser
-from rest_framework import filters, mixins, viewsets
+from rest_framework import filters, mixins, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+# The answers and questionnaire JSONB columns: by far the widest values on an
+# application row (and its select_related questionnaire).
+DOCUMENT_FIELDS = ("document", "questionnaire__document")
+
+
+def queue_pdf_prerender(application: Application) -> None:
+    """Queue a background PDF render once the current transaction commits.
+
+    Called after status changes so the first reviewer download is already a
+    cache hit. Queued after commit so the worker renders the saved state.
+    """
+    if not settings.PDF_PRERENDER_ON_STATUS_CHANGE:
+        return
+    transaction.on_commit(lambda: PdfRenderJob.objects.enqueue(application))
+
+
+class ApplicationListFilterBackend(filters.BaseFilterBackend):
+    """
+    Filter applications by ``status`` (comma separated), ``process_slug`` and
+    ``questionnaire_code`` query params.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        statuses = request.query_params.get("status")
+        if statuses:
+            requested = set(statuses.split(","))
+            invalid = requested - set(ApplicationStatus.values)
+            if invalid:
+                raise ValidationError(
+                    {"status": f"Invalid status: {', '.join(sorted(invalid))}."}
+                )
+            queryset = queryset.filter(status__in=requested)
+
+        process_slug = request.query_params.get("process_slug")
+        if process_slug:
+            queryset = queryset.filter(questionnaire__process__slug=process_slug)
+
+        questionnaire_code = request.query_params.get("questionnaire_code")
+        if questionnaire_code:
+            queryset = queryset.filter(questionnaire__code=questionnaire_code)
+
+        return queryset
+
+
+class ApplicationSearchFilterBackend(filters.BaseFilterBackend):
+    """
+    Filter applications by the free-text ``q`` query param, matched against
+    answers, applicant username and internal ID (see ``applications.search``).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get("q")
+        if query:
+            queryset = search_applications(queryset, query)
+        return queryset
 
 
 class ApplicationViewSet(
@@ -45,19 +136,43 @@ class ApplicationViewSet(
         "head",
     ]
 
+    # Newest first by default; paginated with ?cursor/?page_size.
+    filter_backends = [ApplicationListFilterBackend, KeysetOrderingFilter]
+    pagination_class = KeysetPagination
+    keyset_ordering_fields = ("-created_at", "created_at", "-updated_at", "updated_at")
+
     def get_queryset(self):
         """
         This view should return a list of all the applications
         for the currently authenticated user.
         """
         # Ensure users can only see their own applications
-        return (
+        queryset = (
             super()
             .get_queryset()
             .select_related("owner", "questionnaire", "questionnaire__process")
             .filter(owner=self.request.user)
         )
 
+        # List responses never include either document (see ApplicationSerialiser.get_fields).
+        # Deferring the two JSONB columns, as AssessmentViewSet does, keeps every
+        # other column loaded, so new serialiser fields never trigger per-row loads.
+        if self.action == "list":
+            queryset = queryset.defer(*DOCUMENT_FIELDS)
+
+        # Serialise concurrent answer deltas on the same application, so the
+        # step bounds checked in validation still hold when the update runs.
+        # The step count comes from the compiled questionnaire cache.
+        if self.action == "answers":
+            queryset = queryset.select_for_update(of=("self",)).defer("questionnaire__document")
+
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == "answers":
+            return AnswersDeltaSerialiser
+        return super().get_serializer_class()
+
     def partial_update(self, request, *args, **kwargs):
         """Handle PATCH updates and stamp submitted_at during the same save path as submission."""
         instance = self.get_object()
@@ -67,21 +182,48 @@ class ApplicationViewSet(
         save_kwargs = {}
         requested_status = serializer.validated_data.get("status")
 
-        # Persist the first submission timestamp alongside the status change.
-        if (
+        is_submission = (
             instance.status == ApplicationStatus.DRAFT
             and requested_status == ApplicationStatus.SUBMITTED
-            and instance.submitted_at is None
-        ):
+        )
+
+        # Persist the first submission timestamp alongside the status change.
+        if is_submission and instance.submitted_at is None:
             save_kwargs["submitted_at"] = timezone.now()
 
         serializer.save(**save_kwargs)
 
+        # The content is final from here on; render it before a reviewer asks.
+        if is_submission:
+            queue_pdf_prerender(instance)
+
         if getattr(instance, "_prefetched_objects_cache", None):
             instance._prefetched_objects_cache = {}
 
         return Response(serializer.data)
 
+    @action(detail=True, methods=["patch"], url_path="answers")
+    def answers(self, request, *args, **kwargs):
+        """Apply a per-step answers delta instead of PUTting the whole document.
+
+        Only the changed answers are validated and written (JSON path update),
+        which keeps autosave requests small on long questionnaires.
+        """
+        with transaction.atomic():
+            instance = self.get_object()
+            serializer = self.get_serializer(instance, data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            if not instance.apply_answers_delta(**serializer.validated_data):
+                raise ValidationError("Cannot modify document of a submitted application.")
+
+        return Response(
+            {
+                **serializer.validated_data,
+                "updated_at": instance.updated_at,
+            }
+        )
+
 
 class ApplicationFilterBackend(filters.BaseFilterBackend):
     """
@@ -133,6 +275,28 @@ class AttachmentViewSet(viewsets.ModelViewSet):
             is_deleted=False,
         )
 
+    def get_serializer_class(self):
+        """Use the batch serialiser for the ``batch`` action."""
+        if self.action == "batch":
+            return AttachmentBatchSerialiser
+        return super().get_serializer_class()
+
+    @action(detail=False, methods=["post"])
+    def batch(self, request):
+        """
+        Add several files to one question in a single multipart request.
+
+        Every file is validated before any row is written, and either all of
+        them are attached or none are.
+        """
+        serialiser = self.get_serializer(data=request.data)
+        serialiser.is_valid(raise_exception=True)
+        attachments = serialiser.save()
+        return Response(
+            AttachmentSerialiser(attachments, many=True, context=self.get_serializer_context()).data,
+            status=status.HTTP_201_CREATED,
+        )
+
     def perform_destroy(self, instance: ApplicationAttachment):
         # defensive check
         if instance.application.owner != self.request.user:
@@ -140,6 +304,136 @@ class AttachmentViewSet(viewsets.ModelViewSet):
         instance.soft_delete()
 
 
+# ``Content-Range: bytes <first>-<last>/<size>`` of a resumable upload chunk
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+class AttachmentUploadViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Resumable, chunked attachment uploads (protocol in ``applications.uploads``).
+
+    ``create`` starts an upload, ``update`` (PUT) appends one chunk,
+    ``retrieve`` reports the offset to resume from, ``finalise`` creates the
+    attachment and ``destroy`` abandons the upload.
+    """
+
+    serializer_class = AttachmentUploadSerialiser
+    lookup_field = "key"
+    http_method_names = [
+        "get",
+        "post",
+        "put",
+        "delete",
+        "options",
+        "head",
+    ]
+
+    def get_queryset(self):
+        """Only the user's own uploads; locked while a chunk or finalise is processed."""
+        queryset = (
+            AttachmentUpload.objects.select_related("application", "application__questionnaire")
+            # Questions are looked up in the compiled questionnaire cache.
+            .defer("application__questionnaire__document")
+            .filter(application__owner=self.request.user)
+        )
+        if self.action in ("update", "finalise"):
+            queryset = queryset.select_for_update(of=("self",))
+        return queryset
+
+    def _conflict(self, upload: AttachmentUpload, detail: str) -> Response:
+        """Tell the client where to resume from."""
+        return Response(
+            {"detail": detail, "offset": upload.received},
+            status=status.HTTP_409_CONFLICT,
+        )
+
+    def update(self, request, *args, **kwargs):
+        """Write one chunk; it must start at the current offset."""
+        match = CONTENT_RANGE_RE.match(request.headers.get("Content-Range", ""))
+        if match is None:
+            raise ValidationError({"Content-Range": "Expected 'bytes <first>-<last>/<size>'."})
+        first, last, total = (int(value) for value in match.groups())
+
+        # The raw body; DRF never parses it because request.data is not used.
+        data = request.body
+        if len(data) > settings.ATTACHMENT_UPLOAD_CHUNK_SIZE:
+            raise ValidationError(
+                {"detail": f"Chunks may not exceed {settings.ATTACHMENT_UPLOAD_CHUNK_SIZE} bytes."}
+            )
+
+        with transaction.atomic():
+            upload = self.get_object()
+            if total != upload.size or last >= upload.size or last - first + 1 != len(data):
+                raise ValidationError(
+                    {"Content-Range": "Does not match the chunk length or the upload size."}
+                )
+            if first != upload.received:
+                return self._conflict(upload, f"Expected the chunk starting at byte {upload.received}.")
+
+            if first == 0:
+                # Reject a disallowed file type before storing anything.
+                if len(data) < min(32, upload.size):
+                    raise ValidationError({"detail": "The first chunk must hold at least 32 bytes."})
+                upload.content_type = check_file_type(data[:32], upload.name)
+
+            uploads.write_chunk(upload, data)
+
+        return Response(self.get_serializer(upload).data)
+
+    @action(detail=True, methods=["post"])
+    def finalise(self, request, *args, **kwargs):
+        """Create the attachment once every byte has arrived and the question has room."""
+        with transaction.atomic():
+            upload = self.get_object()
+            if not upload.is_complete:
+                return self._conflict(upload, "The upload is incomplete.")
+
+            application = upload.application
+            question_def = get_question_definition(application, upload.question)
+            reserve_attachment_slots(application, upload.question, question_def)
+
+            uploads.commit(upload)
+            attachment = ApplicationAttachment.objects.create(
+                key=upload.attachment_key,
+                application=application,
+                question=upload.question,
+                name=upload.name,
+                file=upload.file_name,
+            )
+            upload.delete()
+
+        serializer = AttachmentSerialiser(attachment, context=self.get_serializer_context())
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def perform_destroy(self, instance: AttachmentUpload):
+        """Abandon the upload and delete its stored bytes."""
+        uploads.discard(instance)
+        instance.delete()
+
+
+def questionnaire_etag(request, id=None, **kwargs) -> str | None:
+    """Return a strong ETag for a questionnaire version without loading its document.
+
+    Documents never change for a given (id, version): editing one creates a new
+    version row. ``updated_at`` and the process columns cover the metadata in
+    the response that can change in place.
+    """
+    row = (
+        Questionnaire.objects.filter(id=id)
+        .values_list("id", "version", "updated_at", "process__slug", "process__updated_at")
+        .first()
+    )
+    if row is None:
+        return None
+    encoded = json.dumps(row, cls=DjangoJSONEncoder).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 class QuestionnaireViewSet(viewsets.ReadOnlyModelViewSet):
     """
     A simple ViewSet for listing or retrieving questionnaires.
@@ -159,21 +453,35 @@ class QuestionnaireViewSet(viewsets.ReadOnlyModelViewSet):
         Return only the latest questionnaire version for each (process, code),
         then order for display by process and questionnaire sort order.
         """
-        queryset = (
-            self.filter_queryset(self.get_queryset())
-            .annotate(
-                _latest_rank=Window(
-                    expression=RowNumber(),
-                    partition_by=[F("process_id"), F("code")],
-                    order_by=F("version").desc(),
-                )
+
+        def build():
+            queryset = (
+                self.filter_queryset(self.get_queryset())
+                .latest_versions()
+                .order_by("process__sort_order", "sort_order", "name")
             )
-            .filter(_latest_rank=1)
-            .order_by("process__sort_order", "sort_order", "name")
+            return list(self.get_serializer(queryset, many=True).data)
+
+        # Same for every user and only changed through the admin (which
+        # invalidates it), so serve it from the shared cache.
+        return Response(caching.get_or_set(caching.QUESTIONNAIRE_LIST, "list", build))
+
+    @method_decorator(
+        cache_control(
+            private=True,
+            max_age=settings.QUESTIONNAIRE_CACHE_MAX_AGE,
+            must_revalidate=True,
         )
+    )
+    @method_decorator(etag(questionnaire_etag))
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return a questionnaire version, or 304 when the client's ETag matches.
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        Overrides the global no-store policy (see GlobalNeverCacheMiddleware) so
+        the browser keeps the document and revalidates it with If-None-Match.
+        """
+        return super().retrieve(request, *args, **kwargs)
 
 
 class AuthorisationProcessViewSet(viewsets.ReadOnlyModelViewSet):
@@ -203,18 +511,43 @@ class AuthorisationProcessViewSet(viewsets.ReadOnlyModelViewSet):
                 can_review=Value(False, output_field=BooleanField())
             )
 
-        # Build an EXISTS subquery against the process<->group join table. If
-        # any linked reviewer group matches one of the current user's groups,
-        # the process is reviewable for that user.
-        reviewer_group_links = (
-            AuthorisationProcess.assessor_groups.through.objects.filter(
-                authorisationprocess_id=OuterRef("pk"),
-                group_id__in=self.request.user.groups.values("id"),
+        # Reviewable process IDs are resolved once per request (and cached),
+        # so the flag is a simple IN list rather than a join per request.
+        reviewable_process_ids = get_reviewable_process_ids(self.request.user)
+        if not reviewable_process_ids:
+            return queryset.annotate(
+                can_review=Value(False, output_field=BooleanField())
             )
-        )
 
         # Expose the result as a boolean annotation for direct serialisation.
-        return queryset.annotate(can_review=Exists(reviewer_group_links))
+        return queryset.annotate(
+            can_review=ExpressionWrapper(
+                Q(pk__in=reviewable_process_ids), output_field=BooleanField()
+            )
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serve the process rows from the shared cache (they only change through
+        the admin, which invalidates them) and fill in ``can_review`` per user.
+        """
+
+        def build():
+            processes = list(
+                AuthorisationProcess.objects.annotate(
+                    can_review=Value(False, output_field=BooleanField())
+                )
+            )
+            rows = self.get_serializer(processes, many=True).data
+            return [(process.pk, dict(row)) for process, row in zip(processes, rows)]
+
+        reviewable_process_ids = get_reviewable_process_ids(request.user)
+        return Response(
+            [
+                {**row, "can_review": pk in reviewable_process_ids}
+                for pk, row in caching.get_or_set(caching.PROCESS_LIST, "list", build)
+            ]
+        )
 
 
 class AssessmentViewSet(
@@ -227,10 +560,14 @@ class AssessmentViewSet(
 
     Provides:
       - LIST     — the assessment queue: applications in a review-relevant status
-                   that belong to processes the current user is authorised to assess.
+                   that belong to processes the current user is authorised to assess;
+                   ``?q=`` full-text searches answers, applicant and internal ID.
       - RETRIEVE — a single application from that same scoped queue.
       - PATCH    — advance the application status (e.g. SUBMITTED → UNDER_REVIEW,
                    UNDER_REVIEW → ACTION_REQUIRED, UNDER_ASSESSMENT → APPROVED).
+      - EXPORT   — queue a bulk PDF export (ZIP) of selected applications or of
+                   the filtered queue, e.g. a committee pack.
+      - ANSWERS EXPORT — stream the answers to one questionnaire version as CSV.
 
     Access is implicitly scoped by the user's reviewer group memberships; an
     authenticated user with no reviewer group assignments will receive an empty
@@ -242,7 +579,14 @@ class AssessmentViewSet(
     queryset = Application.objects.all()
     serializer_class = AssessmentSerialiser
     lookup_field = "key"
-    http_method_names = ["get", "patch", "options", "head"]
+    # POST is only routed to the ``export`` action; there is no create.
+    http_method_names = ["get", "post", "patch", "options", "head"]
+
+    # Newest submissions first by default, as before pagination (the frontend
+    # re-sorts the queue into its FIFO view); paginated with ?cursor/?page_size.
+    filter_backends = [ApplicationListFilterBackend, ApplicationSearchFilterBackend, KeysetOrderingFilter]
+    pagination_class = KeysetPagination
+    keyset_ordering_fields = ("-submitted_at", "submitted_at")
 
     def get_queryset(self):
         """
@@ -254,15 +598,10 @@ class AssessmentViewSet(
         ``assessor_groups``. This mirrors the ``can_review`` annotation logic
         in ``AuthorisationProcessViewSet`` but expressed as a queryset filter.
         """
-        # Resolve which process IDs this user may review via the M2M join table.
-        # Using the through model avoids a JOIN through AuthorisationProcess itself.
-        reviewable_process_ids = (
-            AuthorisationProcess.assessor_groups.through.objects.filter(
-                group_id__in=self.request.user.groups.values("id")
-            ).values("authorisationprocess_id")
-        )
+        # Resolve which process IDs this user may review (memoised per request).
+        reviewable_process_ids = get_reviewable_process_ids(self.request.user)
 
-        return (
+        queryset = (
             super()
             .get_queryset()
             .filter(
@@ -272,6 +611,13 @@ class AssessmentViewSet(
             .select_related("owner", "questionnaire", "questionnaire__process")
         )
 
+        # AssessmentSerialiser never reads either document, so only fetch them
+        # where the model itself might (saves in partial_update).
+        if self.action in ("list", "retrieve"):
+            queryset = queryset.defer(*DOCUMENT_FIELDS)
+
+        return queryset
+
     def partial_update(self, request, *args, **kwargs):
         """
         Advance the status of a single application in the review queue.
@@ -280,12 +626,245 @@ class AssessmentViewSet(
         endpoint. Transition validity is enforced by the serialiser.
         """
         instance = self.get_object()
+        previous_status = instance.status
         serializer = self.get_serializer(instance, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
+        # A status change supersedes the cached PDF; render the new one up front.
+        if instance.status != previous_status:
+            queue_pdf_prerender(instance)
+
         # Clear any prefetch cache so the response reflects the saved state.
         if getattr(instance, "_prefetched_objects_cache", None):
             instance._prefetched_objects_cache = {}
 
         return Response(serializer.data)
+
+    @action(detail=False, methods=["post"])
+    def export(self, request, *args, **kwargs):
+        """
+        Queue a bulk PDF export and answer 202 with the job to poll.
+
+        Exports the applications in ``keys``, or every application in the
+        queue matching the list filters (``status``, ``process_slug``,
+        ``questionnaire_code``) when no keys are given.
+        """
+        serializer = PdfExportRequestSerialiser(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        keys = serializer.validated_data.get("keys")
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if keys:
+            queryset = queryset.filter(key__in=keys)
+        applications = list(queryset.select_related(None).only("pk"))
+
+        # Applications outside the user's queue are reported like unknown keys.
+        if keys and len(applications) != len(set(keys)):
+            raise ValidationError({"keys": "Some applications were not found in your assessment queue."})
+        if not applications:
+            raise ValidationError({"detail": "No applications match the export."})
+        if len(applications) > settings.PDF_EXPORT_MAX_APPLICATIONS:
+            raise ValidationError(
+                {
+                    "detail": f"Exports are limited to {settings.PDF_EXPORT_MAX_APPLICATIONS} "
+                    f"applications; {len(applications)} were selected."
+                }
+            )
+
+        job = PdfExportJob.objects.enqueue(applications, requested_by=request.user)
+        return Response(
+            PdfExportJobSerialiser(job, context=self.get_serializer_context()).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(detail=False, methods=["get"], url_path="answers-export")
+    def answers_export(self, request, *args, **kwargs):
+        """
+        Stream the answers of every queued application of one questionnaire
+        version as CSV, one row per application.
+
+        The questionnaire is chosen by ``process_slug``, ``questionnaire_code``
+        and ``version`` (the latest when omitted); ``status`` narrows the rows.
+        """
+        process_slug = request.query_params.get("process_slug")
+        code = request.query_params.get("questionnaire_code")
+        version = request.query_params.get("version")
+        if not process_slug or not code:
+            raise ValidationError({"detail": "process_slug and questionnaire_code are required."})
+        if version is not None and not version.isdigit():
+            raise ValidationError({"version": "Must be a whole number."})
+
+        questionnaires = Questionnaire.objects.select_related("process").filter(
+            process__slug=process_slug,
+            code=code,
+            process_id__in=get_reviewable_process_ids(request.user),
+        )
+        if version is not None:
+            questionnaires = questionnaires.filter(version=int(version))
+        questionnaire = questionnaires.defer("document").order_by("-version").first()
+        if questionnaire is None:
+            raise NotFound("Questionnaire not found.")
+
+        applications = self.filter_queryset(self.get_queryset()).filter(questionnaire=questionnaire)
+        response = StreamingHttpResponse(
+            csv_lines(answer_rows(questionnaire, applications)),
+            content_type="text/csv; charset=utf-8",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{process_slug}-{code}-v{questionnaire.version}-answers.csv"'
+        )
+        # Under ASGI Django would otherwise buffer the whole export before
+        # sending it; rows are read from the database, so keep them on the
+        # request's thread.
+        return stream_off_event_loop(request._request, response, thread_sensitive=True)
+
+
+class PdfRenderJobViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Background PDF rendering for applications.
+
+    Provides:
+      - CREATE   — queue a render for ``application_key`` and return the job key.
+      - RETRIEVE — poll the job status.
+      - DOWNLOAD — serve the finished PDF once the job is DONE.
+
+    Jobs are visible to anyone with read access to the application (the owner
+    or a reviewer of its process), mirroring ``Application.has_access``.
+    """
+
+    queryset = PdfRenderJob.objects.all()
+    serializer_class = PdfRenderJobSerialiser
+    lookup_field = "key"
+    http_method_names = ["get", "post", "options", "head"]
+
+    def get_queryset(self):
+        """Scope jobs to applications the current user may read."""
+        user = self.request.user
+        reviewable_process_ids = get_reviewable_process_ids(user)
+
+        return (
+            super()
+            .get_queryset()
+            .filter(
+                Q(application__owner=user)
+                | Q(application__questionnaire__process_id__in=reviewable_process_ids)
+            )
+            .select_related(
+                "application",
+                "application__questionnaire",
+                "application__questionnaire__process",
+            )
+        )
+
+    def create(self, request, *args, **kwargs):
+        """Queue the render and answer 202 so clients know to poll."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=["get"])
+    def download(self, request, *args, **kwargs):
+        """Serve the rendered PDF, or 409 while the job is still pending."""
+        job = self.get_object()
+
+        if job.status != PdfRenderJobStatus.DONE:
+            return Response(
+                {"detail": f"PDF render is {job.status.lower()}."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        # A later edit or status change may have superseded the rendered artefact.
+        pdf_file = job.open_pdf()
+        if pdf_file is None:
+            raise NotFound("The rendered PDF is no longer available; request a new render.")
+
+        return FileResponse(
+            pdf_file,
+            as_attachment=False,
+            filename=f"application_{job.application.key}.pdf",
+            content_type="application/pdf",
+        )
+
+
+class PdfExportJobViewSet(
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Bulk PDF exports queued from the assessment queue or the admin.
+
+    Provides:
+      - RETRIEVE — poll the job status and progress.
+      - DOWNLOAD — serve the ZIP archive once the job is DONE.
+
+    Jobs are visible only to the user who requested them: the archive holds
+    the applications that user could see when it was queued.
+    """
+
+    queryset = PdfExportJob.objects.all()
+    serializer_class = PdfExportJobSerialiser
+    lookup_field = "key"
+    http_method_names = ["get", "options", "head"]
+
+    def get_queryset(self):
+        """Scope exports to the current user's own requests."""
+        return super().get_queryset().filter(requested_by=self.request.user)
+
+    @action(detail=True, methods=["get"])
+    def download(self, request, *args, **kwargs):
+        """Serve the ZIP archive, or 409 while the job is still pending."""
+        job = self.get_object()
+
+        if job.status != PdfRenderJobStatus.DONE:
+            return Response(
+                {"detail": f"PDF export is {job.status.lower()}."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        archive = job.open_archive()
+        if archive is None:
+            raise NotFound("The export is no longer available; request a new one.")
+
+        response = FileResponse(
+            archive,
+            as_attachment=True,
+            filename=f"applications_{job.created_at:%Y-%m-%d}_{job.key}.zip",
+            content_type="application/zip",
+        )
+        # Archives of many PDFs are large; under ASGI read them off the event loop.
+        return stream_off_event_loop(request._request, response)
+
+
+class DatabasePoolStatsView(APIView):
+    """
+    Report the database connection pool counters of the worker serving the request.
+
+    Each gunicorn worker keeps its own pool, so repeated calls sample different
+    workers; the response carries the worker's ``pid`` to tell them apart.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        """Return ``{"pid": ..., "pools": {<alias>: <psycopg_pool stats>}}``."""
+        return Response(get_pool_stats())
+
+
+class TurnstileStatsView(APIView):
+    """
+    Report the Turnstile verification counters and latency of the worker serving the request.
+
+    Counters are kept per worker process, like ``DatabasePoolStatsView``.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        """Return ``{"pid": ..., "backend": ..., <counters>, "latency_ms": {...}}``."""
+        return Response(get_turnstile_stats())
@@ -1,6 +1,10 @@
-from django.contrib import admin
+from django.conf import settings
+from django.contrib import admin, messages
+from django.urls import reverse
+from django.utils.html import format_html
 
-from .models import Application, ApplicationAttachment
+from .models import Application, ApplicationAttachment, PdfExportJob
+from .search import search_applications
 from .forms import ApplicationForm
 
 
@@ -52,6 +56,7 @@ class ApplicationAdmin(admin.ModelAdmin):
         "questionnaire__process",
         "questionnaire__name",
     )
+    actions = ["export_pdfs"]
     search_fields = ("owner__username", "questionnaire__name", "questionnaire__code", "questionnaire__process__slug")
     readonly_fields = (
         "internal_id",
@@ -120,8 +125,40 @@ class ApplicationAdmin(admin.ModelAdmin):
                 except Application.DoesNotExist:
                     pass
 
-        # Fall back to the default search on configured search_fields
-        return super().get_search_results(request, queryset, search_term)
+        # Fall back to the default search on configured search_fields, widened
+        # to applications whose answers match (an indexed lookup on PostgreSQL).
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if search_term:
+            matches = search_applications(Application.objects.all(), search_term)
+            results = results | queryset.filter(pk__in=matches.values("pk"))
+        return results, may_have_duplicates
+
+    @admin.action(description="Export PDFs of selected applications (ZIP)")
+    def export_pdfs(self, request, queryset):
+        """Queue a bulk PDF export of the selected applications for the PDF worker."""
+        count = queryset.count()
+        if count > settings.PDF_EXPORT_MAX_APPLICATIONS:
+            self.message_user(
+                request,
+                f"Exports are limited to {settings.PDF_EXPORT_MAX_APPLICATIONS} applications; "
+                f"{count} were selected.",
+                messages.ERROR,
+            )
+            return
+
+        job = PdfExportJob.objects.enqueue(
+            queryset.select_related(None).only("pk"), requested_by=request.user
+        )
+        self.message_user(
+            request,
+            format_html(
+                'Queued a PDF export of {} applications. <a href="{}">Follow its progress</a> '
+                "and download the ZIP once the PDF worker has finished.",
+                job.total,
+                reverse("pdf-exports-detail", kwargs={"key": job.key}),
+            ),
+            messages.SUCCESS,
+        )
 
     def has_add_permission(self, request):
         return False
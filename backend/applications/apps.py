@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class ApplicationsConfig(AppConfig):
     name = 'applications'
+
+    def ready(self):
+        # Register model signal handlers (PDF cache invalidation).
+        from . import signals  # noqa: F401
@@ -0,0 +1,277 @@
+"""Streaming attachment downloads with HTTP Range and conditional requests.
+
+Attachment files are immutable: a re-upload creates a new attachment with a
+new ``key``. The key (plus the display name, which owners may rename) therefore
+makes a strong ETag and ``created_at`` a stable Last-Modified, so browsers can revalidate with a cheap 304 and resume or seek
+(PDF viewers request byte ranges) without re-transferring the whole file.
+
+Bytes are streamed from storage in ``ATTACHMENT_DOWNLOAD_CHUNK_SIZE`` chunks.
+For Azure blobs only the requested range is downloaded; django-storages'
+``AzureStorageFile`` would otherwise spool the entire blob to a temporary
+file before the first byte is sent.
+
+``ATTACHMENT_DELIVERY`` can instead hand the transfer off entirely, so the
+worker only checks access (see ``deliver_attachment``).
+
+Under ASGI (``SERVER_MODE=asgi``) the download views are async: the blocking
+storage calls run in worker threads and streamed bodies are read chunk by
+chunk off the event loop (see ``adeliver_attachment``), so one worker keeps
+serving other requests while a slow blob download is in flight.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import re
+from collections.abc import AsyncIterator, Iterator
+from urllib.parse import quote
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+from storages.backends.azure_storage import AzureStorage
+
+from .models import ApplicationAttachment
+
+# A single ``bytes=<first>-<last>`` or ``bytes=-<suffix length>`` range
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# ATTACHMENT_DELIVERY modes
+DELIVERY_STREAM = "stream"
+DELIVERY_ACCEL = "accel"
+DELIVERY_SAS = "sas"
+
+
+class RangeNotSatisfiable(Exception):
+    """The requested range starts beyond the end of the file."""
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Return the inclusive ``(first, last)`` byte positions requested by ``header``.
+
+    Returns None when the whole file should be sent: no header, a malformed
+    one or several ranges (which servers may ignore, RFC 9110 section 14.2).
+    """
+    if not header:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the final N bytes.
+        if not last:
+            return None
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+
+    first = int(first)
+    if last and int(last) < first:
+        return None
+    if first >= size:
+        raise RangeNotSatisfiable
+    return first, min(int(last), size - 1) if last else size - 1
+
+
+def _if_range_matches(request, etag: str, last_modified: int) -> bool:
+    """Return True when the Range may be honoured (absent or matching If-Range)."""
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        # If-Range requires a strong comparison, so weak validators never match.
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def iter_file_range(storage, name: str, start: int, length: int, chunk_size: int) -> Iterator[bytes]:
+    """Yield ``length`` bytes of the stored file ``name`` from offset ``start``."""
+    if length <= 0:
+        return
+
+    if isinstance(storage, AzureStorage):
+        # Ask Azure for exactly the requested range and stream it through.
+        blob_client = storage.client.get_blob_client(storage._get_valid_path(name))
+        downloader = blob_client.download_blob(offset=start, length=length, timeout=storage.timeout)
+        while chunk := downloader.read(chunk_size):
+            yield chunk
+        return
+
+    with storage.open(name, "rb") as stored_file:
+        stored_file.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = stored_file.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def attachment_etag(attachment: ApplicationAttachment) -> str:
+    """Return the strong ETag of the attachment's bytes and download filename."""
+    # The name feeds Content-Disposition, so a rename must not revalidate to 304.
+    name_digest = hashlib.sha256(attachment.name.encode("utf-8")).hexdigest()[:12]
+    return f'"{attachment.key.hex}-{name_digest}"'
+
+
+def _set_validators(response, etag: str, last_modified: int):
+    """Add the caching and range headers shared by every attachment response."""
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    # Let the browser keep the file, but revalidate before each reuse.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _content_type(attachment: ApplicationAttachment) -> str:
+    """Guess the download content type from the attachment's display name."""
+    return mimetypes.guess_type(attachment.name)[0] or "application/octet-stream"
+
+
+def deliver_attachment(request, attachment: ApplicationAttachment) -> HttpResponse:
+    """Return the response delivering ``attachment`` in the ``ATTACHMENT_DELIVERY`` mode.
+
+    The caller must have checked access to the attachment's application.
+    """
+    mode = settings.ATTACHMENT_DELIVERY
+    if mode == DELIVERY_STREAM:
+        return serve_attachment(request, attachment)
+    if mode == DELIVERY_ACCEL:
+        return accel_redirect_attachment(attachment)
+    if mode == DELIVERY_SAS:
+        return sas_redirect_attachment(attachment)
+    raise ImproperlyConfigured(
+        f"ATTACHMENT_DELIVERY must be one of {DELIVERY_STREAM!r}, {DELIVERY_ACCEL!r} "
+        f"or {DELIVERY_SAS!r}, not {mode!r}."
+    )
+
+
+def accel_redirect_attachment(attachment: ApplicationAttachment) -> HttpResponse:
+    """Hand the file to nginx with ``X-Accel-Redirect``.
+
+    nginx serves the internal location itself, including Range and
+    conditional requests, and keeps the Content-Type, Content-Disposition and
+    Cache-Control headers set here.
+    """
+    if not isinstance(attachment.file.storage, FileSystemStorage):
+        raise ImproperlyConfigured("ATTACHMENT_DELIVERY='accel' requires local media storage.")
+
+    response = HttpResponse(content_type=_content_type(attachment))
+    response["X-Accel-Redirect"] = settings.ATTACHMENT_ACCEL_REDIRECT_PREFIX + quote(attachment.file.name)
+    response["Content-Disposition"] = content_disposition_header(False, attachment.name)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def sas_redirect_attachment(attachment: ApplicationAttachment) -> HttpResponse:
+    """Redirect to a short-lived, read-only SAS URL for the attachment's blob.
+
+    The signature covers this one blob only and expires after
+    ``ATTACHMENT_SAS_EXPIRY`` seconds. It also pins the response filename and
+    content type, since blobs are stored without an extension.
+    """
+    storage = attachment.file.storage
+    if not isinstance(storage, AzureStorage):
+        raise ImproperlyConfigured("ATTACHMENT_DELIVERY='sas' requires Azure media storage.")
+
+    url = storage.url(
+        attachment.file.name,
+        expire=settings.ATTACHMENT_SAS_EXPIRY,
+        parameters={
+            "content_disposition": content_disposition_header(False, attachment.name),
+            "content_type": _content_type(attachment),
+        },
+    )
+    response = HttpResponseRedirect(url)
+    # The URL stops working soon, so it must never be reused from a cache.
+    patch_cache_control(response, private=True, no_store=True)
+    return response
+
+
+def serve_attachment(request, attachment: ApplicationAttachment) -> HttpResponse:
+    """Return a streaming response for ``attachment`` honouring Range and validators.
+
+    The caller must have checked access to the attachment's application.
+    """
+    etag = attachment_etag(attachment)
+    last_modified = int(attachment.created_at.timestamp())
+
+    # 304 for a matching If-None-Match/If-Modified-Since, 412 for a failed If-Match.
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        return _set_validators(not_modified, etag, last_modified)
+
+    storage = attachment.file.storage
+    name = attachment.file.name
+    size = storage.size(name)
+
+    try:
+        byte_range = (
+            parse_range(request.headers.get("Range"), size)
+            if _if_range_matches(request, etag, last_modified)
+            else None
+        )
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return _set_validators(response, etag, last_modified)
+
+    first, last = byte_range if byte_range else (0, size - 1)
+    length = last - first + 1
+    content = (
+        iter(())
+        if request.method == "HEAD"
+        else iter_file_range(storage, name, first, length, settings.ATTACHMENT_DOWNLOAD_CHUNK_SIZE)
+    )
+
+    response = StreamingHttpResponse(
+        content,
+        status=206 if byte_range else 200,
+        content_type=_content_type(attachment),
+    )
+    response["Content-Length"] = str(length)
+    if byte_range:
+        response["Content-Range"] = f"bytes {first}-{last}/{size}"
+    response["Content-Disposition"] = content_disposition_header(False, attachment.name)
+    return _set_validators(response, etag, last_modified)
+
+
+async def _aiter_in_thread(iterator: Iterator[bytes], thread_sensitive: bool = False) -> AsyncIterator[bytes]:
+    """Yield the chunks of a blocking iterator, reading each one in a worker thread."""
+    read = sync_to_async(next, thread_sensitive=thread_sensitive)
+    while (chunk := await read(iterator, None)) is not None:
+        yield chunk
+
+
+def stream_off_event_loop(request, response: HttpResponse, thread_sensitive: bool = False) -> HttpResponse:
+    """Under ASGI, make a streaming response read its blocking iterator in worker threads.
+
+    Django would otherwise consume the iterator on the event loop's sync
+    thread (with a warning). WSGI responses are returned unchanged, since
+    Django buffers async iterators in full when serving them synchronously.
+
+    Iterators that query the database need ``thread_sensitive=True``: every
+    chunk is then read on the request's sync thread, whose connection holds
+    any open (server-side) cursor.
+    """
+    if isinstance(request, ASGIRequest) and response.streaming and not response.is_async:
+        response.streaming_content = _aiter_in_thread(iter(response.streaming_content), thread_sensitive)
+    return response
+
+
+async def adeliver_attachment(request, attachment: ApplicationAttachment) -> HttpResponse:
+    """Async ``deliver_attachment``: storage calls and reads run in worker threads."""
+    # No database access happens here, so any thread will do.
+    response = await sync_to_async(deliver_attachment, thread_sensitive=False)(request, attachment)
+    return stream_off_event_loop(request, response)
@@ -0,0 +1,160 @@
+"""Tabular (CSV) export of application answers for one questionnaire version.
+
+Every application becomes one row. The columns come from the compiled
+questionnaire: one per question, except grid questions, which get one
+column per grid column (holding that column's cell from each grid row, one
+per line). File questions list the names of the attached files.
+
+Rows are produced lazily from a server-side cursor and written out as they
+are read, so the memory used stays flat however many applications there are.
+"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from django.db.models import Prefetch, QuerySet
+from questionnaires.compiled import CompiledQuestion, get_compiled_questionnaire
+from questionnaires.models import Questionnaire
+
+from .models import Application, ApplicationAttachment
+
+# Applications fetched per round trip from the server-side cursor
+CHUNK_SIZE = 500
+
+# Leading characters spreadsheet applications evaluate as formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+APPLICATION_COLUMNS = (
+    "Internal ID",
+    "Key",
+    "Status",
+    "Applicant",
+    "Submitted at",
+    "Updated at",
+)
+
+
+def _cell(value: Any) -> str:
+    """Return an answer value as CSV cell text."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, list):
+        return "\n".join(_cell(item) for item in value)
+    if isinstance(value, dict):
+        return "\n".join(f"{key}: {_cell(val)}" for key, val in value.items())
+    return str(value)
+
+
+def _spreadsheet_safe(text: str) -> str:
+    """Stop applicant-supplied text from running as a formula when the CSV is opened."""
+    return f"'{text}" if text.startswith(_FORMULA_PREFIXES) else text
+
+
+def answer_columns(question: CompiledQuestion) -> list[tuple[str, Any]]:
+    """Return ``(header, extract)`` pairs for a question's columns.
+
+    ``extract(answer, attachment_names)`` turns the stored answer into cell text.
+    """
+    label = question.label or f"Question {question.index + 1}"
+    header = f"{question.key} {label}"
+
+    if question.type == "grid":
+        columns = []
+        for column in question.definition.get("grid_columns") or []:
+            column_label = column.get("label") or "Column"
+
+            def extract(answer, _names, column_label=column_label):
+                rows = answer if isinstance(answer, list) else []
+                return "\n".join(
+                    _cell(row.get(column_label)) for row in rows if isinstance(row, dict)
+                )
+
+            columns.append((f"{header}: {column_label}", extract))
+        return columns
+
+    if question.type == "file":
+
+        def extract(answer, names):
+            keys = answer if isinstance(answer, list) else []
+            return "\n".join(names.get(str(key), f"Missing file ({key})") for key in keys)
+
+        return [(header, extract)]
+
+    if question.type == "checkbox":
+        return [(header, lambda answer, _names: "Yes" if answer else "No")]
+
+    return [(header, lambda answer, _names: _cell(answer))]
+
+
+def answer_rows(
+    questionnaire: Questionnaire,
+    applications: QuerySet[Application],
+) -> Iterator[list[str]]:
+    """Yield the header row, then one row of answers per application.
+
+    ``applications`` must all belong to ``questionnaire``; they are streamed
+    with only the fields the export reads, plus their live attachments.
+    """
+    compiled = get_compiled_questionnaire(questionnaire)
+    columns = [
+        (question, header, extract)
+        for question in compiled.questions.values()
+        for header, extract in answer_columns(question)
+    ]
+    yield [*APPLICATION_COLUMNS, *(header for _, header, _ in columns)]
+
+    applications = (
+        applications.select_related(None)
+        .select_related("owner")
+        .only("id", "key", "status", "submitted_at", "updated_at", "document", "owner__username")
+        .prefetch_related(
+            Prefetch(
+                "attachments",
+                queryset=ApplicationAttachment.objects.filter(is_deleted=False).only(
+                    "application_id", "key", "name"
+                ),
+            )
+        )
+    )
+    # A server-side cursor on PostgreSQL; prefetching runs once per chunk.
+    for application in applications.iterator(chunk_size=CHUNK_SIZE):
+        # Every row shares the questionnaire, so reuse it instead of joining it in.
+        application.questionnaire = questionnaire
+        steps = (application.document or {}).get("steps") or []
+        names = {str(attachment.key): attachment.name for attachment in application.attachments.all()}
+
+        row = [
+            application.internal_id,
+            str(application.key),
+            application.status,
+            application.owner.username,
+            application.submitted_at.isoformat() if application.submitted_at else "",
+            application.updated_at.isoformat(),
+        ]
+        for question, _, extract in columns:
+            step = steps[question.step] if question.step < len(steps) else {}
+            answer = ((step or {}).get("answers") or {}).get(question.answer_key)
+            row.append(_spreadsheet_safe(extract(answer, names)))
+        yield row
+
+
+class _Echo:
+    """A write-only file object that returns what is written, for ``csv.writer``."""
+
+    def write(self, value: str) -> str:
+        """Return ``value`` so the writer's caller can yield it."""
+        return value
+
+
+def csv_lines(rows: Iterable[list[str]]) -> Iterator[str]:
+    """Yield ``rows`` as CSV text, one line at a time."""
+    # The byte order mark makes Excel read the file as UTF-8.
+    yield "\ufeff"
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
@@ -0,0 +1,49 @@
+"""Database expressions for in-place updates of JSON document columns."""
+
+import json
+from collections.abc import Sequence
+
+from django.db import NotSupportedError, models
+from django.db.models import Func
+
+
+class JSONSet(Func):
+    """Set the value at ``path`` inside a JSON column expression.
+
+    Compiles to ``jsonb_set(..., create_missing => true)`` on PostgreSQL and
+    ``json_set`` on SQLite (tests), so a single answer can be written without
+    sending the whole document back to the database. Nest several ``JSONSet``
+    expressions to set more than one path in the same UPDATE.
+
+    Missing object keys are created; an array index equal to the array length
+    appends. Parent containers must already exist.
+    """
+
+    output_field = models.JSONField()
+
+    def __init__(self, expression, path: Sequence[str | int], value, **extra):
+        self.path = tuple(path)
+        self.value = value
+        super().__init__(expression, **extra)
+
+    def _value_param(self) -> str:
+        return json.dumps(self.value)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f"JSONSet is not supported on {connection.vendor}.")
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        path = [str(part) for part in self.path]
+        return (
+            f"jsonb_set({sql}, %s::text[], %s::jsonb, true)",
+            (*params, path, self._value_param()),
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        path = "$" + "".join(
+            f"[{part}]" if isinstance(part, int) else f".{json.dumps(part)}"
+            for part in self.path
+        )
+        return f"json_set({sql}, %s, json(%s))", (*params, path, self._value_param())
@@ -0,0 +1,69 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from jsonschema import validate
+
+from api.schema_registry import validate_document
+from applications.schema import ANSWERS_SCHEMA_VERSION, get_answers_schema, get_answers_validator
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-call jsonschema.validate() against the shared compiled "
+        "validator for an application answers document, as saved on autosave."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Validations per variant.",
+        )
+        parser.add_argument(
+            "--steps",
+            type=int,
+            default=10,
+            help="Steps in the synthetic answers document.",
+        )
+        parser.add_argument(
+            "--answers-per-step",
+            type=int,
+            default=20,
+            help="Answers per step in the synthetic answers document.",
+        )
+
+    def handle(self, *args, **options):
+        document = self._document(options["steps"], options["answers_per_step"])
+        iterations = options["iterations"]
+
+        variants = {
+            # What every save did before: deepcopy the schema, re-check it, rebuild a validator
+            "validate(get_answers_schema())": lambda: validate(document, get_answers_schema()),
+            "compiled validator": lambda: validate_document(document, get_answers_validator()),
+        }
+
+        timings = {}
+        for name, func in variants.items():
+            func()  # warm up (jsonschema caches format checkers lazily)
+            timings[name] = timeit.timeit(func, number=iterations) / iterations * 1000
+            self.stdout.write(f"{name:<32} {timings[name]:8.3f} ms/validation")
+
+        baseline, compiled = timings.values()
+        if compiled > 0:
+            self.stdout.write(self.style.SUCCESS(f"Speed-up: {baseline / compiled:.1f}x"))
+
+    @staticmethod
+    def _document(steps: int, answers_per_step: int) -> dict:
+        """Build a valid answers document of the requested size."""
+        return {
+            "schema_version": ANSWERS_SCHEMA_VERSION,
+            "active_step": 0,
+            "steps": [
+                {
+                    "is_valid": True,
+                    "answers": {f"{i % 5}-{i}": f"answer {i}" for i in range(answers_per_step)},
+                }
+                for _ in range(steps)
+            ],
+        }
@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from applications import uploads
+from applications.models import AttachmentUpload
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete resumable attachment uploads that were never finalised, along "
+        "with their stored chunks. Safe to run repeatedly (e.g. from cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=settings.ATTACHMENT_UPLOAD_EXPIRY_HOURS,
+            help="Purge uploads without activity for this many hours.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many uploads would be purged without deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["older_than"])
+        stale = AttachmentUpload.objects.filter(updated_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(f"Dry run complete. Stale uploads: {stale.count()}")
+            )
+            return
+
+        purged = 0
+        for upload in stale.iterator():
+            uploads.discard(upload)
+            upload.delete()
+            purged += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Purge complete. Uploads deleted: {purged}"))
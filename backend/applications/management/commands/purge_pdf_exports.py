@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from applications.models import PdfExportJob, PdfRenderJobStatus
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete finished bulk PDF exports along with their stored ZIP archives. "
+        "Safe to run repeatedly (e.g. from cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=settings.PDF_EXPORT_EXPIRY_HOURS,
+            help="Purge exports that finished more than this many hours ago.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many exports would be purged without deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["older_than"])
+        # Queued and running exports have no finished_at and are never purged.
+        expired = PdfExportJob.objects.filter(
+            status__in=[PdfRenderJobStatus.DONE, PdfRenderJobStatus.FAILED],
+            finished_at__lt=cutoff,
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(f"Dry run complete. Expired exports: {expired.count()}")
+            )
+            return
+
+        purged = 0
+        for job in expired.iterator():
+            # The post_delete signal removes the archive once this commits.
+            job.delete()
+            purged += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Purge complete. Exports deleted: {purged}"))
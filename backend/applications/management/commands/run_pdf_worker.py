@@ -0,0 +1,74 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from applications.models import PdfExportJob, PdfRenderJob, PdfRenderJobStatus
+
+
+class Command(BaseCommand):
+    help = (
+        "Render queued application PDFs and bulk exports in the background. "
+        "Polls the PdfRenderJob and PdfExportJob tables, so several workers can "
+        "run side by side without an external message broker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the queue and exit instead of polling forever.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.PDF_WORKER_POLL_INTERVAL,
+            help="Seconds to sleep when the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        self._stopping = False
+
+        # Finish the current job on SIGTERM/SIGINT so pods can shut down cleanly.
+        def _stop(*_args):
+            self._stopping = True
+
+        previous_handlers = {
+            signum: signal.signal(signum, _stop) for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            processed = self._work(options)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write(f"PDF worker stopped. Jobs processed: {processed}")
+
+    def _work(self, options):
+        """Claim and run jobs until stopped (or the queue drains with --once)."""
+        processed = 0
+        while not self._stopping:
+            # Long-running loop: drop connections the database may have closed.
+            close_old_connections()
+            # Single renders are quick and often awaited by a reviewer, so they go first.
+            claim = {
+                "stale_after": settings.PDF_JOB_STALE_AFTER,
+                "max_attempts": settings.PDF_JOB_MAX_ATTEMPTS,
+            }
+            job = PdfRenderJob.objects.claim_next(**claim) or PdfExportJob.objects.claim_next(**claim)
+
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            job.run(max_attempts=settings.PDF_JOB_MAX_ATTEMPTS)
+            processed += 1
+
+            style = self.style.SUCCESS if job.status == PdfRenderJobStatus.DONE else self.style.WARNING
+            self.stdout.write(style(f"{job}: attempt {job.attempts}"))
+
+        return processed
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from applications.models import Application, ApplicationStatus
+from applications.search import update_search_vector
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the full-text search vectors of submitted applications, e.g. "
+        "after deploying search or changing APPLICATION_SEARCH_CONFIG. Saves keep "
+        "them current afterwards. PostgreSQL only."
+    )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            self.stdout.write(
+                self.style.WARNING(f"Full-text search is not indexed on {connection.vendor}; nothing to do.")
+            )
+            return
+
+        applications = (
+            Application.objects.exclude(status=ApplicationStatus.DRAFT)
+            .select_related("owner", "questionnaire", "questionnaire__process")
+            .order_by("id")
+        )
+        updated = 0
+        for application in applications.iterator(chunk_size=500):
+            update_search_vector(application)
+            updated += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Search vectors rebuilt: {updated}"))
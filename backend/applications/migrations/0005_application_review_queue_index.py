@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_pdfrenderjob'),
+        ('questionnaires', '0005_questionnaire_code_not_null_and_unique_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(condition=models.Q(('status__in', ['ACTION_REQUIRED', 'SUBMITTED', 'UNDER_ASSESSMENT', 'UNDER_REVIEW'])), fields=['submitted_at', 'id'], name='apps_review_queue_idx'),
+        ),
+    ]
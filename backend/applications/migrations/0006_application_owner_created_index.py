@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_application_review_queue_index'),
+        ('questionnaires', '0005_questionnaire_code_not_null_and_unique_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['owner', 'created_at', 'id'], name='apps_owner_created_idx'),
+        ),
+    ]
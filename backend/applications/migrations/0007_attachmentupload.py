@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:39
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_application_owner_created_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttachmentUpload',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('key', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('question', models.CharField(max_length=100)),
+                ('name', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField(help_text='Declared total size in bytes.')),
+                ('received', models.PositiveBigIntegerField(default=0, editable=False)),
+                ('chunk_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('content_type', models.CharField(blank=True, default='', editable=False, max_length=100)),
+                ('attachment_key', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('file_name', models.CharField(blank=True, default='', editable=False, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('application', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='uploads', to='applications.application')),
+            ],
+        ),
+    ]
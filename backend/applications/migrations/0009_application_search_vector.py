@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:58
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+INDEX_NAME = "apps_search_vector_gin_idx"
+
+
+def create_search_index(apps, schema_editor):
+    """Create the GIN index behind full-text search (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = schema_editor.quote_name(apps.get_model("applications", "Application")._meta.db_table)
+    schema_editor.execute(f"CREATE INDEX {INDEX_NAME} ON {table} USING GIN (search_vector)")
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the full-text search index."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_pdfexportjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        # Backfill existing applications with `manage.py update_search_vectors`.
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
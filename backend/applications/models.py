@@ -1,17 +1,29 @@
 from __future__ import annotations
 
 import io
+import tempfile
 import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import timedelta
 from typing import Any
 
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import models, transaction
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django_jsonform.models.fields import JSONField
+from processes.access import can_review_process
+from questionnaires.compiled import get_compiled_questionnaire
 from users.models import User
 
-from .prince import Prince
+from .expressions import JSONSet
+from .pdf_assets import image_src, read_static_text, static_file_uri
+from .pdf_cache import get_cached_pdf, is_pdf_cacheable, pdf_digest, store_pdf
+from .prince import Prince, get_prince_pool
 from .schema import get_answers_schema
 
 
@@ -159,16 +171,9 @@ def _build_question_item(
             is_missing = False
 
             if is_image:
-                # For local storage Prince reads the file via a file:// URI.
-                # For Azure (or any remote storage) fall back to the signed URL
-                # and let Prince fetch it over HTTP(S) at render time.
-                try:
-                    file_src = "file://" + attachment.file.path
-                except (ValueError, NotImplementedError, OSError):
-                    try:
-                        file_src = attachment.file.url
-                    except Exception:  # noqa: BLE001
-                        is_missing = True
+                # A print-resolution derivative where possible (see pdf_assets).
+                file_src = image_src(attachment)
+                is_missing = not file_src
 
             file_item: dict[str, Any] = {
                 "name": name,
@@ -195,6 +200,29 @@ def _build_question_item(
     return item
 
 
+def convert_html_to_pdf(html: str, base_url: str | None = None) -> bytes:
+    """Convert rendered application HTML to PDF bytes with Prince XML.
+
+    Needs no database access, so bulk exports call it from worker threads;
+    concurrent calls share the per-process pool of warm renderers.
+    """
+    prince_bin = getattr(settings, "PRINCE_BIN", "prince")
+    # Reuse a warm renderer from the per-process pool when pooling is enabled.
+    pool = get_prince_pool(
+        prince_bin,
+        getattr(settings, "PRINCE_POOL_SIZE", 0),
+        queue_timeout=getattr(settings, "PRINCE_POOL_QUEUE_TIMEOUT", 30),
+        max_jobs=getattr(settings, "PRINCE_POOL_MAX_JOBS", 200),
+    )
+    # Prince returns raw PDF bytes when output is directed to stdout.
+    return Prince(prince_bin=prince_bin, pool=pool).from_string(
+        html,
+        # Base URL is required to resolve static assets like images and CSS.
+        options={"--baseurl": base_url} if base_url else {},
+        timeout=getattr(settings, "PRINCE_JOB_TIMEOUT", None),
+    )
+
+
 class ApplicationStatus(models.TextChoices):
     """Enumeration of possible application statuses."""
 
@@ -231,6 +259,14 @@ REVIEWER_SETTABLE_STATUSES = frozenset([
 ])
 
 
+class ApplicationManager(models.Manager):
+    """Default manager that leaves the full-text search vector in the database."""
+
+    def get_queryset(self):
+        # Only full-text searches read the vector, and they do so in SQL.
+        return super().get_queryset().defer("search_vector")
+
+
 class Application(models.Model):
     """Model to represent an application."""
 
@@ -265,10 +301,16 @@ class Application(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
     updated_at = models.DateTimeField(auto_now=True, editable=False)
     submitted_at = models.DateTimeField(blank=True, null=True, editable=False)
+    # Maintained by applications.search for submitted applications (PostgreSQL only).
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
+    objects = ApplicationManager()
 
     # Create multiple column indexes for:
     # - user, status, created_at DESC
     # - questionnaire, status, created_at DESC
+    # - user, created_at, id
+    # - submitted_at, id (review queue only)
     class Meta:
         ordering = ["-created_at"]
         indexes = [
@@ -280,6 +322,18 @@ class Application(models.Model):
                 fields=["questionnaire", "status", "-created_at"],
                 name="apps_questionnaire_status_idx",
             ),
+            # Keyset pagination of "my applications" on (created_at, id)
+            models.Index(
+                fields=["owner", "created_at", "id"],
+                name="apps_owner_created_idx",
+            ),
+            # Keyset pagination of the assessment queue on (submitted_at, id);
+            # partial so it only holds applications that are in the queue.
+            models.Index(
+                fields=["submitted_at", "id"],
+                name="apps_review_queue_idx",
+                condition=models.Q(status__in=sorted(REVIEW_QUEUE_STATUSES)),
+            ),
         ]
 
     def __str__(self):
@@ -313,43 +367,69 @@ class Application(models.Model):
             return True
 
         # Reviewers may read any application that belongs to a process they
-        # are authorised to review.  We use the M2M through table directly to
-        # avoid loading the full AuthorisationProcess object when only the
-        # group membership check is needed.
-        from processes.models import AuthorisationProcess  # noqa: PLC0415 — avoid circular import at module level
-
-        is_reviewer = (
-            AuthorisationProcess.assessor_groups.through.objects.filter(
-                authorisationprocess_id=self.questionnaire.process_id,
-                group_id__in=user.groups.values("id"),
-            ).exists()
-        )
-        return is_reviewer
-
-    @staticmethod
-    def _load_pdf_icon_css() -> str:
-        """Read the pre-generated iconify CSS for file-type icons and return it
-        as a safe string for inlining into the PDF template.
-
-        Reading at call-time means no server restart is needed when the CSS is
-        regenerated, and Prince never has to make an HTTP request to fetch it.
+        # are authorised to review (resolved once per request and cached).
+        return can_review_process(user, self.questionnaire.process_id)
+
+    def apply_answers_delta(
+        self,
+        step: int,
+        answers: dict[str, Any] | None = None,
+        is_valid: bool | None = models.NOT_PROVIDED,
+        active_step: int | None = None,
+    ) -> bool:
+        """Write answers for one step with a JSON path update in the database.
+
+        Only the touched paths are sent to the database, so the rest of the
+        document is neither serialised nor validated again. ``step`` may be one
+        past the last stored step to start the next one. The in-memory
+        ``document`` is patched the same way so the instance stays usable.
+
+        Returns False if the application is no longer a draft. Bypasses
+        ``save()``, which is fine as drafts have no cached PDFs to invalidate.
         """
-        from django.contrib.staticfiles.finders import find as find_static  # noqa: PLC0415
+        answers = answers or {}
+        steps = self.document["steps"]
+        document = models.F("document")
+
+        if step >= len(steps):
+            new_step = {
+                "is_valid": None if is_valid is models.NOT_PROVIDED else is_valid,
+                "answers": answers,
+            }
+            document = JSONSet(document, ["steps", len(steps)], new_step)
+        else:
+            for question_key, value in answers.items():
+                document = JSONSet(document, ["steps", step, "answers", question_key], value)
+            if is_valid is not models.NOT_PROVIDED:
+                document = JSONSet(document, ["steps", step, "is_valid"], is_valid)
+
+        if active_step is not None:
+            document = JSONSet(document, ["active_step"], active_step)
+
+        updated_at = timezone.now()
+        updated = Application.objects.filter(pk=self.pk, status=ApplicationStatus.DRAFT).update(
+            document=document,
+            updated_at=updated_at,
+        )
+        if not updated:
+            return False
 
-        css_path = find_static("pdf-icons.css")
-        if not css_path:
-            return ""
-        try:
-            with open(css_path, encoding="utf-8") as fh:
-                return fh.read()
-        except OSError:
-            return ""
+        # Mirror the database update on the loaded instance
+        if step >= len(steps):
+            steps.append(new_step)
+        else:
+            steps[step]["answers"].update(answers)
+            if is_valid is not models.NOT_PROVIDED:
+                steps[step]["is_valid"] = is_valid
+        if active_step is not None:
+            self.document["active_step"] = active_step
+        self.updated_at = updated_at
+        return True
 
     def build_pdf_context(self):
         """Build nested step/section/question data used by the PDF review template."""
-        questionnaire_document = self.questionnaire.document or {}
+        compiled = get_compiled_questionnaire(self.questionnaire)
         application_document = self.document or {}
-        questionnaire_steps = questionnaire_document.get("steps") or []
         application_steps = application_document.get("steps") or []
 
         # Resolve file upload answers once so repeated lookups stay deterministic.
@@ -359,7 +439,7 @@ class Application(models.Model):
         }
 
         steps = []
-        for step_index, step in enumerate(questionnaire_steps):
+        for step_index, step in enumerate(compiled.steps):
             step_state = (
                 application_steps[step_index]
                 if step_index < len(application_steps)
@@ -367,28 +447,24 @@ class Application(models.Model):
             )
             answers = step_state.get("answers") or {}
             step_payload = {
-                "title": step.get("title") or f"Step {step_index + 1}",
+                "title": step.title or f"Step {step_index + 1}",
                 "sections": [],
             }
 
-            for section_index, section in enumerate(step.get("sections") or []):
+            for section_index, section in enumerate(step.sections):
                 section_payload = {
                     "prefix": f"{chr(65 + section_index)})",
-                    "title": section.get("title") or f"Section {section_index + 1}",
-                    "description": section.get("description") or "",
+                    "title": section.title or f"Section {section_index + 1}",
+                    "description": section.description,
                     "questions": [],
                 }
 
-                for question_index, question in enumerate(
-                    section.get("questions") or []
-                ):
-                    answer_key = f"{section_index}-{question_index}"
-                    answer_value = answers.get(answer_key)
+                for question in section.questions:
                     section_payload["questions"].append(
                         _build_question_item(
-                            question,
-                            answer_value,
-                            question_index,
+                            question.definition,
+                            answers.get(question.answer_key),
+                            question.index,
                             attachments_by_key,
                         )
                     )
@@ -402,9 +478,9 @@ class Application(models.Model):
             "steps": steps,
             # file:// URI so Prince reads the logo directly from disk rather than
             # making an outbound HTTP request that fails behind the auth proxy.
-            "logo_src": f"file://{settings.STATIC_ROOT}/images/Government_of_Western_Australia_logo.png",
+            "logo_src": static_file_uri("images/Government_of_Western_Australia_logo.png"),
             # Inlined so Prince never needs to resolve an external stylesheet URL.
-            "pdf_icon_css": self._load_pdf_icon_css(),
+            "pdf_icon_css": read_static_text("pdf-icons.css"),
         }
 
     def render_pdf_html(self):
@@ -416,7 +492,6 @@ class Application(models.Model):
 
     def generate_pdf(self, request=None):
         """Render the application HTML and convert it to a PDF using Prince XML."""
-        prince_bin = getattr(settings, "PRINCE_BIN", "prince")
         html = self.render_pdf_html()
 
         # Write the HTML to a temporary file for debugging purposes (optional)
@@ -429,13 +504,27 @@ class Application(models.Model):
         # against the actual running Django host instead of a hardcoded dev address.
         base_url = request.build_absolute_uri("/") if request is not None else None
 
-        # Prince returns raw PDF bytes when output is directed to stdout.
-        pdf_bytes = Prince(prince_bin=prince_bin).from_string(
-            html,
-            # Base URL is required to resolve static assets like images and CSS.
-            options={"--baseurl": base_url} if base_url else {},
-        )
-        pdf_buffer = io.BytesIO(pdf_bytes)
+        pdf_buffer = io.BytesIO(convert_html_to_pdf(html, base_url))
+        pdf_buffer.seek(0)
+        return pdf_buffer
+
+    def get_pdf(self, request=None):
+        """Return the application PDF, reusing the cached artefact when its inputs are unchanged.
+
+        Drafts are always rendered fresh because their answers are still moving.
+        """
+        if not is_pdf_cacheable(self):
+            return self.generate_pdf(request=request)
+
+        # Take the digest before rendering so the artefact is filed under the
+        # inputs it was actually rendered from, even if an edit lands meanwhile.
+        digest = pdf_digest(self)
+        cached = get_cached_pdf(self, digest)
+        if cached is not None:
+            return cached
+
+        pdf_buffer = self.generate_pdf(request=request)
+        store_pdf(self, pdf_buffer.getvalue(), digest)
         pdf_buffer.seek(0)
         return pdf_buffer
 
@@ -512,3 +601,417 @@ class ApplicationAttachment(models.Model):
     def get_download_url(self, request):
         """Generate a download URL for this attachment."""
         return request.build_absolute_uri(f"/d/{self.application.key}/{self.key}")
+
+
+class AttachmentUpload(models.Model):
+    """A resumable attachment upload in progress (see ``applications.uploads``).
+
+    Chunks are written straight to the final storage path of the attachment
+    that finalising creates, so ``attachment_key`` is reserved up front.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    key = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="uploads",
+        editable=False,
+    )
+    question = models.CharField(max_length=100, blank=False, null=False)
+    name = models.CharField(max_length=255, blank=False, null=False)
+    size = models.PositiveBigIntegerField(help_text="Declared total size in bytes.")
+    received = models.PositiveBigIntegerField(default=0, editable=False)
+    chunk_count = models.PositiveIntegerField(default=0, editable=False)
+    content_type = models.CharField(max_length=100, blank=True, default="", editable=False)
+    attachment_key = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    file_name = models.CharField(max_length=255, blank=True, default="", editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+
+    def __str__(self):
+        return f"Upload {self.key} for Application {self.application_id} ({self.received}/{self.size})"
+
+    def save(self, *args, **kwargs):
+        """Reserve the attachment's storage path on first save."""
+        if not self.file_name:
+            self.file_name = attachment_upload_path(
+                ApplicationAttachment(application=self.application, key=self.attachment_key),
+                self.name,
+            )
+        super().save(*args, **kwargs)
+
+    @property
+    def is_complete(self) -> bool:
+        """Return True once every declared byte has been received."""
+        return self.received == self.size
+
+
+class PdfRenderJobStatus(models.TextChoices):
+    """Lifecycle of a queued PDF render."""
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class PdfJobQuerySet(models.QuerySet):
+    """Claiming of queued jobs, shared by the background PDF job tables."""
+
+    # Timestamp a running job keeps fresh; once it is older than ``stale_after``
+    # the worker running the job is presumed dead.
+    heartbeat_field = "started_at"
+
+    def claim_next(self, stale_after: int, max_attempts: int = 3) -> models.Model | None:
+        """Atomically mark the oldest runnable job as RUNNING and return it.
+
+        ``SKIP LOCKED`` lets several workers poll the same table without
+        blocking on each other. RUNNING jobs older than ``stale_after`` seconds
+        are treated as abandoned by a crashed worker and picked up again,
+        unless they have used up ``max_attempts``: a job that keeps killing its
+        worker (out of memory, a hung renderer) is marked FAILED instead.
+        """
+        now = timezone.now()
+        stale = models.Q(
+            status=PdfRenderJobStatus.RUNNING,
+            **{f"{self.heartbeat_field}__lt": now - timedelta(seconds=stale_after)},
+        )
+        self.filter(stale, attempts__gte=max_attempts).update(
+            status=PdfRenderJobStatus.FAILED,
+            error="The worker stopped while running this job on every attempt.",
+            finished_at=now,
+        )
+        runnable = models.Q(status=PdfRenderJobStatus.QUEUED) | (
+            stale & models.Q(attempts__lt=max_attempts)
+        )
+
+        with transaction.atomic():
+            job = (
+                self.select_for_update(skip_locked=True)
+                .filter(runnable)
+                .order_by("created_at")
+                .first()
+            )
+            if job is None:
+                return None
+
+            job.status = PdfRenderJobStatus.RUNNING
+            job.started_at = timezone.now()
+            job.attempts += 1
+            # auto_now heartbeats are refreshed by the save itself.
+            job.save(update_fields={"status", "started_at", "attempts", self.heartbeat_field})
+        return job
+
+
+class PdfRenderJobQuerySet(PdfJobQuerySet):
+    """Queue operations for background PDF rendering."""
+
+    def enqueue(self, application: Application, requested_by: User | None = None) -> PdfRenderJob:
+        """Queue a render for the application, reusing a pending job when one exists.
+
+        Only non-draft applications can be queued because the artefact lives in
+        the PDF cache. When the PDF for the current content is already cached,
+        the job is recorded as done immediately so pollers can download
+        straight away.
+        """
+        if not is_pdf_cacheable(application):
+            raise ValueError("Only submitted applications can be rendered in the background.")
+
+        pending = (
+            self.filter(
+                application=application,
+                status__in=[PdfRenderJobStatus.QUEUED, PdfRenderJobStatus.RUNNING],
+            )
+            .order_by("created_at")
+            .first()
+        )
+        if pending is not None:
+            return pending
+
+        digest = pdf_digest(application)
+        cached = get_cached_pdf(application, digest)
+        if cached is not None:
+            cached.close()
+            now = timezone.now()
+            return self.create(
+                application=application,
+                requested_by=requested_by,
+                status=PdfRenderJobStatus.DONE,
+                digest=digest,
+                started_at=now,
+                finished_at=now,
+            )
+
+        return self.create(application=application, requested_by=requested_by)
+
+
+class PdfRenderJob(models.Model):
+    """A request to render an application PDF outside the web request cycle.
+
+    Rows are claimed by the ``run_pdf_worker`` management command; finished
+    artefacts live in the PDF cache under ``digest``.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    key = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name="pdf_jobs",
+        editable=False,
+    )
+    requested_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=PdfRenderJobStatus.choices,
+        default=PdfRenderJobStatus.QUEUED,
+        editable=False,
+    )
+    digest = models.CharField(max_length=64, blank=True, default="", editable=False)
+    error = models.TextField(blank=True, default="", editable=False)
+    attempts = models.PositiveSmallIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    started_at = models.DateTimeField(blank=True, null=True, editable=False)
+    finished_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = PdfRenderJobQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "created_at"],
+                name="pdf_jobs_status_created_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"PDF render {self.key} for Application {self.application_id} ({self.status})"
+
+    def run(self, max_attempts: int = 3) -> None:
+        """Render the PDF into the cache and record the outcome on the job row.
+
+        Failures are requeued until ``max_attempts`` is reached so a transient
+        renderer crash does not strand the job.
+        """
+        application = Application.objects.select_related(
+            "questionnaire", "questionnaire__process", "owner"
+        ).get(pk=self.application_id)
+
+        try:
+            # Take the digest first so the job points at the artefact it produced.
+            self.digest = pdf_digest(application)
+            cached = get_cached_pdf(application, self.digest)
+            if cached is not None:
+                cached.close()
+            else:
+                store_pdf(application, application.generate_pdf().getvalue(), self.digest)
+        except Exception as error:  # noqa: BLE001 — any renderer failure is recorded on the job
+            self.error = str(error)[:2000]
+            self.status = (
+                PdfRenderJobStatus.QUEUED
+                if self.attempts < max_attempts
+                else PdfRenderJobStatus.FAILED
+            )
+        else:
+            self.error = ""
+            self.status = PdfRenderJobStatus.DONE
+
+        self.finished_at = timezone.now() if self.status != PdfRenderJobStatus.QUEUED else None
+        self.save(update_fields=["digest", "error", "status", "finished_at"])
+
+    def open_pdf(self):
+        """Open the rendered PDF, or return None when it is missing or superseded."""
+        if self.status != PdfRenderJobStatus.DONE or not self.digest:
+            return None
+        return get_cached_pdf(self.application, self.digest)
+
+
+class PdfExportJobQuerySet(PdfJobQuerySet):
+    """Queue operations for bulk PDF exports."""
+
+    # Exports outlast ``PDF_JOB_STALE_AFTER``; each finished PDF refreshes ``updated_at``.
+    heartbeat_field = "updated_at"
+
+    def enqueue(self, applications, requested_by: User | None = None) -> PdfExportJob:
+        """Queue an export of ``applications`` (a queryset or iterable of applications)."""
+        application_ids = sorted({application.pk for application in applications})
+        if not application_ids:
+            raise ValueError("Select at least one application to export.")
+
+        with transaction.atomic():
+            job = self.create(requested_by=requested_by, total=len(application_ids))
+            job.applications.set(application_ids)
+        return job
+
+
+class PdfExportJob(models.Model):
+    """A bulk export of application PDFs into one ZIP archive, e.g. for a committee pack.
+
+    Rows are claimed by the ``run_pdf_worker`` management command alongside
+    single renders. Progress (``completed`` and ``failed`` out of ``total``)
+    is saved as each PDF finishes so clients can poll it.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    key = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    applications = models.ManyToManyField(Application, related_name="+", editable=False)
+    requested_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+        editable=False,
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=PdfRenderJobStatus.choices,
+        default=PdfRenderJobStatus.QUEUED,
+        editable=False,
+    )
+    total = models.PositiveIntegerField(default=0, editable=False)
+    completed = models.PositiveIntegerField(default=0, editable=False)
+    failed = models.PositiveIntegerField(default=0, editable=False)
+    file_name = models.CharField(max_length=255, blank=True, default="", editable=False)
+    error = models.TextField(blank=True, default="", editable=False)
+    attempts = models.PositiveSmallIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    started_at = models.DateTimeField(blank=True, null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+    finished_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = PdfExportJobQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "created_at"],
+                name="pdf_exports_status_created_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"PDF export {self.key} of {self.total} applications ({self.status})"
+
+    @staticmethod
+    def archive_name(application: Application) -> str:
+        """Return the ZIP member name of an application's PDF."""
+        # Submitted internal IDs carry a "/yy-mm" suffix, which ZIP tools read as a folder.
+        return f"{application.internal_id.replace('/', '_')}.pdf"
+
+    def run(self, max_attempts: int = 3) -> None:
+        """Render every application into a ZIP archive and record progress on the row.
+
+        Cached PDFs are copied as they are. The rest have their HTML rendered
+        here (it reads the database) and converted by Prince on up to
+        ``PDF_EXPORT_CONCURRENCY`` threads, which share this process's pool
+        of warm renderers (and are capped at its size, so no thread times out
+        queueing for a renderer). An application that fails to render is listed in
+        ``errors.txt`` inside the archive instead of failing the export.
+        """
+        applications = (
+            Application.objects.filter(pk__in=self.applications.values("pk"))
+            .select_related("questionnaire", "questionnaire__process", "owner")
+            .order_by("submitted_at", "id")
+        )
+        self.completed = self.failed = 0
+        failures = []
+
+        def fail(application: Application, error: Exception) -> None:
+            """Count an application that could not be rendered and note why."""
+            failures.append(f"{application.internal_id}: {error}")
+            self.failed += 1
+            self.save(update_fields=["completed", "failed", "updated_at"])
+
+        def record(application: Application, digest: str | None, render) -> None:
+            """Add one finished render (a callable returning PDF bytes) to the archive."""
+            try:
+                pdf_bytes = render()
+            except Exception as error:  # noqa: BLE001 — one broken application must not sink the pack
+                fail(application, error)
+                return
+            if digest is not None:
+                store_pdf(application, pdf_bytes, digest)
+            archive.writestr(self.archive_name(application), pdf_bytes)
+            self.completed += 1
+            self.save(update_fields=["completed", "failed", "updated_at"])
+
+        try:
+            workers = max(1, settings.PDF_EXPORT_CONCURRENCY)
+            if settings.PRINCE_POOL_SIZE > 0:
+                # Threads beyond the pool would only wait for a renderer, and
+                # fail the application once PRINCE_POOL_QUEUE_TIMEOUT runs out.
+                workers = min(workers, settings.PRINCE_POOL_SIZE)
+            with (
+                tempfile.TemporaryFile() as output,
+                ThreadPoolExecutor(max_workers=workers) as executor,
+            ):
+                # PDFs are already compressed; storing them keeps the worker's CPU for Prince.
+                with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as archive:
+                    in_flight = {}
+                    for application in applications:
+                        digest = pdf_digest(application) if is_pdf_cacheable(application) else None
+                        cached = get_cached_pdf(application, digest) if digest else None
+                        if cached is not None:
+                            with cached:
+                                record(application, None, cached.read)
+                            continue
+
+                        try:
+                            html = application.render_pdf_html()
+                        except Exception as error:  # noqa: BLE001
+                            fail(application, error)
+                            continue
+                        in_flight[executor.submit(convert_html_to_pdf, html)] = (application, digest)
+
+                        # Bound the finished PDFs held in memory to a couple per thread.
+                        if len(in_flight) >= workers * 2:
+                            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                record(*in_flight.pop(future), future.result)
+
+                    for future in as_completed(in_flight):
+                        record(*in_flight[future], future.result)
+
+                    if failures:
+                        archive.writestr("errors.txt", "\n".join(failures) + "\n")
+
+                output.seek(0)
+                self.file_name = default_storage.save(f"pdf-exports/{self.key}.zip", File(output))
+        except Exception as error:  # noqa: BLE001 — storage failures are recorded on the job
+            self.error = str(error)[:2000]
+            self.status = (
+                PdfRenderJobStatus.QUEUED
+                if self.attempts < max_attempts
+                else PdfRenderJobStatus.FAILED
+            )
+        else:
+            self.error = "\n".join(failures)[:2000]
+            self.status = PdfRenderJobStatus.DONE
+
+        self.finished_at = timezone.now() if self.status != PdfRenderJobStatus.QUEUED else None
+        self.save(
+            update_fields=["completed", "failed", "file_name", "error", "status", "updated_at", "finished_at"]
+        )
+
+    def open_archive(self):
+        """Open the finished ZIP archive, or return None when it is missing."""
+        if self.status != PdfRenderJobStatus.DONE or not self.file_name:
+            return None
+        try:
+            return default_storage.open(self.file_name, "rb")
+        except FileNotFoundError:
+            return None
+
+    def delete_archive(self) -> None:
+        """Delete the stored ZIP archive, if there is one."""
+        if self.file_name:
+            default_storage.delete(self.file_name)
@@ -0,0 +1,166 @@
+"""Assets embedded in application PDFs.
+
+Static assets (the file-type icon CSS and the logo) are resolved and read
+once per process and re-read only when the file's mtime changes, so a
+regenerated file is picked up without a restart.
+
+Image attachments are handed to Prince as print-resolution derivatives
+instead of the originals (up to ``UPLOAD_MAX_SIZE`` each): Prince then
+decodes and embeds a small JPEG or PNG rather than a full-size photo. A
+derivative is generated on the first render that needs it and stored next
+to the original, so later renders (and the background PDF worker, which
+renders on submit) reuse it. Images Pillow cannot read are embedded as
+uploaded.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.contrib.staticfiles.finders import find as find_static
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+if TYPE_CHECKING:
+    from .models import ApplicationAttachment
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the stored print derivative of an attachment file
+DERIVATIVE_SUFFIX = ".print"
+
+_paths: dict[str, str] = {}
+_texts: dict[str, tuple[float, str]] = {}
+_static_lock = threading.Lock()
+
+
+def _find_static_path(name: str) -> str | None:
+    """Return the file system path of static file ``name``, or None."""
+    # Finders cover development (app and frontend dist directories); the
+    # collected copy in STATIC_ROOT covers deployments without them.
+    path = find_static(name)
+    if path:
+        return path
+    collected = os.path.join(settings.STATIC_ROOT, name)
+    return collected if os.path.isfile(collected) else None
+
+
+def _static_path(name: str) -> str | None:
+    """Return the cached path of static file ``name``, resolving it again if it went away."""
+    with _static_lock:
+        path = _paths.get(name)
+    if path is not None and os.path.isfile(path):
+        return path
+
+    path = _find_static_path(name)
+    with _static_lock:
+        if path is None:
+            _paths.pop(name, None)
+        else:
+            _paths[name] = path
+    return path
+
+
+def read_static_text(name: str) -> str:
+    """Return the text of static file ``name`` ("" when missing), re-read only when its mtime changes."""
+    path = _static_path(name)
+    if path is None:
+        return ""
+    try:
+        mtime = os.stat(path).st_mtime
+        with _static_lock:
+            cached = _texts.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path, encoding="utf-8") as fh:
+            text = fh.read()
+    except OSError:
+        return ""
+
+    with _static_lock:
+        _texts[path] = (mtime, text)
+    return text
+
+
+def static_file_uri(name: str) -> str:
+    """Return a ``file://`` URI of static file ``name`` for Prince to read from disk."""
+    path = _static_path(name) or os.path.join(settings.STATIC_ROOT, name)
+    return f"file://{path}"
+
+
+def clear_static_cache() -> None:
+    """Forget the cached static asset paths and contents of this process."""
+    with _static_lock:
+        _paths.clear()
+        _texts.clear()
+
+
+def _storage_src(storage, name: str) -> str:
+    """Return the URI Prince should load a stored file from."""
+    # Local storage: Prince reads the file via a file:// URI. For Azure (or
+    # any remote storage) fall back to the signed URL and let Prince fetch
+    # it over HTTP(S) at render time.
+    try:
+        return "file://" + storage.path(name)
+    except (ValueError, NotImplementedError, OSError):
+        return storage.url(name)
+
+
+def derivative_name(attachment: ApplicationAttachment) -> str:
+    """Return the storage name of the attachment's print derivative."""
+    return attachment.file.name + DERIVATIVE_SUFFIX
+
+
+def derivative_fingerprint() -> list:
+    """Return what decides the embedded images, for the PDF cache key."""
+    return [settings.PDF_IMAGE_MAX_DIMENSION, settings.PDF_IMAGE_QUALITY]
+
+
+def make_print_derivative(source) -> bytes:
+    """Return ``source`` downscaled to ``PDF_IMAGE_MAX_DIMENSION`` pixels, re-encoded for print.
+
+    Photos become JPEGs; images with transparency stay PNGs so cut-outs and
+    diagrams keep their background.
+    """
+    with Image.open(source) as image:
+        # Phones store portrait photos sideways plus an EXIF rotation flag.
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((settings.PDF_IMAGE_MAX_DIMENSION, settings.PDF_IMAGE_MAX_DIMENSION))
+        output = io.BytesIO()
+        if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+            image.save(output, format="PNG", optimize=True)
+        else:
+            image.convert("RGB").save(
+                output, format="JPEG", quality=settings.PDF_IMAGE_QUALITY, optimize=True
+            )
+    return output.getvalue()
+
+
+def image_src(attachment: ApplicationAttachment) -> str:
+    """Return the URI of the image to embed for ``attachment`` ("" if it cannot be read).
+
+    Generates and stores the print derivative on first use, and falls back
+    to the original when the image cannot be read.
+    """
+    storage = attachment.file.storage
+    name = derivative_name(attachment)
+    try:
+        if not storage.exists(name):
+            with attachment.file.open("rb") as original:
+                derivative = make_print_derivative(original)
+            # If a concurrent render saved it meanwhile, storage picks a free
+            # name and this render uses its own copy.
+            name = storage.save(name, ContentFile(derivative))
+        return _storage_src(storage, name)
+    except Exception:  # noqa: BLE001 — any unreadable image falls back to the original
+        logger.warning("Could not create a print derivative of %s", attachment.file.name, exc_info=True)
+
+    try:
+        return _storage_src(storage, attachment.file.name)
+    except Exception:  # noqa: BLE001
+        return ""
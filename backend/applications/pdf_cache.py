@@ -0,0 +1,151 @@
+"""Content-addressed cache for rendered application PDFs.
+
+Once an application leaves DRAFT its answers, questionnaire version and
+attachments are effectively immutable, so the rendered PDF can be reused until
+one of its inputs changes. Each artefact is stored in the private media storage
+under a digest of everything the PDF template reads; a changed input produces a
+new digest, so a stale artefact can never be served. Superseded artefacts are
+removed by ``invalidate_pdf_cache`` when the application or its attachments are
+saved.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.template.loader import get_template
+
+from .pdf_assets import derivative_fingerprint
+
+if TYPE_CHECKING:
+    from .models import Application
+
+logger = logging.getLogger(__name__)
+
+PDF_TEMPLATE_NAME = "application-pdf-template.html"
+
+
+@lru_cache(maxsize=1)
+def _template_fingerprint() -> str:
+    """Return a digest of the PDF template source and the deployed app version.
+
+    Computed once per process: templates only change on deploy, which also
+    restarts the workers.
+    """
+    source = get_template(PDF_TEMPLATE_NAME).template.source
+    return hashlib.sha256(f"{settings.APP_VERSION}\0{source}".encode("utf-8")).hexdigest()
+
+
+def is_pdf_cacheable(application: Application) -> bool:
+    """Only cache applications whose answers can no longer be edited."""
+    from .models import ApplicationStatus  # noqa: PLC0415 — avoid circular import at module level
+
+    return application.status != ApplicationStatus.DRAFT
+
+
+def pdf_digest(application: Application) -> str:
+    """Return the content address of the PDF rendered for ``application``.
+
+    Covers every value the PDF template displays: the answers document, the
+    questionnaire version and its metadata, the status/submission stamp that
+    makes up ``internal_id``, and the non-deleted attachments by key and name.
+    """
+    questionnaire = application.questionnaire
+    process = questionnaire.process
+    attachments = sorted(
+        application.attachments.filter(is_deleted=False).values_list("key", "name")
+    )
+
+    payload = {
+        "template": _template_fingerprint(),
+        "application": [application.id, application.status, application.submitted_at],
+        "document": application.document,
+        "questionnaire": [
+            questionnaire.id,
+            questionnaire.version,
+            questionnaire.name,
+            questionnaire.updated_at,
+        ],
+        "process": [process.slug, process.name, process.description],
+        "attachments": attachments,
+        # Image derivatives change the embedded pictures.
+        "images": derivative_fingerprint(),
+    }
+    encoded = json.dumps(payload, cls=DjangoJSONEncoder, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def pdf_cache_dir(application: Application) -> str:
+    """Return the storage directory holding cached PDFs, next to the attachments."""
+    created_month = application.created_at.strftime("%Y-%m")
+    return f"attachments/{created_month}/{application.key}/pdf"
+
+
+def pdf_cache_path(application: Application, digest: str | None = None) -> str:
+    """Return the storage path of the cached PDF for the current content digest."""
+    return f"{pdf_cache_dir(application)}/{digest or pdf_digest(application)}.pdf"
+
+
+def get_cached_pdf(application: Application, digest: str | None = None) -> IO[bytes] | None:
+    """Open the cached PDF for the application's current content, if present."""
+    if not is_pdf_cacheable(application):
+        return None
+
+    path = pdf_cache_path(application, digest)
+    if not default_storage.exists(path):
+        return None
+    return default_storage.open(path, "rb")
+
+
+def store_pdf(application: Application, pdf_bytes: bytes, digest: str | None = None) -> str | None:
+    """Persist rendered PDF bytes under the application's content digest.
+
+    ``digest`` should be computed before rendering when the caller can race
+    with edits, so the artefact is filed under the inputs it was rendered from.
+    """
+    if not is_pdf_cacheable(application):
+        return None
+
+    path = pdf_cache_path(application, digest)
+    # Identical digests render identical bytes, so an existing file is reusable.
+    if default_storage.exists(path):
+        return path
+    return default_storage.save(path, ContentFile(pdf_bytes))
+
+
+def invalidate_pdf_cache(application: Application) -> None:
+    """Delete cached PDFs that no longer match the application's content.
+
+    Failures are logged rather than raised: a leftover artefact is harmless
+    because it can never match a future digest.
+    """
+    # Drafts are never cached and only move forward, so there is nothing to clean up.
+    if not is_pdf_cacheable(application):
+        return
+
+    directory = pdf_cache_dir(application)
+    current = f"{pdf_digest(application)}.pdf"
+
+    try:
+        _, files = default_storage.listdir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    except Exception:  # noqa: BLE001 — storage backends raise their own error types
+        logger.warning("Could not list cached PDFs in %s", directory, exc_info=True)
+        return
+
+    for name in files:
+        if name == current:
+            continue
+        try:
+            default_storage.delete(f"{directory}/{name}")
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not delete cached PDF %s/%s", directory, name, exc_info=True)
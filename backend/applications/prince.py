@@ -1,15 +1,260 @@
 # -*- coding: utf-8 -*-
 
 import copy
+import json
 import logging
+import os
+import queue
+import select
 import subprocess
+import threading
+import time
 
 logger = logging.getLogger('pyprince')
 
 
+class PrinceError(Exception):
+    """Raised when Prince fails, or the control protocol breaks down."""
+
+
+class PrinceConversionError(PrinceError):
+    """Raised when Prince reports a failed conversion; the renderer stays usable."""
+
+
+class PrincePoolTimeout(Exception):
+    """Raised when no warm renderer becomes available within the queue timeout."""
+
+
+class PrinceControl(object):
+    """
+    A single long-lived ``prince --control`` process.
+
+    The control protocol exchanges length-prefixed chunks over stdin/stdout
+    (a ``<tag> <length>`` header line, the data, then a newline), so one warm
+    process can convert many documents without paying process startup and font
+    loading on each job.
+    """
+
+    def __init__(self, prince_bin):
+        self.prince_bin = prince_bin
+        self.jobs_done = 0
+        self.version = None
+        self._process = subprocess.Popen(
+            [prince_bin, "--control"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        # Prince announces itself with a version chunk once it is ready.
+        tag, data = self._read_chunk(deadline=time.monotonic() + 30)
+        if tag != "ver":
+            self.close()
+            raise PrinceError("Unexpected Prince control handshake: %r" % tag)
+        self.version = data.decode("utf-8", "replace")
+
+    def is_alive(self):
+        return self._process.poll() is None
+
+    def close(self):
+        """
+        Ask Prince to exit, killing it if it does not go quietly.
+        """
+        if self.is_alive():
+            try:
+                self._write_chunk("end", b"")
+                self._process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+
+    def _write_chunk(self, tag, data):
+        self._process.stdin.write(b"%s %d\n" % (tag.encode("ascii"), len(data)))
+        self._process.stdin.write(data)
+        self._process.stdin.write(b"\n")
+        self._process.stdin.flush()
+
+    def _read_exact(self, size, deadline):
+        """
+        Read exactly ``size`` bytes from stdout, giving up at ``deadline``.
+        """
+        fd = self._process.stdout.fileno()
+        buffer = bytearray()
+        while len(buffer) < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.prince_bin, 0)
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                continue
+            data = os.read(fd, size - len(buffer))
+            if not data:
+                raise PrinceError("Prince control process closed its output")
+            buffer.extend(data)
+        return bytes(buffer)
+
+    def _read_chunk(self, deadline):
+        header = bytearray()
+        while not header.endswith(b"\n"):
+            header.extend(self._read_exact(1, deadline))
+            if len(header) > 32:
+                raise PrinceError("Malformed Prince control chunk header")
+        tag, _, length = header.decode("ascii").strip().partition(" ")
+        data = self._read_exact(int(length), deadline)
+        # Every chunk is terminated by a newline that is not part of the data.
+        self._read_exact(1, deadline)
+        return tag, data
+
+    @staticmethod
+    def _log_error(data):
+        """
+        Return the error messages of a control log chunk as one string.
+
+        Log lines look like ``msg|err|<location>|<text>`` or ``fin|failure``.
+        """
+        errors = []
+        for line in data.decode("utf-8", "replace").splitlines():
+            fields = line.split("|")
+            if fields[:2] == ["msg", "err"]:
+                errors.append("|".join(fields[2:]).strip("|"))
+        return "; ".join(errors) or "Prince conversion failed"
+
+    def convert(self, input_data, job, timeout=None):
+        """
+        Convert one HTML document and return the PDF bytes.
+
+        On timeout the process is killed so a wedged renderer can never be
+        handed to the next job.
+        """
+        timeout = timeout or 300
+        deadline = time.monotonic() + timeout
+        job = dict(job, **{"job-resource-count": 1})
+        job["input"] = dict(job.get("input") or {}, src="job-resource:0")
+
+        try:
+            self._write_chunk("job", json.dumps(job).encode("utf-8"))
+            self._write_chunk("dat", input_data)
+            tag, data = self._read_chunk(deadline)
+            if tag == "pdf":
+                # The log chunk always follows a successful conversion.
+                self._read_chunk(deadline)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+            raise subprocess.TimeoutExpired(self.prince_bin, timeout)
+        finally:
+            self.jobs_done += 1
+
+        if tag == "pdf":
+            return data
+        if tag == "err":
+            raise PrinceConversionError(data.decode("utf-8", "replace"))
+        if tag == "log":
+            # A failed conversion is reported by a log chunk alone, without a PDF.
+            raise PrinceConversionError(self._log_error(data))
+        # Anything else leaves the protocol in an unknown state.
+        self.close()
+        raise PrinceError("Unexpected Prince control response: %r" % tag)
+
+
+class PrincePool(object):
+    """
+    A bounded pool of warm ``PrinceControl`` renderers.
+
+    At most ``size`` jobs render concurrently; further callers wait up to
+    ``queue_timeout`` seconds for a free renderer. Renderers are health checked
+    before reuse and recycled after ``max_jobs`` conversions.
+    """
+
+    def __init__(self, prince_bin, size=1, queue_timeout=30, max_jobs=200):
+        self.prince_bin = prince_bin
+        self.size = size
+        self.queue_timeout = queue_timeout
+        self.max_jobs = max_jobs
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = queue.LifoQueue()
+
+    def _checkout(self):
+        """
+        Return a healthy idle renderer, starting a new one when none is left.
+        """
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return PrinceControl(self.prince_bin)
+
+            if worker.is_alive() and worker.jobs_done < self.max_jobs:
+                return worker
+            worker.close()
+
+    def render(self, input_data, job, timeout=None):
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise PrincePoolTimeout(
+                "No Prince renderer became available within %ss" % self.queue_timeout
+            )
+
+        try:
+            worker = self._checkout()
+            try:
+                pdf = worker.convert(input_data, job, timeout=timeout)
+            except PrinceConversionError:
+                # A reported conversion error leaves the renderer usable.
+                self._idle.put(worker)
+                raise
+            except Exception:
+                # Anything else (a closed pipe, a malformed chunk) may leave the
+                # renderer dead or out of step with the protocol.
+                worker.close()
+                raise
+            self._idle.put(worker)
+            return pdf
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_prince_pool(prince_bin, size, **kwargs):
+    """
+    Return the process-wide renderer pool, or None when pooling is disabled.
+
+    The pool is keyed on the current PID so gunicorn workers forked from a
+    preloaded master never share the master's pipes.
+    """
+    global _pool, _pool_pid
+
+    if size <= 0:
+        return None
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = PrincePool(prince_bin, size=size, **kwargs)
+            _pool_pid = os.getpid()
+        return _pool
+
+
 class Prince(object):
-    def __init__(self, prince_bin, options=None):
+    # Command line options the control protocol job JSON can express.
+    _CONTROL_INPUT_OPTIONS = {
+        "--baseurl": "base",
+        "--media": "media",
+        "--style": "styles",
+        "--javascript": "javascript",
+    }
+
+    def __init__(self, prince_bin, options=None, pool=None):
         self.prince_bin = prince_bin
+        self.pool = pool
         self.options = self._prepare_options(options)
 
         # if output is not specified use standard output by default
@@ -78,11 +323,38 @@ class Prince(object):
         # cause Prince to write to the standard output stream.
         return options["--output"] == "-"
 
+    def _control_job(self, options):
+        """
+        Translate command line options into a control protocol job, or return
+        None when an option has no job equivalent.
+        """
+        job_input = {"type": "html"}
+        for key, arg in options.items():
+            if key == "--output":
+                continue
+            if key not in self._CONTROL_INPUT_OPTIONS:
+                return None
+            if key == "--javascript":
+                job_input["javascript"] = True
+            elif key == "--style":
+                job_input["styles"] = arg if isinstance(arg, list) else [arg]
+            else:
+                job_input[self._CONTROL_INPUT_OPTIONS[key]] = arg
+        return {"input": job_input}
+
     def _to_pdf(self, files=None, input_data=None, extra_options=None, timeout=None):
         options = copy.copy(self.options)
         if extra_options:
             options.update(self._prepare_options(extra_options))
 
+        # Prefer a warm pooled renderer for in-memory documents written to stdout.
+        if self.pool is not None and input_data and not files and self._is_stdout(options):
+            job = self._control_job(options)
+            if job is not None:
+                if not isinstance(input_data, bytes):
+                    input_data = input_data.encode("utf-8")
+                return self.pool.render(input_data, job, timeout=timeout)
+
         args = self._command_args(files, input_data, options)
 
         logger.debug(' '.join(args))
@@ -3,6 +3,8 @@ from copy import deepcopy
 from frozendict import frozendict
 from jsonschema import Draft202012Validator
 
+from api.schema_registry import register_schema
+
 _PRIMITIVE_TYPES = [
     {"type": "string"},
     {"type": "integer", "minimum": 0},
@@ -108,5 +110,29 @@ def get_answers_schema() -> dict:
     return schema
 
 
-# Do check the schema validation at the startup
-Draft202012Validator.check_schema(get_answers_schema())
+# Current version stamped on newly created answer documents
+ANSWERS_SCHEMA_VERSION: str = _SCHEMA_ANSWERS["properties"]["schema_version"]["default"]
+
+# Do check the schema validation at the startup, and keep the compiled validator
+_ANSWERS_VALIDATOR = register_schema(get_answers_schema())
+
+
+def get_answers_validator() -> Draft202012Validator:
+    """Return the shared compiled validator for the current answers schema."""
+    return _ANSWERS_VALIDATOR
+
+
+# The "answers" definition on its own, for validating per-step answer deltas
+# without re-validating (or even loading) the rest of the document.
+_ANSWERS_DELTA_VALIDATOR = Draft202012Validator(
+    {
+        "$schema": _SCHEMA_ANSWERS["$schema"],
+        "$ref": "#/$defs/answers",
+        "$defs": _SCHEMA_ANSWERS["$defs"],
+    }
+)
+
+
+def get_answers_delta_validator() -> Draft202012Validator:
+    """Return the compiled validator for a single step's ``answers`` object."""
+    return _ANSWERS_DELTA_VALIDATOR
@@ -0,0 +1,98 @@
+"""Full-text search over application answers.
+
+On PostgreSQL every submitted application keeps a ``tsvector`` of its
+internal ID, applicant username and answer text in ``search_vector``,
+covered by a GIN index, so a search is an index lookup. The vector is
+refreshed whenever the application or one of its attachments is saved.
+Drafts are not indexed: their answers change with every keystroke and
+reviewers never see them.
+
+Other databases (SQLite in tests) fall back to case-insensitive substring
+matches on the same fields.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connections
+from django.db.models import Q, QuerySet, Value
+from questionnaires.compiled import get_compiled_questionnaire
+
+from .exports import answer_columns
+from .models import Application, ApplicationStatus
+
+
+def _is_postgresql(using: str) -> bool:
+    """Return True when database alias ``using`` is PostgreSQL."""
+    return connections[using].vendor == "postgresql"
+
+
+def search_text(application: Application) -> tuple[str, str]:
+    """Return the ``(identity, answers)`` text indexed for ``application``.
+
+    Answers are flattened like the CSV export: grid cells, attached file
+    names and every other answer as displayed.
+    """
+    identity = f"{application.internal_id} {application.owner.username}"
+
+    compiled = get_compiled_questionnaire(application.questionnaire)
+    steps = (application.document or {}).get("steps") or []
+    names = {
+        str(key): name
+        for key, name in application.attachments.filter(is_deleted=False).values_list("key", "name")
+    }
+
+    texts = []
+    for question in compiled.questions.values():
+        step = steps[question.step] if question.step < len(steps) else {}
+        answer = ((step or {}).get("answers") or {}).get(question.answer_key)
+        # Unanswered checkboxes would index a "No" for every application.
+        if answer is None or answer == "":
+            continue
+        for _, extract in answer_columns(question):
+            texts.append(extract(answer, names))
+    return identity, "\n".join(text for text in texts if text)
+
+
+def update_search_vector(application: Application) -> None:
+    """Rebuild the search vector of ``application`` (PostgreSQL only; drafts are skipped)."""
+    using = application._state.db or "default"
+    if not _is_postgresql(using) or application.status == ApplicationStatus.DRAFT:
+        return
+
+    identity, answers = search_text(application)
+    config = settings.APPLICATION_SEARCH_CONFIG
+    # Identity matches outrank answer matches when results are ranked.
+    Application.objects.using(using).filter(pk=application.pk).update(
+        search_vector=SearchVector(Value(identity), weight="A", config=config)
+        + SearchVector(Value(answers), weight="B", config=config)
+    )
+
+
+def search_applications(queryset: QuerySet[Application], query: str) -> QuerySet[Application]:
+    """Filter ``queryset`` to applications matching the free-text ``query``.
+
+    PostgreSQL accepts web-search syntax ("quoted phrases", ``or``, ``-term``);
+    elsewhere every word must appear in the answers, username or process slug.
+    """
+    query = query.strip()
+    if not query:
+        return queryset
+
+    if _is_postgresql(queryset.db):
+        return queryset.filter(
+            search_vector=SearchQuery(
+                query,
+                config=settings.APPLICATION_SEARCH_CONFIG,
+                search_type="websearch",
+            )
+        )
+
+    for term in query.split():
+        queryset = queryset.filter(
+            Q(document__icontains=term)
+            | Q(owner__username__icontains=term)
+            | Q(questionnaire__process__slug__icontains=term)
+        )
+    return queryset
@@ -2,13 +2,16 @@ import re
 from mimetypes import guess_file_type
 from os import path
 
-import requests
+from api.schema_registry import validate_document
 from api.serialisers import JsonSchemaSerialiserMixin
 from django.conf import settings
 from django.db import IntegrityError, transaction
 from django.template.defaultfilters import filesizeformat
+from django.urls import reverse
 from pyfsig import find_matches_for_file_header
+from questionnaires.compiled import CompiledQuestion, get_compiled_questionnaire
 from questionnaires.models import Questionnaire
+from jsonschema import ValidationError as JSONSchemaValidationError
 from rest_framework import exceptions, serializers, status
 
 from .models import (
@@ -17,53 +20,15 @@ from .models import (
     Application,
     ApplicationAttachment,
     ApplicationStatus,
+    AttachmentUpload,
+    PdfExportJob,
+    PdfRenderJob,
+    PdfRenderJobStatus,
 )
-from .schema import get_answers_schema
-
-
-def verify_turnstile_token(
-    token: str,
-    remote_ip: str | None = None,
-    idempotency_key: str | None = None,
-) -> bool:
-    """Verify a Turnstile token against Cloudflare Siteverify.
-
-    The application create flow should fail closed: if the service is not
-    configured, the token is missing, or the verification request fails, the
-    token is treated as invalid and application creation is rejected.
-    """
-    secret_key = settings.TURNSTILE_SECRET_KEY
-
-    if not secret_key or not token:
-        return False
-
-    payload = {
-        "secret": secret_key,
-        "response": token,
-    }
-
-    # Include the client IP when available so Siteverify can evaluate the
-    # token in the same request context that produced it.
-    if remote_ip:
-        payload["remoteip"] = remote_ip
-
-    # Reuse the same idempotency key for retry-safe validations of the same
-    # submission attempt.
-    if idempotency_key:
-        payload["idempotency_key"] = idempotency_key
-
-    try:
-        response = requests.post(
-            "https://challenges.cloudflare.com/turnstile/v0/siteverify",
-            data=payload,
-            timeout=5,
-        )
-        response.raise_for_status()
-        response_data = response.json()
-    except (requests.RequestException, ValueError):
-        return False
-
-    return bool(response_data.get("success"))
+from .pdf_cache import invalidate_pdf_cache
+from .schema import ANSWERS_SCHEMA_VERSION, get_answers_delta_validator, get_answers_validator
+# Imported here so callers and tests can patch ``applications.serialisers.verify_turnstile_token``.
+from .turnstile import verify_turnstile_token
 
 
 class ApplicationSerialiser(JsonSchemaSerialiserMixin, serializers.ModelSerializer):
@@ -175,28 +140,19 @@ class ApplicationSerialiser(JsonSchemaSerialiserMixin, serializers.ModelSerializ
         fields["document"].required = isPut
         fields["document"].read_only = not isPut
 
+        # Only retrieve responses include the document (FormLayout reads it);
+        # list-consuming components never do. Hide it from every other response
+        # up front, so serialising a list never reads the (deferred) column.
+        view = self.context.get("view")
+        if getattr(view, "action", None) != "retrieve":
+            fields["document"].write_only = True
+
         # Status field is required only when updating via PATCH
         fields["status"].required = isPatch
         fields["status"].read_only = not isPatch
 
         return fields
 
-    def to_representation(self, instance):
-        """Exclude ``document`` from list responses to reduce payload size.
-
-        The ``document`` field is only meaningful on single-record detail views
-        (FormLayout). Including it in list responses wastes bandwidth since no
-        list-consuming component reads it.
-        """
-        data = super().to_representation(instance)
-        # The viewset sets ``action`` on the serialiser context's view; retrieve
-        # is the only action that should include the full document payload.
-        view = self.context.get("view")
-        is_detail = view and getattr(view, "action", None) == "retrieve"
-        if not is_detail:
-            data.pop("document", None)
-        return data
-
     def validate_status(self, value):
         """
         Validate the status field to ensure only allowed transitions.
@@ -254,9 +210,8 @@ class ApplicationSerialiser(JsonSchemaSerialiserMixin, serializers.ModelSerializ
                 f"Cannot modify document with status '{self.instance.status}'"
             )
 
-        # Validate and return with the JSON schema
-        schema = get_answers_schema()
-        return self._validate_document(value, schema)
+        # Validate and return with the compiled JSON schema validator
+        return self._validate_document(value, get_answers_validator())
 
     def validate(self, attrs):
         """
@@ -337,19 +292,16 @@ class ApplicationSerialiser(JsonSchemaSerialiserMixin, serializers.ModelSerializ
                 "Questionnaire not found in context, validation did not run."
             )
 
-        # Hardcode the version from the current schema
-        schema = get_answers_schema()
-
-        # Create a fresh document with questionnaire schema version
+        # Create a fresh document with the current answers schema version
         document = {
-            "schema_version": schema["properties"]["schema_version"]["default"],
+            "schema_version": ANSWERS_SCHEMA_VERSION,
             # initially with single step
             "active_step": 0,
             "steps": [{"is_valid": None, "answers": {}}],
         }
 
         # Validate and return with the JSON schema
-        self._validate_document(document, schema)
+        self._validate_document(document, get_answers_validator())
 
         create_data = {
             "owner": self.context["request"].user,
@@ -360,6 +312,59 @@ class ApplicationSerialiser(JsonSchemaSerialiserMixin, serializers.ModelSerializ
         return super().create(create_data)
 
 
+class AnswersDeltaSerialiser(serializers.Serializer):
+    """
+    Serializer for a partial answers update of a single step of a draft
+    application, e.g. ``{"step": 0, "answers": {"1-2": "value"}}``.
+
+    Only the delta is validated (against the answers definition of the
+    schema); it is applied with ``Application.apply_answers_delta``.
+    """
+
+    step = serializers.IntegerField(min_value=0)
+    answers = serializers.DictField(required=False)
+    is_valid = serializers.BooleanField(required=False, allow_null=True)
+    active_step = serializers.IntegerField(min_value=0, required=False)
+
+    def validate_answers(self, value):
+        try:
+            validate_document(value, get_answers_delta_validator())
+        except JSONSchemaValidationError as e:
+            coor: str = ".".join(str(x) for x in e.absolute_path)
+            raise exceptions.ValidationError(f"Invalid answers: {e.message} ({coor})")
+        return value
+
+    def validate(self, attrs):
+        """
+        Check the delta against the application: draft only, and the step must
+        exist in the questionnaire and be at most one past the stored steps.
+        """
+        application: Application = self.instance
+        if application.status != ApplicationStatus.DRAFT:
+            raise exceptions.ValidationError(
+                f"Cannot modify document with status '{application.status}'"
+            )
+
+        if not attrs.keys() & {"answers", "is_valid", "active_step"}:
+            raise exceptions.ValidationError(
+                "At least one of answers, is_valid or active_step is required."
+            )
+
+        questionnaire_steps = get_compiled_questionnaire(application.questionnaire).step_count
+        stored_steps = len(application.document["steps"])
+        step = attrs["step"]
+        if step >= questionnaire_steps or step > stored_steps:
+            raise exceptions.ValidationError({"step": f"Step {step} is out of range."})
+
+        active_step = attrs.get("active_step")
+        if active_step is not None and active_step >= questionnaire_steps:
+            raise exceptions.ValidationError(
+                {"active_step": f"Step {active_step} is out of range."}
+            )
+
+        return attrs
+
+
 class FileTooLargeError(exceptions.APIException):
     """
     Custom exception for payloads that are too large.
@@ -375,8 +380,150 @@ class FileTooLargeError(exceptions.APIException):
 # 2.3-4 : step 2, section 3, question 4
 QUESTION_IDX_PATTERN = re.compile(r"^\d+\.\d+\-\d+$")
 
+# Upper bound on file_max_attachments, whatever the questionnaire says
+MAX_ATTACHMENTS_PER_QUESTION = 20
+
+
+def check_file_type(file_header: bytes, filename: str) -> str:
+    """
+    Return the mime type of a file from its first bytes, or raise a ValidationError.
+    The "magic bytes" must match the filename extension and an allowed mime type.
+    """
+    # Get the file extension
+    _, extension = path.splitext(filename)
+    extension = extension.lstrip(".").lower()
+
+    # Get the possible mime types based on the "magic bytes"
+    matches = find_matches_for_file_header(file_header=file_header)
+
+    for match in matches:
+        match_mimetype, _ = guess_file_type(f"file.{match.file_extension}")
+        # File extension must match and mime type must be allowed
+        if (
+            match.file_extension == extension
+            and match_mimetype in settings.UPLOAD_MIME_TYPES
+        ):
+            return match_mimetype
+
+    # Decline by default
+    raise exceptions.ValidationError(
+        "File type cannot be determined or is not allowed."
+    )
+
+
+def check_uploaded_file(value):
+    """
+    Validate an uploaded file for size and type, using both the file header and extension.
+    """
+    # Validate the file size first
+    if value.size > settings.UPLOAD_MAX_SIZE:
+        raise FileTooLargeError(
+            f"File size exceeds the limit of {filesizeformat(settings.UPLOAD_MAX_SIZE)}. "
+            f"Current size: {filesizeformat(value.size)}",
+        )
+
+    # Check the "magic bytes" against the extension and allowed types
+    check_file_type(value.read(32), value.name)
+
+    # Reset the file pointer to the beginning after reading the header
+    value.seek(0)
+    return value
+
+
+def get_question_definition(application: Application, question_idx: str) -> CompiledQuestion:
+    """
+    Return the compiled question at a "step.section-question" index.
+    Served from the compiled questionnaire cache, so the application's
+    questionnaire ``document`` may be deferred.
+    """
+    question = get_compiled_questionnaire(application.questionnaire).question(question_idx)
+    if question is None:
+        raise serializers.ValidationError(
+            {"question": "Question not found in questionnaire definition."}
+        )
+    return question
+
+
+def reserve_attachment_slots(
+    application: Application,
+    question_idx: str,
+    question_def: CompiledQuestion,
+    adding: int = 1,
+) -> None:
+    """
+    Check that ``adding`` more attachments fit the question's file_max_attachments.
+
+    Must run inside ``transaction.atomic()``: the application row stays locked
+    until the transaction ends, serialising concurrent requests for the same
+    application so they cannot all pass the check and exceed the limit.
+    """
+    max_attachments = min(question_def.file_max_attachments or 1, MAX_ATTACHMENTS_PER_QUESTION)
+
+    # Lock the application row to prevent concurrent attachment creation
+    Application.objects.select_for_update().get(pk=application.pk)
+
+    # Count existing non-deleted attachments within the transaction
+    # This ensures we're counting after acquiring the lock
+    existing_count = ApplicationAttachment.objects.filter(
+        application=application,
+        question=question_idx,
+        is_deleted=False,
+    ).count()
+
+    # Validate the limit under the lock
+    if existing_count + adding > max_attachments:
+        raise serializers.ValidationError(
+            {
+                "file": f"Maximum {max_attachments} attachment(s) allowed for this question, current: {existing_count}"
+            }
+        )
+
+
+class AttachmentTargetMixin:
+    """
+    Validation of the ``application_key`` and ``question`` an attachment is added to.
+    """
+
+    def validate_application_key(self, value):
+        """
+        Validate the application key to ensure it exists and belongs to the user.
+        Also, cache the application instance in the context for later use in create().
+        """
+        request = self.context.get("request")
+        try:
+            # Questions are looked up in the compiled questionnaire cache,
+            # so the questionnaire document is never needed here.
+            application = (
+                Application.objects.select_related("questionnaire", "questionnaire__process")
+                .defer("questionnaire__document")
+                .get(key=value, owner=request.user)
+            )
+        except Application.DoesNotExist:
+            raise serializers.ValidationError("Application not found.")
+
+        # Cache for later to avoid re-query in create()
+        self.context["application"] = application
+        return value
+
+    def validate_question(self, value):
+        """
+        Validate the question index format (does not parse definition here).
+        Definition parsing is deferred to object-level validate() for guaranteed ordering.
+        """
+        question_idx = value.strip()
+        if not question_idx:
+            raise serializers.ValidationError("Question index cannot be empty.")
 
-class AttachmentSerialiser(serializers.ModelSerializer):
+        # Regex validates format: ensures all digits and correct structure
+        if not re.match(QUESTION_IDX_PATTERN, question_idx):
+            raise serializers.ValidationError(
+                "Question index must follow format: step.section-question (e.g., 0.1-2)"
+            )
+
+        return question_idx
+
+
+class AttachmentSerialiser(AttachmentTargetMixin, serializers.ModelSerializer):
     """
     Serializer for ApplicationAttachment model.
     """
@@ -453,70 +600,7 @@ class AttachmentSerialiser(serializers.ModelSerializer):
         """
         Validate the uploaded file for size and type, using both the file header and extension.
         """
-        # Validate the file size first
-        if value.size > settings.UPLOAD_MAX_SIZE:
-            raise FileTooLargeError(
-                f"File size exceeds the limit of {filesizeformat(settings.UPLOAD_MAX_SIZE)}. "
-                f"Current size: {filesizeformat(value.size)}",
-            )
-
-        # Get the file extension
-        _, extension = path.splitext(value.name)
-        extension = extension.lstrip(".").lower()
-
-        # Get the possible mime types based on the "magic bytes"
-        matches = find_matches_for_file_header(file_header=value.read(32))
-
-        # Reset the file pointer to the beginning after reading the header
-        value.seek(0)
-
-        for match in matches:
-            match_mimetype, _ = guess_file_type(f"file.{match.file_extension}")
-            # File extension must match and mime type must be allowed
-            if (
-                match.file_extension == extension
-                and match_mimetype in settings.UPLOAD_MIME_TYPES
-            ):
-                return value
-
-        # Decline by default
-        raise exceptions.ValidationError(
-            "File type cannot be determined or is not allowed."
-        )
-
-    def validate_application_key(self, value):
-        """
-        Validate the application key to ensure it exists and belongs to the user.
-        Also, cache the application instance in the context for later use in create().
-        """
-        request = self.context.get("request")
-        try:
-            application = Application.objects.select_related(
-                "questionnaire", "questionnaire__process"
-            ).get(key=value, owner=request.user)
-        except Application.DoesNotExist:
-            raise serializers.ValidationError("Application not found.")
-
-        # Cache for later to avoid re-query in create()
-        self.context["application"] = application
-        return value
-
-    def validate_question(self, value):
-        """
-        Validate the question index format (does not parse definition here).
-        Definition parsing is deferred to object-level validate() for guaranteed ordering.
-        """
-        question_idx = value.strip()
-        if not question_idx:
-            raise serializers.ValidationError("Question index cannot be empty.")
-
-        # Regex validates format: ensures all digits and correct structure
-        if not re.match(QUESTION_IDX_PATTERN, question_idx):
-            raise serializers.ValidationError(
-                "Question index must follow format: step.section-question (e.g., 0.1-2)"
-            )
-
-        return question_idx
+        return check_uploaded_file(value)
 
     def validate(self, data):
         """
@@ -540,22 +624,9 @@ class AttachmentSerialiser(serializers.ModelSerializer):
                 "Application not found in context. Ensure application_key validation ran first."
             )
 
-        # Parse question index: "step.section-question" format
-        # Regex already validated format in validate_question(), so this won't fail
-        question_idx = data.get("question", "")
-        parts = question_idx.split("-")
-        step_section, question_num = parts[0].split("."), int(parts[1])
-        step_idx, section_idx = int(step_section[0]), int(step_section[1])
-
-        # Look up the question in questionnaire document
-        try:
-            question_def = application.questionnaire.document["steps"][step_idx][
-                "sections"
-            ][section_idx]["questions"][question_num]
-        except (KeyError, IndexError, TypeError):
-            raise serializers.ValidationError(
-                {"question": "Question not found in questionnaire definition."}
-            )
+        # Look up the question; regex already validated the index format in
+        # validate_question(), so parsing won't fail
+        question_def = get_question_definition(application, data.get("question", ""))
 
         # Cache the question definition for use in create()
         self.context["question_def"] = question_def
@@ -594,30 +665,9 @@ class AttachmentSerialiser(serializers.ModelSerializer):
             raise serializers.ValidationError("Missing required field: " + str(e))
 
         # Validate file_max_attachments limit and create in atomic transaction
-        # Use select_for_update() to serialize concurrent requests for the same application
-        # and prevent race conditions where multiple requests bypass the attachment limit check
-        question_idx = validated_data["question"]
-        max_attachments = min(question_def.get("file_max_attachments") or 1, 20)
-
+        # (the application row lock serialises concurrent requests)
         with transaction.atomic():
-            # Lock the application row to prevent concurrent attachment creation
-            Application.objects.select_for_update().get(pk=application.pk)
-
-            # Count existing non-deleted attachments within the transaction
-            # This ensures we're counting after acquiring the lock
-            existing_count = ApplicationAttachment.objects.filter(
-                application=application,
-                question=question_idx,
-                is_deleted=False,
-            ).count()
-
-            # Validate the limit under the lock
-            if existing_count >= max_attachments:
-                raise serializers.ValidationError(
-                    {
-                        "file": f"Maximum {max_attachments} attachment(s) allowed for this question, current: {existing_count}"
-                    }
-                )
+            reserve_attachment_slots(application, validated_data["question"], question_def)
 
             # Create the attachment record (still within atomic + locked transaction)
             try:
@@ -646,6 +696,142 @@ class AttachmentSerialiser(serializers.ModelSerializer):
         return instance
 
 
+class AttachmentBatchSerialiser(AttachmentTargetMixin, serializers.Serializer):
+    """
+    Serializer to add several files to one question in a single request.
+
+    Files are validated like single uploads, written to storage, and then
+    inserted together: the application row is locked and the question's
+    attachments counted once for the whole batch.
+    """
+
+    application_key = serializers.UUIDField()
+    question = serializers.CharField(max_length=100)
+    files = serializers.ListField(
+        child=serializers.FileField(),
+        allow_empty=False,
+        max_length=MAX_ATTACHMENTS_PER_QUESTION,
+    )
+    # Optional display names, one per file; defaults to the uploaded filenames.
+    names = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        required=False,
+    )
+
+    def validate_files(self, value):
+        """Validate each file's size and type."""
+        return [check_uploaded_file(uploaded) for uploaded in value]
+
+    def validate(self, data):
+        """
+        Check the question exists, there is one name per file and the question
+        still has room, so a doomed batch fails before any file is stored. The
+        limit is enforced again in create(), under the lock held for the insert.
+        """
+        names = data.get("names")
+        if names is not None and len(names) != len(data["files"]):
+            raise serializers.ValidationError({"names": "Provide one name per file."})
+
+        application = self.context["application"]
+        question_def = get_question_definition(application, data["question"])
+        with transaction.atomic():
+            reserve_attachment_slots(application, data["question"], question_def, adding=len(data["files"]))
+
+        self.context["question_def"] = question_def
+        return data
+
+    def create(self, validated_data):
+        """Store the files and insert all attachments, or none if the limit is exceeded."""
+        application = self.context.pop("application")
+        question_def = self.context.pop("question_def")
+        question_idx = validated_data["question"]
+        files = validated_data["files"]
+        names = validated_data.get("names") or [uploaded.name for uploaded in files]
+
+        # Write the files before taking the lock so it is only held for the
+        # count and one multi-row INSERT, not for the storage round trips.
+        attachments = []
+        for uploaded, name in zip(files, names):
+            attachment = ApplicationAttachment(
+                application=application,
+                question=question_idx,
+                name=name,
+            )
+            attachment.file.save(uploaded.name, uploaded, save=False)
+            attachments.append(attachment)
+
+        try:
+            with transaction.atomic():
+                reserve_attachment_slots(application, question_idx, question_def, adding=len(attachments))
+                # bulk_create skips post_save, so invalidate cached PDFs once here.
+                ApplicationAttachment.objects.bulk_create(attachments)
+                transaction.on_commit(lambda: invalidate_pdf_cache(application))
+        except Exception:
+            for attachment in attachments:
+                attachment.file.delete(save=False)
+            raise
+
+        return attachments
+
+
+class AttachmentUploadSerialiser(AttachmentTargetMixin, serializers.ModelSerializer):
+    """
+    Serializer to start a resumable attachment upload and report its progress.
+    The chunks themselves are raw request bodies (see ``applications.uploads``).
+    """
+
+    application_key = serializers.UUIDField(source="application.key")
+    offset = serializers.IntegerField(source="received", read_only=True)
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = AttachmentUpload
+        fields = (
+            "key",
+            "application_key",
+            "question",
+            "name",
+            "size",
+            "offset",
+            "chunk_size",
+            "created_at",
+        )
+        read_only_fields = ("key", "offset", "chunk_size", "created_at")
+
+    def get_chunk_size(self, obj: AttachmentUpload) -> int:
+        """Largest chunk the server accepts per PUT."""
+        return settings.ATTACHMENT_UPLOAD_CHUNK_SIZE
+
+    def validate_size(self, value: int) -> int:
+        """Reject empty files and files over UPLOAD_MAX_SIZE before any bytes are sent."""
+        if value < 1:
+            raise serializers.ValidationError("File cannot be empty.")
+        if value > settings.UPLOAD_MAX_SIZE:
+            raise FileTooLargeError(
+                f"File size exceeds the limit of {filesizeformat(settings.UPLOAD_MAX_SIZE)}. "
+                f"Current size: {filesizeformat(value)}",
+            )
+        return value
+
+    def validate(self, data):
+        """
+        Check the question exists and still has room, so a doomed upload fails
+        before any chunks are sent. The limit is enforced again on finalise.
+        """
+        application = self.context["application"]
+        question_def = get_question_definition(application, data["question"])
+        with transaction.atomic():
+            reserve_attachment_slots(application, data["question"], question_def)
+        return data
+
+    def create(self, validated_data):
+        validated_data.pop("application", None)
+        return AttachmentUpload.objects.create(
+            application=self.context.pop("application"),
+            **validated_data,
+        )
+
+
 class AssessmentSerialiser(serializers.ModelSerializer):
     """
     Serialiser for the assessment-facing application view.
@@ -733,3 +919,138 @@ class AssessmentSerialiser(serializers.ModelSerializer):
             )
 
         return value
+
+
+class PdfRenderJobSerialiser(serializers.ModelSerializer):
+    """
+    Serialiser for queued background PDF renders.
+
+    POST accepts only ``application_key``; everything else is reported back
+    for polling. ``download_url`` is populated once the job is DONE.
+    """
+
+    application_key = serializers.UUIDField(source="application.key")
+    download_url = serializers.SerializerMethodField(
+        read_only=True,
+        method_name="get_download_url",
+    )
+
+    class Meta:
+        model = PdfRenderJob
+        fields = (
+            "key",
+            "application_key",
+            "status",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "download_url",
+        )
+        read_only_fields = (
+            "key",
+            "status",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "download_url",
+        )
+
+    def get_download_url(self, obj: PdfRenderJob) -> str | None:
+        request = self.context.get("request")
+        if request is None or obj.status != PdfRenderJobStatus.DONE:
+            return None
+
+        return request.build_absolute_uri(
+            reverse("pdf-jobs-download", kwargs={"key": obj.key})
+        )
+
+    def validate_application_key(self, value):
+        """
+        Resolve the application and apply the same read check as PDF downloads.
+        Unknown and inaccessible applications are reported identically.
+        """
+        request = self.context.get("request")
+        try:
+            application = Application.objects.select_related(
+                "questionnaire", "questionnaire__process", "owner"
+            ).get(key=value)
+        except Application.DoesNotExist:
+            raise serializers.ValidationError("Application not found.")
+
+        if not application.has_access(request.user):
+            raise serializers.ValidationError("Application not found.")
+
+        if application.status == ApplicationStatus.DRAFT:
+            raise serializers.ValidationError(
+                "Only submitted applications can be rendered in the background."
+            )
+
+        self.context["application"] = application
+        return value
+
+    def create(self, validated_data):
+        application = self.context.pop("application", None)
+        if application is None:
+            raise exceptions.ValidationError(
+                {
+                    "application_key": "Application not found in context, validation did not run."
+                }
+            )
+
+        return PdfRenderJob.objects.enqueue(
+            application, requested_by=self.context["request"].user
+        )
+
+
+class PdfExportRequestSerialiser(serializers.Serializer):
+    """
+    Input of a bulk PDF export: explicit application ``keys``, or none to
+    export every application matching the queue filters.
+    """
+
+    keys = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        allow_empty=False,
+    )
+
+
+class PdfExportJobSerialiser(serializers.ModelSerializer):
+    """
+    Serialiser for polling bulk PDF exports.
+
+    ``completed`` and ``failed`` count finished applications out of
+    ``total``; ``download_url`` is populated once the job is DONE.
+    """
+
+    download_url = serializers.SerializerMethodField(
+        read_only=True,
+        method_name="get_download_url",
+    )
+
+    class Meta:
+        model = PdfExportJob
+        fields = (
+            "key",
+            "status",
+            "total",
+            "completed",
+            "failed",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "download_url",
+        )
+        read_only_fields = fields
+
+    def get_download_url(self, obj: PdfExportJob) -> str | None:
+        request = self.context.get("request")
+        if request is None or obj.status != PdfRenderJobStatus.DONE:
+            return None
+
+        return request.build_absolute_uri(
+            reverse("pdf-exports-download", kwargs={"key": obj.key})
+        )
@@ -0,0 +1,43 @@
+"""Model signal handlers for the applications app."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Application, ApplicationAttachment, PdfExportJob
+from .pdf_cache import invalidate_pdf_cache
+from .search import update_search_vector
+
+
+@receiver(post_save, sender=Application)
+def invalidate_pdf_cache_on_application_save(sender, instance, created, **kwargs):
+    """Drop cached PDFs superseded by a status or document change."""
+    if created:
+        return
+    # Wait for commit so a rolled-back change never discards a valid artefact.
+    transaction.on_commit(lambda: invalidate_pdf_cache(instance))
+
+
+@receiver(post_save, sender=ApplicationAttachment)
+def invalidate_pdf_cache_on_attachment_save(sender, instance, **kwargs):
+    """Drop cached PDFs superseded by an added, renamed or deleted attachment."""
+    transaction.on_commit(lambda: invalidate_pdf_cache(instance.application))
+
+
+@receiver(post_save, sender=Application)
+def update_search_vector_on_application_save(sender, instance, **kwargs):
+    """Re-index the answers, status or applicant of a saved application for full-text search."""
+    update_search_vector(instance)
+
+
+@receiver(post_save, sender=ApplicationAttachment)
+def update_search_vector_on_attachment_save(sender, instance, **kwargs):
+    """Re-index the attached file names of the application for full-text search."""
+    update_search_vector(instance.application)
+
+
+@receiver(post_delete, sender=PdfExportJob)
+def delete_archive_on_pdf_export_delete(sender, instance, **kwargs):
+    """Remove the ZIP archive of a deleted export from storage."""
+    # Wait for commit so a rolled-back delete keeps the archive downloadable.
+    transaction.on_commit(instance.delete_archive)
@@ -0,0 +1,285 @@
+"""Tests for attachment downloads: streaming (Range, conditional requests) and offloading."""
+
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncClient, override_settings
+from django.urls import reverse
+from django.utils.http import http_date
+from storages.backends.azure_storage import AzureStorage
+
+from applications.downloads import (
+    RangeNotSatisfiable,
+    deliver_attachment,
+    iter_file_range,
+    parse_range,
+)
+from applications.models import ApplicationAttachment
+
+
+CONTENT = b"%PDF-1.4\n" + bytes(range(256)) * 4
+
+
+@pytest.fixture
+def attachment(application, user):
+    """Return an attachment owned by the logged-in canonical user."""
+    application.owner = user
+    application.save(update_fields=["owner"])
+    return ApplicationAttachment.objects.create(
+        application=application,
+        question="0.0-0",
+        name="evidence.pdf",
+        file=SimpleUploadedFile("evidence.pdf", CONTENT, content_type="application/pdf"),
+    )
+
+
+@pytest.fixture
+def download(client, user, attachment):
+    """Log in and return a function that GETs the attachment with extra headers."""
+    client.force_login(user)
+    url = reverse(
+        "download-attachment",
+        kwargs={"appKey": attachment.application.key, "attachmentKey": attachment.key},
+    )
+
+    def _download(method="get", **headers):
+        return getattr(client, method)(url, headers=headers)
+
+    return _download
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, None),
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=-500", (0, 99)),
+        ("bytes=90-500", (90, 99)),
+        ("bytes=5-1", None),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_range(header, expected):
+    """Resolve single ranges and ignore malformed or multi-range headers."""
+    assert parse_range(header, 100) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=-0"])
+def test_parse_range_rejects_unsatisfiable_ranges(header):
+    """Reject ranges that select no bytes of the file."""
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range(header, 100)
+
+
+@pytest.mark.unit
+def test_iter_file_range_downloads_only_the_range_from_azure():
+    """Request exactly the byte range from Azure and re-chunk the stream."""
+    storage = mock.MagicMock(spec=AzureStorage)
+    storage.timeout = 20
+    downloader = storage.client.get_blob_client.return_value.download_blob.return_value
+    downloader.read.side_effect = [b"abc", b"de", b""]
+
+    chunks = list(iter_file_range(storage, "attachments/file.pdf", 10, 5, chunk_size=3))
+
+    assert chunks == [b"abc", b"de"]
+    storage.client.get_blob_client.return_value.download_blob.assert_called_once_with(
+        offset=10, length=5, timeout=20
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_streams_whole_file_with_validators(download):
+    """Send the whole file with its length, validators and range support advertised."""
+    response = download()
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == CONTENT
+    assert response["Content-Length"] == str(len(CONTENT))
+    assert response["Content-Type"] == "application/pdf"
+    assert response["Accept-Ranges"] == "bytes"
+    assert response["ETag"]
+    assert "private" in response["Cache-Control"]
+    assert "no-store" not in response["Cache-Control"]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_streams_asynchronously_under_asgi(user, attachment):
+    """Stream the file as an async iterator read off the event loop under ASGI."""
+    client = AsyncClient()
+    client.force_login(user)
+    url = reverse(
+        "download-attachment",
+        kwargs={"appKey": attachment.application.key, "attachmentKey": attachment.key},
+    )
+
+    async def _download():
+        response = await client.get(url, headers={"Range": "bytes=9-18"})
+        return response, b"".join([chunk async for chunk in response.streaming_content])
+
+    response, content = async_to_sync(_download)()
+
+    assert response.status_code == 206
+    assert response.is_async
+    assert content == CONTENT[9:19]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_serves_a_byte_range(download):
+    """Answer a Range request with 206 and only the requested bytes."""
+    response = download(Range="bytes=9-18")
+
+    assert response.status_code == 206
+    assert b"".join(response.streaming_content) == CONTENT[9:19]
+    assert response["Content-Length"] == "10"
+    assert response["Content-Range"] == f"bytes 9-18/{len(CONTENT)}"
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_rejects_a_range_beyond_the_end(download):
+    """Answer 416 with the file size when the range cannot be satisfied."""
+    response = download(Range=f"bytes={len(CONTENT)}-")
+
+    assert response.status_code == 416
+    assert response["Content-Range"] == f"bytes */{len(CONTENT)}"
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_ignores_range_when_if_range_is_stale(download):
+    """Send the whole file when If-Range no longer matches the current ETag."""
+    response = download(Range="bytes=0-9", If_Range='"stale"')
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == CONTENT
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_resumes_when_if_range_matches(download):
+    """Honour the Range when If-Range carries the current ETag."""
+    etag = download()["ETag"]
+
+    response = download(Range="bytes=-4", If_Range=etag)
+
+    assert response.status_code == 206
+    assert b"".join(response.streaming_content) == CONTENT[-4:]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_revalidates_with_if_none_match(download):
+    """Answer 304 without a body when the client already has the file."""
+    etag = download()["ETag"]
+
+    response = download(If_None_Match=etag)
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_revalidates_with_if_modified_since(download, attachment):
+    """Answer 304 to If-Modified-Since at or after the attachment's creation."""
+    response = download(If_Modified_Since=http_date(attachment.created_at.timestamp() + 60))
+
+    assert response.status_code == 304
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_etag_changes_when_the_attachment_is_renamed(download, attachment):
+    """Send the new filename instead of a 304 after the owner renames the attachment."""
+    etag = download()["ETag"]
+    attachment.name = "renamed.pdf"
+    attachment.save(update_fields=["name"])
+
+    response = download(If_None_Match=etag)
+
+    assert response.status_code == 200
+    assert "renamed.pdf" in response["Content-Disposition"]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_download_head_sends_headers_without_reading_the_file(download):
+    """Report the length on HEAD without streaming any bytes."""
+    with mock.patch("applications.downloads.iter_file_range") as iter_file_range_mock:
+        response = download(method="head")
+
+    assert response.status_code == 200
+    assert response["Content-Length"] == str(len(CONTENT))
+    iter_file_range_mock.assert_not_called()
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+@override_settings(ATTACHMENT_DELIVERY="accel", ATTACHMENT_ACCEL_REDIRECT_PREFIX="/protected-media/")
+def test_accel_delivery_hands_the_file_to_nginx(download, attachment):
+    """Return an empty response pointing nginx at the stored file."""
+    response = download()
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response["X-Accel-Redirect"] == f"/protected-media/{attachment.file.name}"
+    assert response["Content-Type"] == "application/pdf"
+    assert 'filename="evidence.pdf"' in response["Content-Disposition"]
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+@override_settings(ATTACHMENT_DELIVERY="accel")
+def test_offloaded_delivery_still_checks_access(client, other_user, attachment):
+    """Check access before offloading so foreign users still get a 404."""
+    client.force_login(other_user)
+    response = client.get(
+        reverse(
+            "download-attachment",
+            kwargs={"appKey": attachment.application.key, "attachmentKey": attachment.key},
+        )
+    )
+
+    assert response.status_code == 404
+    assert "X-Accel-Redirect" not in response
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+@override_settings(ATTACHMENT_DELIVERY="sas", ATTACHMENT_SAS_EXPIRY=30)
+def test_sas_delivery_redirects_to_a_short_lived_blob_url(rf, attachment):
+    """Redirect to a signed URL for the one blob, pinning its filename and type."""
+    storage = mock.MagicMock(spec=AzureStorage)
+    storage.url.return_value = "https://account.blob.core.windows.net/c/blob?sig=x"
+    attachment.file.storage = storage
+
+    response = deliver_attachment(rf.get("/"), attachment)
+
+    assert response.status_code == 302
+    assert response["Location"] == storage.url.return_value
+    assert "no-store" in response["Cache-Control"]
+    _, kwargs = storage.url.call_args
+    assert kwargs["expire"] == 30
+    assert kwargs["parameters"]["content_type"] == "application/pdf"
+    assert 'filename="evidence.pdf"' in kwargs["parameters"]["content_disposition"]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+@pytest.mark.parametrize("mode", ["sas", "unknown"])
+def test_delivery_mode_must_match_the_storage(rf, attachment, mode):
+    """Fail loudly when the mode cannot work with the configured storage."""
+    with override_settings(ATTACHMENT_DELIVERY=mode), pytest.raises(ImproperlyConfigured):
+        deliver_attachment(rf.get("/"), attachment)
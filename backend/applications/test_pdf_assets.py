@@ -0,0 +1,92 @@
+"""Tests for the PDF asset layer: cached static assets and image print derivatives."""
+
+import io
+import os
+from unittest import mock
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from applications import pdf_assets
+from applications.models import ApplicationAttachment
+
+
+@pytest.fixture(autouse=True)
+def fresh_static_cache():
+    """Start every test without cached static assets."""
+    pdf_assets.clear_static_cache()
+    yield
+    pdf_assets.clear_static_cache()
+
+
+@pytest.fixture
+def static_css(tmp_path):
+    """Return a static file found by a patched finder, and the finder mock."""
+    css = tmp_path / "pdf-icons.css"
+    css.write_text(".icon { color: red; }", encoding="utf-8")
+    with mock.patch.object(pdf_assets, "find_static", return_value=str(css)) as finder:
+        yield css, finder
+
+
+def _image_attachment(application, content, name="photo.png"):
+    """Create an image attachment with the given bytes."""
+    return ApplicationAttachment.objects.create(
+        application=application,
+        question="0.0-0",
+        name=name,
+        file=SimpleUploadedFile(name, content, content_type="image/png"),
+    )
+
+
+@pytest.mark.unit
+def test_static_text_is_read_once_until_it_changes(static_css):
+    """Serve the cached text until the file's mtime moves."""
+    css, finder = static_css
+
+    assert pdf_assets.read_static_text("pdf-icons.css") == ".icon { color: red; }"
+    with mock.patch("builtins.open", side_effect=AssertionError("re-read")):
+        assert pdf_assets.read_static_text("pdf-icons.css") == ".icon { color: red; }"
+    assert finder.call_count == 1
+
+    css.write_text(".icon { color: blue; }", encoding="utf-8")
+    mtime = os.stat(css).st_mtime + 10
+    os.utime(css, (mtime, mtime))
+
+    assert pdf_assets.read_static_text("pdf-icons.css") == ".icon { color: blue; }"
+
+
+@pytest.mark.unit
+def test_missing_static_assets(settings, tmp_path):
+    """Return no CSS, and a logo URI under STATIC_ROOT, when the finders have nothing."""
+    settings.STATIC_ROOT = str(tmp_path)
+    with mock.patch.object(pdf_assets, "find_static", return_value=None):
+        assert pdf_assets.read_static_text("pdf-icons.css") == ""
+        assert pdf_assets.static_file_uri("images/logo.png") == f"file://{tmp_path}/images/logo.png"
+
+
+@pytest.mark.django_db
+def test_image_src_stores_a_downscaled_derivative_once(application, settings):
+    """Downscale large images once and reuse the stored derivative."""
+    settings.PDF_IMAGE_MAX_DIMENSION = 100
+    original = io.BytesIO()
+    Image.new("RGB", (800, 400), "green").save(original, format="PNG")
+    attachment = _image_attachment(application, original.getvalue())
+
+    src = pdf_assets.image_src(attachment)
+    with mock.patch.object(pdf_assets, "make_print_derivative") as make:
+        assert pdf_assets.image_src(attachment) == src
+    make.assert_not_called()
+
+    assert src.endswith(pdf_assets.DERIVATIVE_SUFFIX)
+    with Image.open(src.removeprefix("file://")) as derivative:
+        assert derivative.format == "JPEG"
+        assert derivative.size == (100, 50)
+
+
+@pytest.mark.django_db
+def test_unreadable_image_falls_back_to_the_original(application):
+    """Embed the original when a derivative cannot be made."""
+    attachment = _image_attachment(application, b"not an image")
+
+    assert pdf_assets.image_src(attachment) == "file://" + attachment.file.path
@@ -0,0 +1,132 @@
+"""Tests for the content-addressed application PDF cache."""
+
+from io import BytesIO
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from applications.models import Application, ApplicationAttachment, ApplicationStatus
+from applications.pdf_cache import pdf_cache_dir, pdf_cache_path, pdf_digest
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+@pytest.fixture
+def render_counter(monkeypatch):
+    """Replace Prince rendering with a counter so cache hits are observable."""
+    calls = []
+
+    def _fake_generate_pdf(self, request=None):
+        calls.append(self.pk)
+        return BytesIO(b"%PDF-1.4 rendered")
+
+    monkeypatch.setattr(Application, "generate_pdf", _fake_generate_pdf)
+    return calls
+
+
+@pytest.fixture
+def submitted_application(application):
+    """Move the canonical application out of DRAFT so it becomes cacheable."""
+    application.status = ApplicationStatus.SUBMITTED
+    application.save(update_fields=["status"])
+    return application
+
+
+def _attach(application, name="evidence.pdf"):
+    """Create a non-deleted attachment on the application."""
+    return ApplicationAttachment.objects.create(
+        application=application,
+        question="0.0-0",
+        name=name,
+        file=SimpleUploadedFile(name=name, content=b"%PDF-1.4\n", content_type="application/pdf"),
+    )
+
+
+def test_draft_pdfs_are_always_rendered(application, render_counter):
+    """Never cache drafts because their answers are still being edited."""
+    application.get_pdf()
+    application.get_pdf()
+
+    assert len(render_counter) == 2
+    assert not default_storage.exists(pdf_cache_dir(application))
+
+
+def test_submitted_pdf_is_rendered_once_then_served_from_storage(submitted_application, render_counter):
+    """Store the first render and serve later requests from the stored artefact."""
+    first = submitted_application.get_pdf().read()
+    second = submitted_application.get_pdf().read()
+
+    assert first == second == b"%PDF-1.4 rendered"
+    assert render_counter == [submitted_application.pk]
+    assert default_storage.exists(pdf_cache_path(submitted_application))
+
+
+def test_digest_tracks_document_status_and_attachments(submitted_application):
+    """Change the content address whenever an input displayed in the PDF changes."""
+    digests = {pdf_digest(submitted_application)}
+
+    submitted_application.document["steps"][0]["answers"]["0-0"] = "changed"
+    digests.add(pdf_digest(submitted_application))
+
+    submitted_application.status = ApplicationStatus.UNDER_REVIEW
+    digests.add(pdf_digest(submitted_application))
+
+    attachment = _attach(submitted_application)
+    digests.add(pdf_digest(submitted_application))
+
+    attachment.name = "renamed.pdf"
+    attachment.save(update_fields=["name"])
+    digests.add(pdf_digest(submitted_application))
+
+    assert len(digests) == 5
+
+
+def test_status_change_removes_superseded_artefact(
+    submitted_application,
+    render_counter,
+    django_capture_on_commit_callbacks,
+):
+    """Delete the old artefact once a status change commits."""
+    submitted_application.get_pdf()
+    stale_path = pdf_cache_path(submitted_application)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        submitted_application.status = ApplicationStatus.UNDER_REVIEW
+        submitted_application.save(update_fields=["status"])
+
+    assert not default_storage.exists(stale_path)
+
+    submitted_application.get_pdf()
+    assert len(render_counter) == 2
+
+
+def test_attachment_change_removes_superseded_artefact(
+    submitted_application,
+    render_counter,
+    django_capture_on_commit_callbacks,
+):
+    """Delete the old artefact once an attachment soft delete commits."""
+    attachment = _attach(submitted_application)
+    submitted_application.get_pdf()
+    stale_path = pdf_cache_path(submitted_application)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        attachment.soft_delete()
+
+    assert not default_storage.exists(stale_path)
+
+
+def test_download_view_serves_cached_pdf(client, user, submitted_application, render_counter):
+    """Serve repeat downloads from the cache without re-rendering."""
+    client.force_login(user)
+    url = reverse("download-application", kwargs={"appKey": submitted_application.key})
+
+    first = client.get(url)
+    second = client.get(url)
+
+    assert first.status_code == second.status_code == 200
+    assert b"".join(second.streaming_content) == b"%PDF-1.4 rendered"
+    assert len(render_counter) == 1
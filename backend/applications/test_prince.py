@@ -1,10 +1,18 @@
 """Unit tests for the Prince command wrapper used by PDF generation."""
 
+import json
 import subprocess
 
 import pytest
 
-from applications.prince import Prince
+from applications.prince import (
+    Prince,
+    PrinceConversionError,
+    PrinceError,
+    PrincePool,
+    PrincePoolTimeout,
+    get_prince_pool,
+)
 
 
 pytestmark = [pytest.mark.unit]
@@ -171,3 +179,187 @@ def test_to_pdf_kills_process_and_reraises_timeout(monkeypatch):
 
     assert fake_process.killed is True
     assert fake_process.communicate_calls == 2
+
+
+# A stand-in for `prince --control` that speaks the chunk protocol: it echoes the
+# job JSON back as the "PDF", reports `err` for documents containing "FAIL", a
+# failure `log` chunk for documents containing "LOGFAIL", stalls forever on
+# documents containing "HANG", answers "GARBLE" with a malformed chunk header and
+# exits without answering "EXIT".
+_FAKE_CONTROL_SCRIPT = r'''
+import json, sys, time
+
+def write(tag, data):
+    sys.stdout.buffer.write(b"%s %d\n" % (tag, len(data)) + data + b"\n")
+    sys.stdout.buffer.flush()
+
+def read():
+    header = sys.stdin.buffer.readline()
+    if not header:
+        sys.exit(0)
+    tag, length = header.split()
+    data = sys.stdin.buffer.read(int(length))
+    sys.stdin.buffer.read(1)
+    return tag, data
+
+write(b"ver", b"Fake Prince 16.2")
+while True:
+    tag, job = read()
+    if tag == b"end":
+        sys.exit(0)
+    _, html = read()
+    if b"HANG" in html:
+        time.sleep(60)
+    if b"EXIT" in html:
+        sys.exit(0)
+    if b"GARBLE" in html:
+        sys.stdout.buffer.write(b"x" * 40)
+        sys.stdout.buffer.flush()
+        continue
+    if b"LOGFAIL" in html:
+        write(b"log", b"msg|err||can't open input file: missing.css\nfin|failure\n")
+        continue
+    if b"FAIL" in html:
+        write(b"err", b"conversion failed")
+        continue
+    write(b"pdf", b"%PDF " + job)
+    write(b"log", b"")
+'''
+
+
+@pytest.fixture
+def fake_control_bin(tmp_path):
+    """Write an executable fake Prince that supports the control protocol."""
+    import sys
+
+    script = tmp_path / "fake-prince"
+    script.write_text(f"#!{sys.executable}\n" + _FAKE_CONTROL_SCRIPT)
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_pooled_render_sends_job_json_with_baseurl(fake_control_bin):
+    """Convert through a warm renderer and map --baseurl onto the job input."""
+    pool = PrincePool(fake_control_bin, size=1)
+    try:
+        prince = Prince(prince_bin=fake_control_bin, pool=pool)
+        pdf = prince.from_string("<html />", options={"baseurl": "http://example.test/"}, timeout=10)
+    finally:
+        pool.close()
+
+    job = json.loads(pdf.removeprefix(b"%PDF "))
+    assert job["input"] == {
+        "type": "html",
+        "base": "http://example.test/",
+        "src": "job-resource:0",
+    }
+    assert job["job-resource-count"] == 1
+
+
+def test_pool_reuses_warm_renderer_and_recycles_after_max_jobs(fake_control_bin):
+    """Hand the same process to consecutive jobs until it reaches max_jobs."""
+    pool = PrincePool(fake_control_bin, size=1, max_jobs=2)
+    try:
+        pool.render(b"<html />", {}, timeout=10)
+        first = pool._idle.queue[0]
+        pool.render(b"<html />", {}, timeout=10)
+        assert pool._idle.queue[0] is first
+
+        pool.render(b"<html />", {}, timeout=10)
+        assert pool._idle.queue[0] is not first
+    finally:
+        pool.close()
+
+
+def test_pool_keeps_renderer_after_reported_conversion_error(fake_control_bin):
+    """Surface Prince errors while keeping the healthy renderer for the next job."""
+    pool = PrincePool(fake_control_bin, size=1)
+    try:
+        with pytest.raises(PrinceConversionError, match="conversion failed"):
+            pool.render(b"FAIL", {}, timeout=10)
+        worker = pool._idle.queue[0]
+
+        assert pool.render(b"<html />", {}, timeout=10).startswith(b"%PDF")
+        assert pool._idle.queue[0] is worker
+    finally:
+        pool.close()
+
+
+def test_pool_keeps_renderer_after_failure_reported_in_log(fake_control_bin):
+    """Raise the log's error messages for a failed conversion and keep the renderer."""
+    pool = PrincePool(fake_control_bin, size=1)
+    try:
+        with pytest.raises(PrinceConversionError, match="can't open input file: missing.css"):
+            pool.render(b"LOGFAIL", {}, timeout=10)
+        worker = pool._idle.queue[0]
+
+        assert worker.is_alive()
+        assert pool.render(b"<html />", {}, timeout=10).startswith(b"%PDF")
+        assert pool._idle.queue[0] is worker
+    finally:
+        pool.close()
+
+
+@pytest.mark.parametrize(
+    ("document", "message"),
+    [(b"GARBLE", "Malformed Prince control chunk header"), (b"EXIT", "closed its output")],
+    ids=["malformed-header", "eof"],
+)
+def test_pool_discards_renderer_after_protocol_error(fake_control_bin, document, message):
+    """Close a renderer whose control stream broke instead of handing it to the next job."""
+    pool = PrincePool(fake_control_bin, size=1)
+    try:
+        pool.render(b"<html />", {}, timeout=10)
+        worker = pool._idle.queue[0]
+
+        with pytest.raises(PrinceError, match=message) as raised:
+            pool.render(document, {}, timeout=10)
+
+        assert not isinstance(raised.value, PrinceConversionError)
+        assert not worker.is_alive()
+        assert pool._idle.empty()
+        assert pool.render(b"<html />", {}, timeout=10).startswith(b"%PDF")
+        assert pool._idle.queue[0] is not worker
+    finally:
+        pool.close()
+
+
+def test_pool_kills_renderer_on_job_timeout(fake_control_bin):
+    """Kill a wedged renderer and never return it to the idle pool."""
+    pool = PrincePool(fake_control_bin, size=1)
+    try:
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.render(b"HANG", {}, timeout=0.5)
+
+        assert pool._idle.empty()
+        assert pool.render(b"<html />", {}, timeout=10).startswith(b"%PDF")
+    finally:
+        pool.close()
+
+
+def test_pool_raises_when_queue_is_full():
+    """Reject callers that cannot get a renderer slot within the queue timeout."""
+    pool = PrincePool("prince", size=1, queue_timeout=0.01)
+    pool._slots.acquire()
+
+    with pytest.raises(PrincePoolTimeout):
+        pool.render(b"<html />", {})
+
+
+def test_options_without_control_equivalent_fall_back_to_subprocess(monkeypatch):
+    """Run a one-shot subprocess when an option cannot be expressed as a control job."""
+    fake_process = _FakeProcess(returncode=0, stdout=b"%PDF-1.7", stderr=b"")
+    monkeypatch.setattr("applications.prince.subprocess.Popen", lambda *_args, **_kwargs: fake_process)
+
+    class _UnusedPool:
+        def render(self, *_args, **_kwargs):
+            raise AssertionError("pool should not be used")
+
+    prince = Prince(prince_bin="prince", pool=_UnusedPool())
+
+    assert prince.from_string("<html />", options={"pdf-profile": "PDF/A-1b"}) == b"%PDF-1.7"
+
+
+def test_get_prince_pool_is_disabled_for_non_positive_size():
+    """Return no pool when PRINCE_POOL_SIZE disables pooling."""
+    assert get_prince_pool("prince", 0) is None
@@ -0,0 +1,91 @@
+"""Tests for full-text search over application answers."""
+
+from unittest import mock
+
+import pytest
+from django.contrib import admin
+
+from applications import search
+from applications.admin import ApplicationAdmin
+from applications.models import Application, ApplicationAttachment, ApplicationStatus
+from applications.search import search_applications, search_text
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+@pytest.fixture
+def answered_application(application):
+    """Submit the canonical application with a text answer mentioning a site."""
+    application.document["steps"][0]["answers"] = {"0-0": "Surveys at Lake Eyre North"}
+    application.status = ApplicationStatus.SUBMITTED
+    application.save()
+    return application
+
+
+def test_search_text_holds_identity_and_answers(answered_application, user):
+    """Index the internal ID and applicant apart from the flattened answers."""
+    identity, answers = search_text(answered_application)
+
+    assert identity == f"{answered_application.internal_id} {user.username}"
+    assert answers == "Surveys at Lake Eyre North"
+
+
+def test_search_vector_is_deferred_by_default(answered_application):
+    """Leave the vector in the database when loading applications."""
+    loaded = Application.objects.get(pk=answered_application.pk)
+
+    assert "search_vector" in loaded.get_deferred_fields()
+
+
+def test_postgresql_search_is_a_tsvector_match():
+    """Match the indexed vector with a web-search query on PostgreSQL."""
+    with mock.patch.object(search, "_is_postgresql", return_value=True):
+        sql = str(search_applications(Application.objects.all(), '"lake eyre" -south').query)
+
+    assert "search_vector" in sql
+    assert "@@" in sql
+    assert "websearch_to_tsquery" in sql
+
+
+def test_update_is_skipped_without_postgresql(answered_application):
+    """Leave the vector empty where full-text search is not indexed."""
+    search.update_search_vector(answered_application)
+
+    assert Application.objects.values_list("search_vector", flat=True).get() is None
+
+
+def test_fallback_search_requires_every_word(answered_application, other_user, questionnaire):
+    """Match each word against answers, applicant or process outside PostgreSQL."""
+    Application.objects.create(
+        owner=other_user,
+        questionnaire=questionnaire,
+        status=ApplicationStatus.SUBMITTED,
+        document={"schema_version": "2025.07-1", "active_step": 0, "steps": [{"answers": {"0-0": "Lake"}}]},
+    )
+    applications = Application.objects.all()
+
+    assert list(search_applications(applications, "lake eyre")) == [answered_application]
+    assert search_applications(applications, "lake").count() == 2
+    assert search_applications(applications, "  ").count() == 2
+
+
+def test_admin_search_includes_answer_matches(answered_application, rf, admin_user):
+    """Widen the admin's field search to applications whose answers match."""
+    model_admin = ApplicationAdmin(Application, admin.site)
+    request = rf.get("/admin/applications/application/", {"q": "eyre"})
+    request.user = admin_user
+
+    results, _ = model_admin.get_search_results(request, model_admin.get_queryset(request), "eyre")
+
+    assert list(results) == [answered_application]
+
+
+def test_attachment_saves_reindex_their_application(answered_application):
+    """Refresh the application's vector when an attachment changes."""
+    with mock.patch("applications.signals.update_search_vector") as update:
+        ApplicationAttachment.objects.create(
+            application=answered_application, question="0.0-0", name="map.pdf", file="map.pdf"
+        )
+
+    update.assert_called_once_with(answered_application)
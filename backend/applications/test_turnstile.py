@@ -0,0 +1,166 @@
+"""Tests for Turnstile verification: pooled Siteverify calls, result cache, metrics and stub backend."""
+
+from unittest import mock
+
+import pytest
+import requests
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+from rest_framework import status
+
+from applications import turnstile
+from applications.turnstile import SiteverifyBackend, get_backend, verify_turnstile_token
+
+
+@pytest.fixture(autouse=True)
+def fresh_verifier():
+    """Start every test with a new backend, zeroed counters and an empty cache."""
+    turnstile.reset_backend()
+    turnstile.stats.reset()
+    cache.clear()
+    yield
+    turnstile.reset_backend()
+
+
+@pytest.fixture
+def siteverify(settings):
+    """Configure Siteverify and return the mocked ``post`` of its pooled session."""
+    settings.TURNSTILE_BACKEND = "siteverify"
+    settings.TURNSTILE_SECRET_KEY = "secret"
+    settings.TURNSTILE_CONNECT_TIMEOUT = 1.5
+    settings.TURNSTILE_READ_TIMEOUT = 4.0
+    with mock.patch.object(requests.Session, "post") as post:
+        post.return_value.json.return_value = {"success": True}
+        yield post
+
+
+@pytest.mark.unit
+def test_siteverify_reuses_one_session_with_split_timeouts(siteverify):
+    """Send every verification over the same session with connect and read timeouts."""
+    verify_turnstile_token("token-1", "10.0.0.1")
+    verify_turnstile_token("token-2")
+
+    assert siteverify.call_count == 2
+    assert get_backend() is get_backend()
+    _, kwargs = siteverify.call_args_list[0]
+    assert kwargs["timeout"] == (1.5, 4.0)
+    assert kwargs["data"]["remoteip"] == "10.0.0.1"
+
+
+@pytest.mark.unit
+def test_siteverify_always_sends_an_idempotency_key(siteverify):
+    """Generate an idempotency key when the caller has none, so retries are safe."""
+    verify_turnstile_token("token")
+    verify_turnstile_token("token", idempotency_key="app-key")
+
+    sent = [call.kwargs["data"]["idempotency_key"] for call in siteverify.call_args_list]
+    assert sent[0]
+    assert sent[1] == "app-key"
+
+
+@pytest.mark.unit
+@override_settings(TURNSTILE_RETRIES=3)
+def test_siteverify_retries_only_failed_connections_of_post():
+    """Retry POSTs that could not connect, never read timeouts or error responses."""
+    retry = SiteverifyBackend().session.get_adapter(turnstile.SITEVERIFY_URL).max_retries
+
+    assert (retry.total, retry.connect) == (3, 3)
+    assert (retry.read, retry.status, retry.other) == (0, 0, 0)
+    assert "POST" in retry.allowed_methods
+
+
+@pytest.mark.unit
+def test_siteverify_worst_case_stays_within_the_submit_budget(settings):
+    """Bound the time a submit can wait on Siteverify with the default settings."""
+    retry = SiteverifyBackend().session.get_adapter(turnstile.SITEVERIFY_URL).max_retries
+
+    # Every attempt may use up the connect timeout, and the one that connects
+    # the read timeout. urllib3 sleeps from the second consecutive error on.
+    backoff = sum(retry.backoff_factor * 2 ** (errors - 1) for errors in range(2, retry.connect + 1))
+    worst_case = (
+        (retry.connect + 1) * settings.TURNSTILE_CONNECT_TIMEOUT + settings.TURNSTILE_READ_TIMEOUT + backoff
+    )
+
+    assert worst_case <= 5.0
+
+
+@pytest.mark.unit
+def test_verified_submit_is_answered_from_the_cache(siteverify):
+    """Reach Siteverify once per (token, idempotency key) that verified."""
+    assert verify_turnstile_token("token", idempotency_key="app-key")
+    assert verify_turnstile_token("token", idempotency_key="app-key")
+    assert verify_turnstile_token("token", idempotency_key="other-key")
+
+    assert siteverify.call_count == 2
+    assert turnstile.get_turnstile_stats()["cache_hits"] == 1
+
+
+@pytest.mark.unit
+def test_rejected_tokens_are_not_cached(siteverify):
+    """Ask Siteverify again after a rejection instead of remembering it."""
+    siteverify.return_value.json.return_value = {"success": False}
+
+    assert not verify_turnstile_token("token", idempotency_key="app-key")
+    assert not verify_turnstile_token("token", idempotency_key="app-key")
+
+    assert siteverify.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "failure",
+    [requests.ConnectionError("down"), requests.Timeout("slow"), ValueError("not JSON")],
+)
+def test_siteverify_failures_fail_closed_and_are_counted(siteverify, failure):
+    """Treat transport and parsing failures as invalid tokens."""
+    siteverify.side_effect = failure
+
+    assert verify_turnstile_token("token") is False
+    assert turnstile.get_turnstile_stats()["errors"] == 1
+
+
+@pytest.mark.unit
+def test_siteverify_requires_a_secret_key(siteverify, settings):
+    """Fail closed without calling Cloudflare when no secret is configured."""
+    settings.TURNSTILE_SECRET_KEY = None
+
+    assert verify_turnstile_token("token") is False
+    siteverify.assert_not_called()
+
+
+@pytest.mark.unit
+@override_settings(TURNSTILE_BACKEND="stub")
+def test_stub_backend_verifies_locally():
+    """Accept tokens locally, rejecting only those marked invalid."""
+    with mock.patch.object(requests.Session, "post") as post:
+        assert verify_turnstile_token("any-token") is True
+        assert verify_turnstile_token("invalid-token") is False
+        assert verify_turnstile_token("") is False
+
+    post.assert_not_called()
+    stats = turnstile.get_turnstile_stats()
+    assert (stats["backend"], stats["verified"], stats["rejected"]) == ("stub", 1, 1)
+    assert stats["latency_ms"]["mean"] is not None
+
+
+@pytest.mark.unit
+@override_settings(TURNSTILE_BACKEND="no.such.Backend")
+def test_unknown_backend_is_improperly_configured():
+    """Fail loudly on a misspelt backend rather than rejecting every token."""
+    with pytest.raises(ImproperlyConfigured):
+        verify_turnstile_token("token")
+
+
+@pytest.mark.api
+@pytest.mark.django_db
+def test_turnstile_stats_are_for_staff_only(api_client, user, admin_user):
+    """Expose the verification counters to staff only."""
+    api_client.force_authenticate(user=user)
+    assert api_client.get("/api/metrics/turnstile").status_code == status.HTTP_403_FORBIDDEN
+
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.get("/api/metrics/turnstile")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {"pid", "backend", "verified", "cache_hits", "latency_ms"} <= set(response.data)
@@ -0,0 +1,232 @@
+"""Cloudflare Turnstile verification.
+
+``verify_turnstile_token`` runs inside serialiser validation, so a slow
+Siteverify response holds the worker. The Siteverify backend therefore keeps
+a pooled keep-alive ``requests.Session`` per process (no TLS handshake per
+submission), uses separate connect and read timeouts, and retries failed
+connections only: a slow or failing Siteverify is not waited on again, which
+keeps the worst case to (retries + 1) connect timeouts plus one read timeout
+(5 seconds with the default settings). Retries are safe because every request
+carries an idempotency key:
+Siteverify answers a repeated (token, idempotency key) with the original
+result instead of rejecting the token as already used.
+
+Successful results for a (token, idempotency key) pair are cached for
+``TURNSTILE_CACHE_TIMEOUT`` seconds, so a client retrying the same submit
+does not reach Cloudflare again. ``TURNSTILE_BACKEND = "stub"`` swaps
+Siteverify for a local backend for tests and offline development.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+import uuid
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SITEVERIFY_URL = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
+
+CACHE_KEY_PREFIX = "turnstile:verified:"
+
+
+class SiteverifyBackend:
+    """Verify tokens with Cloudflare Siteverify over a pooled session."""
+
+    def __init__(self):
+        self.session = requests.Session()
+        retry = Retry(
+            total=settings.TURNSTILE_RETRIES,
+            connect=settings.TURNSTILE_RETRIES,
+            # Retrying read timeouts or 5xx responses would multiply the time
+            # a submit can hang on Siteverify; those fail closed at once.
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=0.2,
+            # POST is not retried by default; the idempotency key makes it safe.
+            allowed_methods=frozenset({"POST"}),
+        )
+        self.session.mount("https://", HTTPAdapter(max_retries=retry, pool_maxsize=4))
+
+    def verify(self, token: str, remote_ip: str | None, idempotency_key: str) -> bool:
+        """Return True when Siteverify accepts the token; fail closed otherwise."""
+        secret_key = settings.TURNSTILE_SECRET_KEY
+        if not secret_key:
+            return False
+
+        payload = {
+            "secret": secret_key,
+            "response": token,
+            "idempotency_key": idempotency_key,
+        }
+        # Include the client IP when available so Siteverify can evaluate the
+        # token in the same request context that produced it.
+        if remote_ip:
+            payload["remoteip"] = remote_ip
+
+        response = self.session.post(
+            SITEVERIFY_URL,
+            data=payload,
+            timeout=(settings.TURNSTILE_CONNECT_TIMEOUT, settings.TURNSTILE_READ_TIMEOUT),
+        )
+        response.raise_for_status()
+        return bool(response.json().get("success"))
+
+
+class StubBackend:
+    """Verify tokens locally, without network access.
+
+    Any token passes except those starting with ``"invalid"``, which lets
+    tests and local front ends exercise the rejection path.
+    """
+
+    def verify(self, token: str, remote_ip: str | None, idempotency_key: str) -> bool:
+        """Return False for ``invalid*`` tokens and True for anything else."""
+        return not token.startswith("invalid")
+
+
+BACKENDS = {
+    "siteverify": SiteverifyBackend,
+    "stub": StubBackend,
+}
+
+
+class VerifierStats:
+    """Per-process counters and latency of Turnstile verifications."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Zero every counter."""
+        with self._lock:
+            self.verified = 0
+            self.rejected = 0
+            self.errors = 0
+            self.cache_hits = 0
+            self.latency_total = 0.0
+            self.latency_max = 0.0
+
+    def record(self, outcome: str, elapsed: float):
+        """Count one backend call that ended in ``outcome`` after ``elapsed`` seconds."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self.latency_total += elapsed
+            self.latency_max = max(self.latency_max, elapsed)
+
+    def record_cache_hit(self):
+        """Count one result served from the cache."""
+        with self._lock:
+            self.cache_hits += 1
+
+    def snapshot(self) -> dict:
+        """Return the counters, with latencies in milliseconds."""
+        with self._lock:
+            calls = self.verified + self.rejected + self.errors
+            return {
+                "verified": self.verified,
+                "rejected": self.rejected,
+                "errors": self.errors,
+                "cache_hits": self.cache_hits,
+                "latency_ms": {
+                    "mean": round(self.latency_total / calls * 1000, 1) if calls else None,
+                    "max": round(self.latency_max * 1000, 1),
+                },
+            }
+
+
+stats = VerifierStats()
+
+_backend = None
+_backend_pid = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Return the process-wide verifier backend named by ``TURNSTILE_BACKEND``.
+
+    The backend is keyed on the current PID so gunicorn workers forked from a
+    preloaded master never share the master's connections.
+    """
+    global _backend, _backend_pid
+
+    with _backend_lock:
+        if _backend is None or _backend_pid != os.getpid():
+            name = settings.TURNSTILE_BACKEND
+            try:
+                backend_class = BACKENDS.get(name) or import_string(name)
+            except ImportError as exc:
+                raise ImproperlyConfigured(
+                    f"TURNSTILE_BACKEND must be one of {sorted(BACKENDS)} or a dotted path, not {name!r}."
+                ) from exc
+            _backend = backend_class()
+            _backend_pid = os.getpid()
+        return _backend
+
+
+def reset_backend():
+    """Drop the current backend, e.g. after ``TURNSTILE_BACKEND`` changed."""
+    global _backend
+
+    with _backend_lock:
+        _backend = None
+
+
+def _cache_key(token: str, idempotency_key: str) -> str:
+    """Return the cache key of a verified (token, idempotency key) pair."""
+    digest = hashlib.sha256(f"{token}\0{idempotency_key}".encode("utf-8")).hexdigest()
+    return CACHE_KEY_PREFIX + digest
+
+
+def verify_turnstile_token(
+    token: str,
+    remote_ip: str | None = None,
+    idempotency_key: str | None = None,
+) -> bool:
+    """Verify a Turnstile token against the configured backend.
+
+    The application create flow should fail closed: if the service is not
+    configured, the token is missing, or the verification request fails, the
+    token is treated as invalid and application creation is rejected.
+    """
+    if not token:
+        return False
+
+    # Only results for a caller-supplied key are cached: without one, every
+    # call is a distinct submission attempt.
+    cache_key = _cache_key(token, idempotency_key) if idempotency_key else None
+    if cache_key and cache.get(cache_key):
+        stats.record_cache_hit()
+        return True
+
+    started = time.monotonic()
+    try:
+        success = get_backend().verify(token, remote_ip, idempotency_key or str(uuid.uuid4()))
+    except (requests.RequestException, ValueError):
+        stats.record("errors", time.monotonic() - started)
+        return False
+    stats.record("verified" if success else "rejected", time.monotonic() - started)
+
+    if success and cache_key:
+        cache.set(cache_key, True, settings.TURNSTILE_CACHE_TIMEOUT)
+    return success
+
+
+# For async views: runs the blocking verification in a worker thread.
+averify_turnstile_token = sync_to_async(verify_turnstile_token, thread_sensitive=False)
+
+
+def get_turnstile_stats() -> dict:
+    """Return this process's verification counters, backend name and PID."""
+    return {"pid": os.getpid(), "backend": settings.TURNSTILE_BACKEND, **stats.snapshot()}
@@ -0,0 +1,100 @@
+"""Resumable, chunked attachment uploads written straight to storage.
+
+A multipart upload makes Django buffer the whole file (up to
+``UPLOAD_MAX_SIZE``) before the serialiser sees it, holding a worker for as
+long as a slow client takes to send it. The resumable protocol instead sends
+the file as a series of small requests (see ``api.views.AttachmentUploadViewSet``):
+
+1. ``POST /api/attachment-uploads`` declares the application, question, name
+   and size, and returns the upload ``key`` and the preferred chunk size.
+2. ``PUT /api/attachment-uploads/{key}`` sends each chunk in order with a
+   ``Content-Range: bytes <first>-<last>/<size>`` header. ``GET`` returns the
+   current ``offset`` so an interrupted upload resumes where it stopped.
+3. ``POST /api/attachment-uploads/{key}/finalise`` checks the attachment
+   limit and creates the ``ApplicationAttachment``.
+
+Each chunk is written to the attachment's final storage path as it arrives:
+staged as a block of a block blob on Azure (committed on finalise) or written
+at its offset into the file on local storage.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+
+from azure.storage.blob import BlobBlock, ContentSettings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+from storages.backends.azure_storage import AzureStorage
+
+from .models import ApplicationAttachment, AttachmentUpload
+
+
+def _storage():
+    """Return the storage attachments are saved to."""
+    return ApplicationAttachment._meta.get_field("file").storage
+
+
+def _block_id(index: int) -> str:
+    """Return the Azure block ID of chunk ``index`` (IDs must share one length)."""
+    return base64.b64encode(f"{index:08d}".encode("ascii")).decode("ascii")
+
+
+def _unsupported(storage) -> ImproperlyConfigured:
+    """Return the error raised for storages that cannot take chunks."""
+    return ImproperlyConfigured(
+        f"Resumable uploads do not support {type(storage).__name__}; "
+        "use Azure or local file system storage."
+    )
+
+
+def write_chunk(upload: AttachmentUpload, data: bytes) -> None:
+    """Write ``data`` at ``upload.received`` and advance the upload.
+
+    The caller must hold a lock on the upload row. Repeating the write at the
+    same offset (e.g. after the client lost the response) overwrites the
+    earlier attempt, so chunks are idempotent.
+    """
+    storage = _storage()
+    if isinstance(storage, AzureStorage):
+        blob_client = storage.client.get_blob_client(storage._get_valid_path(upload.file_name))
+        blob_client.stage_block(_block_id(upload.chunk_count), data, length=len(data))
+    elif isinstance(storage, FileSystemStorage):
+        file_path = storage.path(upload.file_name)
+        if upload.received == 0:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "r+b" if upload.received else "wb") as stored_file:
+            stored_file.seek(upload.received)
+            stored_file.write(data)
+            # Drop any tail left by an earlier, unacknowledged attempt.
+            stored_file.truncate()
+    else:
+        raise _unsupported(storage)
+
+    upload.received += len(data)
+    upload.chunk_count += 1
+    upload.save(update_fields=["received", "chunk_count", "content_type", "updated_at"])
+
+
+def commit(upload: AttachmentUpload) -> None:
+    """Make the uploaded chunks visible as one stored file."""
+    storage = _storage()
+    if isinstance(storage, AzureStorage):
+        blob_client = storage.client.get_blob_client(storage._get_valid_path(upload.file_name))
+        blob_client.commit_block_list(
+            [BlobBlock(block_id=_block_id(index)) for index in range(upload.chunk_count)],
+            content_settings=ContentSettings(content_type=upload.content_type),
+        )
+    elif not isinstance(storage, FileSystemStorage):
+        raise _unsupported(storage)
+    # Local chunks were written in place; nothing to do.
+
+
+def discard(upload: AttachmentUpload) -> None:
+    """Delete whatever has been stored for an abandoned or rejected upload.
+
+    Uncommitted Azure blocks cannot be deleted; Azure discards them after a
+    week. ``delete`` is a no-op when nothing was committed.
+    """
+    _storage().delete(upload.file_name)
@@ -1,9 +1,11 @@
 from api.models import ClientConfig
+from asgiref.sync import sync_to_async
 from api.serialisers import ClientConfigSerialiser
 from django.http import FileResponse
 from django.middleware.csrf import get_token
 from django.shortcuts import render
 
+from .downloads import adeliver_attachment, stream_off_event_loop
 from .models import Application, ApplicationAttachment
 
 # Prepare a standard 404 response
@@ -54,13 +56,16 @@ def resume_application(request, key):
     return generic_template(request)
 
 
-def download_attachment(request, appKey, attachmentKey):
-    """Download an attachment based on the application and attachment key provided in the URL."""
+async def download_attachment(request, appKey, attachmentKey):
+    """Download an attachment based on the application and attachment key provided in the URL.
+
+    Async so that, under ASGI, slow storage reads do not hold a worker.
+    """
     # Fetch the attachment object
     try:
-        attachment = ApplicationAttachment.objects.select_related(
+        attachment = await ApplicationAttachment.objects.select_related(
             "application", "application__owner"
-        ).get(
+        ).aget(
             application__key=appKey,
             key=attachmentKey,
             is_deleted=False,
@@ -69,31 +74,45 @@ def download_attachment(request, appKey, attachmentKey):
         return RESPONSE_404
 
     # Verify that the user has access to this application
-    if attachment.application.has_access(request.user) is False:
+    user = await request.auser()
+    if await sync_to_async(attachment.application.has_access)(user) is False:
         return RESPONSE_404
 
-    # Serve the file
-    return FileResponse(attachment.file, as_attachment=False, filename=attachment.name)
+    # Stream the file, or hand the transfer to nginx/Azure (ATTACHMENT_DELIVERY)
+    return await adeliver_attachment(request, attachment)
+
 
+async def download_application(request, appKey):
+    """Download an application in the .pdf format based on the application key provided in the URL.
 
-def download_application(request, appKey):
-    """Download an application in the .pdf format based on the application key provided in the URL."""
+    Async so that, under ASGI, waiting for Prince does not hold a worker.
+    """
     # Fetch the application object
     try:
-        application = Application.objects.select_related(
-            "questionnaire",
-            "questionnaire__process",
-            "owner",
-        ).prefetch_related("attachments").get(key=appKey)
+        application = await (
+            Application.objects.select_related(
+                "questionnaire",
+                "questionnaire__process",
+                "owner",
+            )
+            # Rendering reads the compiled questionnaire cache instead.
+            .defer("questionnaire__document")
+            .prefetch_related("attachments")
+            .aget(key=appKey)
+        )
     except Application.DoesNotExist:
         return RESPONSE_404
 
     # Verify that the user has access to this application
-    if application.has_access(request.user) is False:
+    user = await request.auser()
+    if await sync_to_async(application.has_access)(user) is False:
         return RESPONSE_404
 
-    # Generate the PDF from the submitted questionnaire structure and stored answers.
-    pdf_file = application.generate_pdf(request=request)
+    # Serve the cached render when the content is unchanged, otherwise generate
+    # the PDF from the submitted questionnaire structure and stored answers.
+    # Rendering blocks on the Prince pool, so it runs in a worker thread.
+    pdf_file = await sync_to_async(application.get_pdf)(request=request)
 
     # Serve the PDF file
-    return FileResponse(pdf_file, as_attachment=False, filename=f"application_{appKey}.pdf")
\ No newline at end of file
+    response = FileResponse(pdf_file, as_attachment=False, filename=f"application_{appKey}.pdf")
+    return stream_off_event_loop(request, response)
@@ -0,0 +1,71 @@
+"""Connection reuse for the PostgreSQL database.
+
+By default Django opens a new connection for every request, so each request
+pays for a TCP, TLS and authentication handshake with Azure PostgreSQL.
+``configure_connection_reuse`` keeps connections open instead, either:
+
+* in a psycopg3 connection pool per worker process (``DB_POOL=True``, the
+  default), or
+* as one persistent connection per thread (``DB_POOL=False``), kept for
+  ``CONN_MAX_AGE`` seconds.
+
+Django refuses to combine the two, so ``CONN_MAX_AGE`` only applies when the
+pool is disabled; ``CONN_HEALTH_CHECKS`` applies to both. ``get_pool_stats`` reports the pool counters of the current
+process (see ``api.views.DatabasePoolStatsView``).
+"""
+
+import os
+
+from django.db import connections
+
+POSTGRESQL_ENGINE = "django.db.backends.postgresql"
+
+
+def configure_connection_reuse(database: dict, env) -> dict:
+    """Add pooling or persistent connection settings to a PostgreSQL ``database``.
+
+    Other engines (SQLite in tests) are returned unchanged.
+    """
+    if database.get("ENGINE") != POSTGRESQL_ENGINE:
+        return database
+
+    # Ping a reused connection before handing it out, replacing ones the
+    # server dropped. Django applies this to pooled connections too.
+    database["CONN_HEALTH_CHECKS"] = env.bool("CONN_HEALTH_CHECKS", default=True)
+
+    if not env.bool("DB_POOL", default=True):
+        database["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+        return database
+
+    # Keyword arguments for psycopg_pool.ConnectionPool. Gunicorn runs sync
+    # workers, so each process only ever needs a handful of connections.
+    database["CONN_MAX_AGE"] = 0
+    database.setdefault("OPTIONS", {})["pool"] = {
+        "min_size": env.int("DB_POOL_MIN_SIZE", default=1),
+        "max_size": env.int("DB_POOL_MAX_SIZE", default=4),
+        # Seconds a request waits for a free connection before failing.
+        "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),
+        # Close connections idle (above min_size) or older than these seconds,
+        # so server restarts and failovers are picked up.
+        "max_idle": env.float("DB_POOL_MAX_IDLE", default=600.0),
+        "max_lifetime": env.float("DB_POOL_MAX_LIFETIME", default=3600.0),
+    }
+    return database
+
+
+def get_pool_stats() -> dict:
+    """Return the psycopg pool counters of every pooled database in this process.
+
+    Each worker process has its own pool, so the process ID is included to
+    tell samples from different workers apart.
+    """
+    pools = {}
+    for alias in connections:
+        connection = connections[alias]
+        # Only the PostgreSQL backend has a ``pool`` (None when not pooled).
+        pool = getattr(connection, "pool", None)
+        if pool is None:
+            continue
+        # get_stats() (not pop_stats()) so concurrent readers see the same totals.
+        pools[alias] = pool.get_stats()
+    return {"pid": os.getpid(), "pools": pools}
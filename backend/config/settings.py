@@ -14,6 +14,8 @@ import os
 import environ
 from pathlib import Path
 
+from config.database import configure_connection_reuse
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -177,7 +179,8 @@ WSGI_APPLICATION = "config.wsgi.application"
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
 DATABASES = {
-    "default": env.db_url(),
+    # Pooled (or persistent) connections; see config.database for the env vars.
+    "default": configure_connection_reuse(env.db_url(), env),
 }
 
 # Default user model
@@ -319,11 +322,32 @@ else:
     AZURE_ACCOUNT_NAME = env("AZURE_ACCOUNT_NAME")
     AZURE_CONTAINER = env("AZURE_CONTAINER")
     AZURE_SAS_TOKEN = env("AZURE_SAS_TOKEN")
+    # Needed only to sign per-blob SAS URLs (ATTACHMENT_DELIVERY=sas); takes
+    # precedence over AZURE_SAS_TOKEN for the storage client when set.
+    AZURE_ACCOUNT_KEY = env("AZURE_ACCOUNT_KEY", default=None)
 
 
 # Maximum allowed file size for uploads: 10MB
 UPLOAD_MAX_SIZE = 10 * 1024 * 1024
 
+# Largest chunk accepted per PUT of a resumable attachment upload; keep it
+# below DATA_UPLOAD_MAX_MEMORY_SIZE (2.5MB), which caps raw request bodies.
+ATTACHMENT_UPLOAD_CHUNK_SIZE = env.int("ATTACHMENT_UPLOAD_CHUNK_SIZE", default=1024 * 1024)
+# Hours before an unfinished resumable upload is purged (`purge_attachment_uploads`)
+ATTACHMENT_UPLOAD_EXPIRY_HOURS = env.int("ATTACHMENT_UPLOAD_EXPIRY_HOURS", default=24)
+
+# Bytes read from storage per chunk when streaming attachment downloads
+ATTACHMENT_DOWNLOAD_CHUNK_SIZE = env.int("ATTACHMENT_DOWNLOAD_CHUNK_SIZE", default=256 * 1024)
+# How attachment bytes reach the browser once access has been checked:
+#  - "stream": streamed by the Python worker (default, works everywhere)
+#  - "accel": an `X-Accel-Redirect` to an internal nginx location serving
+#    PRIVATE_MEDIA_ROOT at ATTACHMENT_ACCEL_REDIRECT_PREFIX (local storage)
+#  - "sas": a redirect to a read-only SAS URL for the single blob, valid for
+#    ATTACHMENT_SAS_EXPIRY seconds (Azure storage; needs AZURE_ACCOUNT_KEY)
+ATTACHMENT_DELIVERY = env("ATTACHMENT_DELIVERY", default="stream")
+ATTACHMENT_ACCEL_REDIRECT_PREFIX = env("ATTACHMENT_ACCEL_REDIRECT_PREFIX", default="/protected-media/")
+ATTACHMENT_SAS_EXPIRY = env.int("ATTACHMENT_SAS_EXPIRY", default=60)
+
 # Allowed mime types for uploaded files
 UPLOAD_MIME_TYPES = [
     "image/jpeg",
@@ -339,3 +363,79 @@ UPLOAD_MIME_TYPES = [
 # Cloudflare Turnstile configuration
 TURNSTILE_SITE_KEY = env("TURNSTILE_SITE_KEY", default=None)
 TURNSTILE_SECRET_KEY = env("TURNSTILE_SECRET_KEY", default=None)
+# "siteverify" (Cloudflare), "stub" (local: rejects only tokens starting with
+# "invalid", for tests and offline development) or a dotted path to a class.
+TURNSTILE_BACKEND = env("TURNSTILE_BACKEND", default="siteverify")
+# Seconds to connect to / wait for Siteverify, and retries of failed connections
+# (reads are never retried). A submit waits at most
+# (TURNSTILE_RETRIES + 1) * TURNSTILE_CONNECT_TIMEOUT + TURNSTILE_READ_TIMEOUT
+# seconds for Siteverify: 5 seconds with these defaults.
+TURNSTILE_CONNECT_TIMEOUT = env.float("TURNSTILE_CONNECT_TIMEOUT", default=1.0)
+TURNSTILE_READ_TIMEOUT = env.float("TURNSTILE_READ_TIMEOUT", default=3.0)
+TURNSTILE_RETRIES = env.int("TURNSTILE_RETRIES", default=1)
+# Seconds a verified (token, idempotency key) pair is remembered, so a retried
+# submit is not sent to Siteverify again (tokens expire after 300 seconds).
+TURNSTILE_CACHE_TIMEOUT = env.int("TURNSTILE_CACHE_TIMEOUT", default=300)
+
+
+# Prince XML PDF rendering
+PRINCE_BIN = env("PRINCE_BIN", default="prince")
+# Warm `prince --control` renderers kept per worker process (0 disables the pool
+# and falls back to one Prince subprocess per PDF).
+PRINCE_POOL_SIZE = env.int("PRINCE_POOL_SIZE", default=1)
+# Seconds a request waits for a free renderer before giving up.
+PRINCE_POOL_QUEUE_TIMEOUT = env.int("PRINCE_POOL_QUEUE_TIMEOUT", default=30)
+# Seconds a single render may take before the renderer is killed.
+PRINCE_JOB_TIMEOUT = env.int("PRINCE_JOB_TIMEOUT", default=120)
+# Recycle each renderer after this many jobs to bound memory growth.
+PRINCE_POOL_MAX_JOBS = env.int("PRINCE_POOL_MAX_JOBS", default=200)
+
+# Image attachments are embedded in PDFs as derivatives at most this many
+# pixels on their longest side (about 150 dpi on A4), JPEG quality as given.
+PDF_IMAGE_MAX_DIMENSION = env.int("PDF_IMAGE_MAX_DIMENSION", default=1600)
+PDF_IMAGE_QUALITY = env.int("PDF_IMAGE_QUALITY", default=80)
+
+# Background PDF rendering (`manage.py run_pdf_worker`)
+PDF_WORKER_POLL_INTERVAL = env.float("PDF_WORKER_POLL_INTERVAL", default=2.0)
+# Failed renders are retried until this many attempts have been made.
+PDF_JOB_MAX_ATTEMPTS = env.int("PDF_JOB_MAX_ATTEMPTS", default=3)
+# RUNNING jobs older than this many seconds are presumed orphaned and reclaimed.
+PDF_JOB_STALE_AFTER = env.int("PDF_JOB_STALE_AFTER", default=600)
+# Queue a render whenever an application is submitted or changes review status,
+# so reviewers download a cached PDF instead of waiting for Prince. Off unless
+# enabled, as the jobs pile up unprocessed where no PDF worker runs.
+PDF_PRERENDER_ON_STATUS_CHANGE = env.bool("PDF_PRERENDER_ON_STATUS_CHANGE", default=False)
+# Bulk exports convert this many PDFs at once, but never more than the worker's
+# warm renderers (PRINCE_POOL_SIZE) when the pool is enabled.
+PDF_EXPORT_CONCURRENCY = env.int("PDF_EXPORT_CONCURRENCY", default=4)
+# Largest number of applications accepted in one bulk export.
+PDF_EXPORT_MAX_APPLICATIONS = env.int("PDF_EXPORT_MAX_APPLICATIONS", default=100)
+# Hours a finished export and its ZIP archive are kept (`purge_pdf_exports`)
+PDF_EXPORT_EXPIRY_HOURS = env.int("PDF_EXPORT_EXPIRY_HOURS", default=72)
+
+# Full-text search of applications (PostgreSQL): the text search configuration
+# (stemming and stop words); run `manage.py update_search_vectors` after changing it.
+APPLICATION_SEARCH_CONFIG = env("APPLICATION_SEARCH_CONFIG", default="english")
+
+# Seconds a user's reviewable process IDs stay cached; group and
+# `assessor_groups` changes invalidate them immediately.
+REVIEWER_ACCESS_CACHE_TIMEOUT = env.int("REVIEWER_ACCESS_CACHE_TIMEOUT", default=300)
+
+# Shared cache for all workers and pods. Defaults to the database cache table
+# (created by `manage.py createcachetable`, which the container entrypoint
+# runs on start), so no extra service is needed.
+# Point CACHE_URL at Redis (`redis://host:6379/0`) or a shared directory
+# (`filecache:///path`) to change backend.
+CACHES = {
+    "default": env.cache("CACHE_URL", default="dbcache://django_cache"),
+}
+# Seconds read-mostly API resources (process and questionnaire lists) stay
+# cached; admin edits invalidate them immediately.
+API_CACHE_TIMEOUT = env.int("API_CACHE_TIMEOUT", default=3600)
+# Seconds compiled questionnaires (question index by "step.section-question")
+# stay in the shared cache. Versions are immutable, so this only bounds the
+# space taken by versions no longer in use.
+QUESTIONNAIRE_COMPILED_CACHE_TIMEOUT = env.int("QUESTIONNAIRE_COMPILED_CACHE_TIMEOUT", default=7 * 24 * 3600)
+# Seconds browsers may reuse a questionnaire document before revalidating it
+# with its ETag (0: always revalidate, which is a cheap 304 when unchanged).
+QUESTIONNAIRE_CACHE_MAX_AGE = env.int("QUESTIONNAIRE_CACHE_MAX_AGE", default=0)
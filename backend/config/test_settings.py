@@ -34,7 +34,18 @@ STORAGES = {
 
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
+# Per-process cache; cleared between tests by the autouse fixture in conftest.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
 # Force django-vite into dev-mode during tests so template rendering does not
 # require a built frontend manifest in CI backend-only jobs.
 DJANGO_VITE["default"]["dev_mode"] = True  # noqa: F405
-DJANGO_VITE["default"]["manifest_path"] = None  # noqa: F405
\ No newline at end of file
+DJANGO_VITE["default"]["manifest_path"] = None  # noqa: F405
+
+# Render PDFs through one-shot subprocesses so tests can fake ``Popen`` without
+# a warm ``prince --control`` pool.
+PRINCE_POOL_SIZE = 0
@@ -1,12 +1,28 @@
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 from applications.models import Application
 from processes.models import AuthorisationProcess
+from questionnaires.compiled import clear_local_cache
 from questionnaires.models import Questionnaire
 from users.models import User
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with empty caches (rolled-back rows never invalidate them).
+
+    Rolled-back IDs are reused, so a compiled questionnaire cached under
+    ``(id, version)`` in one test could otherwise leak into the next.
+    """
+    cache.clear()
+    clear_local_cache()
+    yield
+    cache.clear()
+    clear_local_cache()
+
+
 @pytest.fixture
 def api_client():
     """Return a DRF API client for request-level backend tests."""
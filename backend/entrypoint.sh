@@ -1,7 +1,30 @@
 #!/usr/bin/env bash
 
-echo "Launching gunicorn..."
-exec gunicorn config.wsgi \
+# Create the database cache table (CACHE_URL=dbcache://...) if it is missing;
+# a no-op once it exists or when another cache backend is configured.
+python manage.py createcachetable
+
+# SERVER_MODE=pdf-worker runs the background PDF worker (queued renders and
+# bulk exports) instead of the web server. Every deployment needs one.
+if [ "${SERVER_MODE:-wsgi}" = "pdf-worker" ]; then
+    echo "Launching PDF worker..."
+    exec python manage.py run_pdf_worker
+fi
+
+# SERVER_MODE=asgi serves config.asgi with gunicorn's asyncio worker, so the
+# async download views keep serving other requests while storage reads and
+# Prince renders are in flight. The default (wsgi) uses sync workers.
+if [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+    APP=config.asgi
+    WORKER_ARGS=(--worker-class asgi)
+else
+    APP=config.wsgi
+    WORKER_ARGS=()
+fi
+
+echo "Launching gunicorn (${SERVER_MODE:-wsgi})..."
+exec gunicorn "$APP" \
+    "${WORKER_ARGS[@]}" \
     --user appuser \
     --group appuser \
     --bind 0.0.0.0:8080 \
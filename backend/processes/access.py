@@ -0,0 +1,76 @@
+"""Resolve which authorisation processes a user may review.
+
+A user can review a process when one of their groups is listed in the
+process's ``assessor_groups``. Several code paths need this on every request
+(``Application.has_access``, the process list ``can_review`` flag and the
+assessment queue), so the set of reviewable process IDs is resolved once:
+
+* memoised for the current request (reset by ``request_started``), and
+* cached in the shared cache for ``REVIEWER_ACCESS_CACHE_TIMEOUT`` seconds.
+
+Group memberships and ``assessor_groups`` only change through the admin, so
+any change bumps the namespace version (see ``api.caching`` and
+``processes.signals``), invalidating all users at once.
+"""
+
+from __future__ import annotations
+
+from asgiref.local import Local
+from django.conf import settings
+
+from api import caching
+
+from .models import AuthorisationProcess
+
+REVIEWER_ACCESS = "reviewer-access"
+
+# Per-request memo of user pk -> reviewable process IDs
+_request_memo = Local()
+
+
+def _memo() -> dict[int, frozenset[int]]:
+    memo = getattr(_request_memo, "by_user", None)
+    if memo is None:
+        memo = _request_memo.by_user = {}
+    return memo
+
+
+def reset_request_memo(**kwargs) -> None:
+    """Forget memoised lookups; connected to ``request_started``."""
+    _request_memo.by_user = {}
+
+
+def get_reviewable_process_ids(user) -> frozenset[int]:
+    """Return the IDs of processes ``user`` may review (empty for anonymous users)."""
+    if not user.is_authenticated:
+        return frozenset()
+
+    memo = _memo()
+    process_ids = memo.get(user.pk)
+    if process_ids is not None:
+        return process_ids
+
+    process_ids = caching.get_or_set(
+        REVIEWER_ACCESS,
+        f"user-{user.pk}",
+        lambda: frozenset(
+            AuthorisationProcess.assessor_groups.through.objects.filter(
+                group_id__in=user.groups.values("id")
+            ).values_list("authorisationprocess_id", flat=True)
+        ),
+        timeout=settings.REVIEWER_ACCESS_CACHE_TIMEOUT,
+    )
+
+    memo[user.pk] = process_ids
+    return process_ids
+
+
+def can_review_process(user, process_id: int) -> bool:
+    """Return True if ``user`` may review the process with ``process_id``."""
+    return process_id in get_reviewable_process_ids(user)
+
+
+def invalidate_reviewer_access() -> None:
+    """Invalidate every cached and memoised reviewable-process set."""
+    reset_request_memo()
+    caching.invalidate(REVIEWER_ACCESS)
@@ -1,4 +1,5 @@
 from adminsortable2.admin import SortableAdminMixin
+from api import caching
 from django.contrib import admin
 from processes.models import AuthorisationProcess
 
@@ -18,3 +19,14 @@ class AuthorisationProcessAdmin(SortableAdminMixin, admin.ModelAdmin):
 
 	def has_delete_permission(self, request, obj=None):
 		return False
+
+	def save_model(self, request, obj, form, change):
+		super().save_model(request, obj, form, change)
+		# The questionnaire list embeds process slugs and sorts by process.
+		caching.invalidate(caching.PROCESS_LIST, caching.QUESTIONNAIRE_LIST)
+
+	def update_order(self, request):
+		"""Invalidate the cached lists after drag-and-drop sorting."""
+		response = super().update_order(request)
+		caching.invalidate(caching.PROCESS_LIST, caching.QUESTIONNAIRE_LIST)
+		return response
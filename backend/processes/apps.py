@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProcessesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'processes'
+
+    def ready(self):
+        # Register signal handlers (reviewer access cache invalidation).
+        from . import signals  # noqa: F401
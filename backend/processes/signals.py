@@ -0,0 +1,32 @@
+"""Signal handlers keeping cached reviewer access in sync with the admin."""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete
+from django.dispatch import receiver
+
+from .access import invalidate_reviewer_access, reset_request_memo
+from .models import AuthorisationProcess
+
+# Forget memoised reviewer access at the start of every request.
+request_started.connect(reset_request_memo, dispatch_uid="processes.reset_request_memo")
+
+_MEMBERSHIP_ACTIONS = {"post_add", "post_remove", "post_clear"}
+
+
+@receiver(m2m_changed, sender=AuthorisationProcess.assessor_groups.through)
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+def invalidate_reviewer_access_on_membership_change(sender, action, **kwargs):
+    """Invalidate when a process's assessor groups or a user's groups change."""
+    if action in _MEMBERSHIP_ACTIONS:
+        # Until the change commits, other requests still see the old links.
+        transaction.on_commit(invalidate_reviewer_access)
+
+
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=AuthorisationProcess)
+def invalidate_reviewer_access_on_delete(sender, **kwargs):
+    """Invalidate when deletes cascade through the join tables (no m2m_changed)."""
+    transaction.on_commit(invalidate_reviewer_access)
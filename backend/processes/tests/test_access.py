@@ -0,0 +1,91 @@
+"""Unit tests for the reviewer access service and its invalidation signals."""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser, Group
+from django.core.signals import request_started
+
+from processes.access import can_review_process, get_reviewable_process_ids
+from processes.models import AuthorisationProcess
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+@pytest.fixture
+def reviewer(user):
+    """Link the canonical user to a group that reviews one process."""
+    group = Group.objects.create(name="reviewers")
+    process = AuthorisationProcess.objects.create(slug="rev", name="Reviewed", description="Reviewed")
+    process.assessor_groups.add(group)
+    user.groups.add(group)
+    return user, group, process
+
+
+def _new_request():
+    """Simulate the start of a new request (clears the per-request memo)."""
+    request_started.send(sender=None)
+
+
+def test_reviewable_process_ids_are_memoised_per_request(reviewer, django_assert_num_queries):
+    """Resolve the IDs with one query, then answer repeat checks from the memo."""
+    user, _, process = reviewer
+    _new_request()
+
+    with django_assert_num_queries(1):
+        assert get_reviewable_process_ids(user) == {process.pk}
+        assert can_review_process(user, process.pk)
+        assert not can_review_process(user, process.pk + 1)
+
+
+def test_reviewable_process_ids_are_shared_through_the_cache(reviewer, django_assert_num_queries):
+    """Serve later requests from the shared cache without querying."""
+    user, _, process = reviewer
+    _new_request()
+    get_reviewable_process_ids(user)
+
+    _new_request()
+    with django_assert_num_queries(0):
+        assert get_reviewable_process_ids(user) == {process.pk}
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda user, group, process: process.assessor_groups.remove(group),
+        lambda user, group, process: user.groups.remove(group),
+        lambda user, group, process: group.user_set.clear(),
+        lambda user, group, process: group.delete(),
+    ],
+    ids=["assessor-groups", "user-groups", "reverse-user-set", "group-delete"],
+)
+def test_membership_changes_invalidate_cached_access(reviewer, change, django_capture_on_commit_callbacks):
+    """Drop cached access once group link changes commit."""
+    user, group, process = reviewer
+    _new_request()
+    assert can_review_process(user, process.pk)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        change(user, group, process)
+    _new_request()
+
+    assert not can_review_process(user, process.pk)
+
+
+def test_uncommitted_membership_changes_keep_cached_access(reviewer, django_capture_on_commit_callbacks):
+    """Leave the cache alone until the change commits, so nothing re-caches the old links."""
+    user, group, process = reviewer
+    _new_request()
+    assert can_review_process(user, process.pk)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        process.assessor_groups.remove(group)
+    _new_request()
+
+    assert len(callbacks) == 1
+    assert can_review_process(user, process.pk)
+
+
+def test_anonymous_users_review_nothing(django_assert_num_queries):
+    """Short-circuit anonymous users without touching the database."""
+    with django_assert_num_queries(0):
+        assert get_reviewable_process_ids(AnonymousUser()) == frozenset()
@@ -1,9 +1,10 @@
 from adminsortable2.admin import SortableAdminMixin
 from django.contrib import admin
 from django.db import transaction
-from django.db.models import F, Max, Window
-from django.db.models.functions import RowNumber
+from django.db.models import Max
+from django.utils import timezone
 
+from api import caching
 from questionnaires.forms import QuestionnaireForm
 from questionnaires.models import (
     Questionnaire,
@@ -113,9 +114,16 @@ class QuestionnaireAdmin(SortableAdminMixin, admin.ModelAdmin):
            ``description`` and ``sort_order`` changes are applied only to the
            latest version row (the one currently open in the form).
 
+        ``Questionnaire.save()`` moves the lineage's ``is_latest`` flag to the
+        highest version inside the same transaction.
+
         This method is wrapped by ``@transaction.atomic`` so partial updates
         cannot leave the version history in an inconsistent state.
         """
+        # Every path below changes what the questionnaire list API returns
+        # (invalidated once this admin transaction commits).
+        caching.invalidate(caching.QUESTIONNAIRE_LIST)
+
         # ----------------------------------------------------------------
         # Path 1: brand-new questionnaire — stamp author and save directly.
         # ----------------------------------------------------------------
@@ -152,6 +160,11 @@ class QuestionnaireAdmin(SortableAdminMixin, admin.ModelAdmin):
                 process_id=obj.process_id,
                 code=obj.code,
                 name=obj.name,
+                # Bulk updates skip auto_now; keep questionnaire ETags in step.
+                updated_at=timezone.now(),
+                # Cleared so a move into an existing lineage cannot yield two
+                # latest rows; obj.save() below recomputes the flag.
+                is_latest=False,
             )
 
         # ----------------------------------------------------------------
@@ -185,11 +198,16 @@ class QuestionnaireAdmin(SortableAdminMixin, admin.ModelAdmin):
         obj.updated_by = request.user
         return super().save_model(request, obj, form, change)
 
+    def update_order(self, request):
+        """Invalidate the cached questionnaire list after drag-and-drop sorting."""
+        response = super().update_order(request)
+        caching.invalidate(caching.QUESTIONNAIRE_LIST)
+        return response
+
     def get_queryset(self, request):
         """
         Override to return the latest version of each questionnaire.
-         - Use Window function to rank versions per (process, name) group
-         - Filter to keep only the latest version (rank=1)
+         - Filter on the materialised ``is_latest`` flag (partial index scan)
          - Order by process sort_order, then questionnaire sort_order and name
          This ensures the admin list shows only the latest version of each questionnaire,
          ordered in a user-friendly way.
@@ -201,13 +219,6 @@ class QuestionnaireAdmin(SortableAdminMixin, admin.ModelAdmin):
             super()
             .get_queryset(request)
             .select_related("process")
-            .annotate(
-                _latest_rank=Window(
-                    expression=RowNumber(),
-                    partition_by=[F("process_id"), F("code")],
-                    order_by=F("version").desc(),
-                )
-            )
-            .filter(_latest_rank=1)
+            .latest_versions()
             .order_by("process__sort_order", "sort_order", "name")
         )
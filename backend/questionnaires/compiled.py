@@ -0,0 +1,164 @@
+"""Compiled questionnaires: the document JSON indexed for lookups.
+
+A questionnaire version is immutable: editing the document in the admin
+creates a new row (see ``QuestionnaireAdmin.save_model``). The compiled form
+of a ``(id, version)`` pair can therefore be cached indefinitely, in this
+process and in the shared cache. Attachment validation, PDF rendering and
+answer validation then never need to load the ``document`` JSONB again.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Questionnaire
+
+# Bump when the compiled classes change shape, so stale pickles are ignored.
+CACHE_KEY_PREFIX = "questionnaire:compiled:1"
+
+# Compiled questionnaires kept in each process
+LOCAL_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class CompiledQuestion:
+    """One question of a questionnaire, addressed by its "step.section-question" key."""
+
+    key: str
+    step: int
+    section: int
+    index: int
+    type: str
+    label: str
+    is_required: bool
+    file_max_attachments: int | None
+    # The question's raw definition (read only), e.g. for grid columns.
+    definition: dict[str, Any]
+
+    @property
+    def answer_key(self) -> str:
+        """Return the "section-question" key of the answer within its step."""
+        return f"{self.section}-{self.index}"
+
+
+@dataclass(frozen=True)
+class CompiledSection:
+    """A section of a step and its questions, in document order."""
+
+    title: str
+    description: str
+    questions: tuple[CompiledQuestion, ...]
+
+
+@dataclass(frozen=True)
+class CompiledStep:
+    """A step of the questionnaire and its sections, in document order."""
+
+    title: str
+    sections: tuple[CompiledSection, ...]
+
+
+@dataclass(frozen=True)
+class CompiledQuestionnaire:
+    """The steps of one questionnaire version plus a flat index of its questions."""
+
+    id: int
+    version: int
+    steps: tuple[CompiledStep, ...]
+    questions: dict[str, CompiledQuestion]
+
+    @property
+    def step_count(self) -> int:
+        """Return the number of steps."""
+        return len(self.steps)
+
+    def question(self, key: str) -> CompiledQuestion | None:
+        """Return the question at a "step.section-question" key, or None."""
+        return self.questions.get(key)
+
+
+def compile_questionnaire(questionnaire_id: int, version: int, document: dict) -> CompiledQuestionnaire:
+    """Compile a questionnaire ``document`` into steps and a flat question index."""
+    steps = []
+    questions = {}
+    for step_index, step in enumerate((document or {}).get("steps") or []):
+        sections = []
+        for section_index, section in enumerate(step.get("sections") or []):
+            section_questions = []
+            for question_index, definition in enumerate(section.get("questions") or []):
+                key = f"{step_index}.{section_index}-{question_index}"
+                question = CompiledQuestion(
+                    key=key,
+                    step=step_index,
+                    section=section_index,
+                    index=question_index,
+                    type=definition.get("type") or "text",
+                    label=definition.get("label") or "",
+                    is_required=bool(definition.get("is_required")),
+                    file_max_attachments=definition.get("file_max_attachments"),
+                    definition=definition,
+                )
+                section_questions.append(question)
+                questions[key] = question
+            sections.append(
+                CompiledSection(
+                    title=section.get("title") or "",
+                    description=section.get("description") or "",
+                    questions=tuple(section_questions),
+                )
+            )
+        steps.append(CompiledStep(title=step.get("title") or "", sections=tuple(sections)))
+
+    return CompiledQuestionnaire(
+        id=questionnaire_id,
+        version=version,
+        steps=tuple(steps),
+        questions=questions,
+    )
+
+
+_local: OrderedDict[tuple[int, int], CompiledQuestionnaire] = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def clear_local_cache() -> None:
+    """Forget the compiled questionnaires of this process (e.g. between tests)."""
+    with _local_lock:
+        _local.clear()
+
+
+def get_compiled_questionnaire(questionnaire: Questionnaire) -> CompiledQuestionnaire:
+    """Return the compiled form of ``questionnaire``.
+
+    Only ``id`` and ``version`` are read from the instance, so callers can
+    defer ``document``; it is loaded only when neither cache has the version.
+    """
+    local_key = (questionnaire.pk, questionnaire.version)
+    with _local_lock:
+        compiled = _local.get(local_key)
+        if compiled is not None:
+            _local.move_to_end(local_key)
+            return compiled
+
+    shared_key = f"{CACHE_KEY_PREFIX}:{questionnaire.pk}:{questionnaire.version}"
+    compiled = cache.get(shared_key)
+    if compiled is None:
+        if "document" in questionnaire.get_deferred_fields():
+            document = Questionnaire.objects.values_list("document", flat=True).get(pk=questionnaire.pk)
+        else:
+            document = questionnaire.document
+        compiled = compile_questionnaire(questionnaire.pk, questionnaire.version, document)
+        cache.set(shared_key, compiled, timeout=settings.QUESTIONNAIRE_COMPILED_CACHE_TIMEOUT)
+
+    with _local_lock:
+        _local[local_key] = compiled
+        _local.move_to_end(local_key)
+        while len(_local) > LOCAL_CACHE_SIZE:
+            _local.popitem(last=False)
+    return compiled
@@ -4,10 +4,12 @@ from django import forms
 from django.utils.text import slugify
 from django_jsonform.utils import join_coords
 from django_jsonform.validators import JSONSchemaValidationError
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+
+from api.schema_registry import validate_document
 
 from .models import Questionnaire
-from .schema import get_questionnaire_schema
+from .schema import get_questionnaire_validator
 
 
 class QuestionnaireForm(forms.ModelForm):
@@ -19,8 +21,6 @@ class QuestionnaireForm(forms.ModelForm):
     lineage in the target process.
     """
 
-    _schema = get_questionnaire_schema()
-
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -46,7 +46,7 @@ class QuestionnaireForm(forms.ModelForm):
             JSONSchemaValidationError: When the value violates the JSON Schema.
         """
         try:
-            validate(value, self._schema)
+            validate_document(value, get_questionnaire_validator())
         except ValidationError as exc:
             # Map the JSON Schema error path back to a widget coordinate so
             # django-jsonform can highlight the offending field inline.
@@ -1,8 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
-from django.db.models import F, Window
-from django.db.models.functions import RowNumber
 
+from api import caching
 from questionnaires.models import Questionnaire
 
 
@@ -25,14 +24,7 @@ class Command(BaseCommand):
         to_update = []
 
         latest_rows = list(
-            Questionnaire.objects.annotate(
-                _latest_rank=Window(
-                    expression=RowNumber(),
-                    partition_by=[F("process_id"), F("code")],
-                    order_by=F("version").desc(),
-                )
-            )
-            .filter(_latest_rank=1)
+            Questionnaire.objects.latest_versions()
             .order_by("sort_order", "process_id", "code", "-version", "-id")
         )
 
@@ -53,6 +45,7 @@ class Command(BaseCommand):
         if to_update and not dry_run:
             with transaction.atomic():
                 Questionnaire.objects.bulk_update(to_update, ["sort_order"])
+                caching.invalidate(caching.QUESTIONNAIRE_LIST)
 
         if dry_run:
             self.stdout.write(
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_is_latest(apps, schema_editor):
+    """Flag the highest existing version of every (process, code) lineage."""
+    Questionnaire = apps.get_model("questionnaires", "Questionnaire")
+    lineages = Questionnaire.objects.values("process_id", "code").annotate(
+        max_version=models.Max("version")
+    )
+    for lineage in lineages:
+        Questionnaire.objects.filter(
+            process_id=lineage["process_id"],
+            code=lineage["code"],
+            version=lineage["max_version"],
+        ).update(is_latest=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('processes', '0002_authorisationprocess_reviewer_groups'),
+        ('questionnaires', '0005_questionnaire_code_not_null_and_unique_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='questionnaire',
+            name='is_latest',
+            field=models.BooleanField(default=False, editable=False, help_text='Set on the highest version of each (process, code) lineage; maintained on save.'),
+        ),
+        migrations.RunPython(backfill_is_latest, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='questionnaire',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_latest', True)), fields=('process', 'code'), name='qnaire_unique_latest_per_lineage'),
+        ),
+    ]
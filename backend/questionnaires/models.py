@@ -1,10 +1,36 @@
 from api.serialisers import JsonSchemaSerialiserMixin
-from django.db import models
+from django.db import models, transaction
 from processes.models import AuthorisationProcess
 from rest_framework import serializers
 
 from .bugfix import DocumentJSONField
-from .schema import get_questionnaire_schema
+from .schema import get_questionnaire_schema, get_questionnaire_validator
+
+
+# Fields that decide which row of a lineage is the latest version
+LINEAGE_FIELDS = frozenset({"process", "process_id", "code", "version"})
+
+
+class QuestionnaireQuerySet(models.QuerySet):
+    """Lineage operations for versioned questionnaires."""
+
+    def latest_versions(self):
+        """Return only the latest version of each ``(process, code)`` lineage."""
+        return self.filter(is_latest=True)
+
+    def refresh_latest(self, process_id: int, code: str) -> int | None:
+        """Point the lineage's ``is_latest`` flag at its highest version.
+
+        The flag is cleared on the other rows first so the partial unique
+        constraint never sees two latest rows. Returns the latest row's pk, or
+        None when the lineage is empty.
+        """
+        lineage = self.filter(process_id=process_id, code=code)
+        latest_pk = lineage.order_by("-version").values_list("pk", flat=True).first()
+        lineage.filter(is_latest=True).exclude(pk=latest_pk).update(is_latest=False)
+        if latest_pk is not None:
+            lineage.filter(pk=latest_pk, is_latest=False).update(is_latest=True)
+        return latest_pk
 
 
 class Questionnaire(models.Model):
@@ -67,6 +93,13 @@ class Questionnaire(models.Model):
         blank=True,
         null=True,
     )
+    is_latest = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Set on the highest version of each (process, code) lineage; maintained on save.",
+    )
+
+    objects = QuestionnaireQuerySet.as_manager()
 
     class Meta:
         ordering = (
@@ -80,7 +113,15 @@ class Questionnaire(models.Model):
                 "code",
                 models.F("version").desc(),
                 name="qnaire_unique_process_code_version_desc",
-            )
+            ),
+            # Partial index: "latest questionnaires" is an index scan rather
+            # than a window sort over every version, and a lineage can never
+            # have two latest rows.
+            models.UniqueConstraint(
+                fields=["process", "code"],
+                condition=models.Q(is_latest=True),
+                name="qnaire_unique_latest_per_lineage",
+            ),
         ]
 
     def __str__(self):
@@ -89,6 +130,21 @@ class Questionnaire(models.Model):
             f'(v{self.version}) for {self.process.slug}'
         )
 
+    def save(self, *args, **kwargs):
+        """Save the row and move its lineage's ``is_latest`` flag in the same transaction."""
+        update_fields = kwargs.get("update_fields")
+        refresh = update_fields is None or LINEAGE_FIELDS.intersection(update_fields)
+        with transaction.atomic():
+            if refresh:
+                # A cloned version (admin save_model) carries the flag of the
+                # row it was copied from; write it cleared and let the
+                # refresh below pick the lineage's latest row.
+                self.is_latest = False
+            super().save(*args, **kwargs)
+            if refresh:
+                latest_pk = Questionnaire.objects.refresh_latest(self.process_id, self.code)
+                self.is_latest = latest_pk == self.pk
+
 
 class QuestionnaireSerialiser(JsonSchemaSerialiserMixin, serializers.ModelSerializer):
     """Serializer for the Questionnaire model.
@@ -120,7 +176,5 @@ class QuestionnaireSerialiser(JsonSchemaSerialiserMixin, serializers.ModelSerial
         read_only_fields = fields
 
     def validate_document(self, value):
-        schema = get_questionnaire_schema()
-
-        # Validate and return with the JSON schema
-        return self._validate_document(value, schema)
+        # Validate and return with the compiled JSON schema validator
+        return self._validate_document(value, get_questionnaire_validator())
@@ -4,6 +4,8 @@ from drf_jsonschema_serializer import to_jsonschema
 from frozendict import frozendict
 from jsonschema.validators import Draft202012Validator
 
+from api.schema_registry import register_schema
+
 from .serialisers import QuestionSerialiser, SectionSerialiser, StepSerialiser
 
 # This should never be modified on runtime, therefore we use frozendict
@@ -52,5 +54,10 @@ def get_questionnaire_schema() -> dict:
     return schema
 
 
-# Do check the schema validation at the startup
-Draft202012Validator.check_schema(get_questionnaire_schema())
+# Do check the schema validation at the startup, and keep the compiled validator
+_QUESTIONNAIRE_VALIDATOR = register_schema(get_questionnaire_schema())
+
+
+def get_questionnaire_validator() -> Draft202012Validator:
+    """Return the shared compiled validator for the current questionnaire schema."""
+    return _QUESTIONNAIRE_VALIDATOR
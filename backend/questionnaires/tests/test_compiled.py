@@ -0,0 +1,91 @@
+"""Unit tests for compiled questionnaires and their caches."""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from questionnaires.compiled import (
+    clear_local_cache,
+    compile_questionnaire,
+    get_compiled_questionnaire,
+)
+from questionnaires.models import Questionnaire
+
+
+pytestmark = [pytest.mark.unit]
+
+
+DOCUMENT = {
+    "schema_version": "2025.07-1",
+    "steps": [
+        {
+            "title": "Applicant",
+            "sections": [
+                {
+                    "title": "Details",
+                    "description": "About you",
+                    "questions": [
+                        {"label": "Name", "type": "text", "is_required": True},
+                        {"label": "Evidence", "type": "file", "file_max_attachments": 3},
+                    ],
+                }
+            ],
+        },
+        {"title": "", "sections": [{"questions": [{"label": "Notes"}]}]},
+    ],
+}
+
+
+def test_compile_indexes_questions_by_step_section_question_key():
+    """Flatten every question under its "step.section-question" key."""
+    compiled = compile_questionnaire(7, 2, DOCUMENT)
+
+    assert (compiled.id, compiled.version, compiled.step_count) == (7, 2, 2)
+    assert list(compiled.questions) == ["0.0-0", "0.0-1", "1.0-0"]
+    evidence = compiled.question("0.0-1")
+    assert (evidence.type, evidence.file_max_attachments, evidence.answer_key) == ("file", 3, "0-1")
+    assert compiled.question("0.0-0").is_required is True
+    # Missing types default to text, like the PDF template.
+    assert compiled.question("1.0-0").type == "text"
+    assert compiled.question("5.0-0") is None
+    assert compiled.steps[0].sections[0].description == "About you"
+
+
+@pytest.mark.django_db
+def test_compiled_questionnaire_is_cached_without_reading_the_document(questionnaire):
+    """Compile once, then serve later lookups without loading the document."""
+    get_compiled_questionnaire(questionnaire)
+    deferred = Questionnaire.objects.defer("document").get(pk=questionnaire.pk)
+
+    with CaptureQueriesContext(connection) as queries:
+        compiled = get_compiled_questionnaire(deferred)
+
+    assert len(queries) == 0
+    assert compiled.id == questionnaire.pk
+
+
+@pytest.mark.django_db
+def test_compiled_questionnaire_is_shared_between_processes(questionnaire):
+    """Reuse the shared cache entry when this process has not compiled the version yet."""
+    compiled = get_compiled_questionnaire(questionnaire)
+    clear_local_cache()
+    deferred = Questionnaire.objects.defer("document").get(pk=questionnaire.pk)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert get_compiled_questionnaire(deferred) == compiled
+
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_deferred_document_is_loaded_on_a_cache_miss(questionnaire):
+    """Load just the document when neither cache has the version."""
+    deferred = Questionnaire.objects.defer("document").get(pk=questionnaire.pk)
+    cache.clear()
+
+    with CaptureQueriesContext(connection) as queries:
+        compiled = get_compiled_questionnaire(deferred)
+
+    assert len(queries) == 1
+    assert compiled.step_count == len(questionnaire.document["steps"])
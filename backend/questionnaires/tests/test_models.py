@@ -122,3 +122,54 @@ def test_questionnaire_unique_constraint_blocks_same_process_code_and_version(pr
             sort_order=2,
             created_by=user,
         )
+
+
+def _create_version(process, user, code, version):
+    """Create one version row in the given lineage."""
+    return Questionnaire.objects.create(
+        process=process,
+        code=code,
+        name=f"{code} v{version}",
+        description="Description",
+        version=version,
+        document=_document(),
+        sort_order=1,
+        created_by=user,
+    )
+
+
+def test_questionnaire_is_latest_follows_the_highest_version_in_each_lineage(process, user):
+    """Move the latest flag to each new version and leave other lineages alone."""
+    first = _create_version(process, user, "new", 1)
+    renewal = _create_version(process, user, "renewal", 1)
+    assert first.is_latest
+
+    second = _create_version(process, user, "new", 2)
+    first.refresh_from_db()
+
+    assert second.is_latest
+    assert not first.is_latest
+    assert list(Questionnaire.objects.latest_versions().order_by("code")) == [second, renewal]
+
+
+def test_questionnaire_is_latest_is_recomputed_when_a_row_moves_lineage(process, user):
+    """Recompute both flags when the latest row is moved to another code."""
+    first = _create_version(process, user, "new", 1)
+    second = _create_version(process, user, "new", 2)
+
+    second.code = "renewal"
+    second.save(update_fields=["code"])
+    Questionnaire.objects.refresh_latest(process.pk, "new")
+    first.refresh_from_db()
+
+    assert second.is_latest
+    assert first.is_latest
+
+
+def test_questionnaire_partial_unique_constraint_blocks_two_latest_rows(process, user):
+    """Never allow two rows of one lineage to be flagged latest."""
+    _create_version(process, user, "new", 1)
+    _create_version(process, user, "new", 2)
+
+    with pytest.raises(IntegrityError):
+        Questionnaire.objects.update(is_latest=True)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Compare the concurrent throughput of running deployments (e.g. WSGI vs ASGI).
+
+Each target is hammered with the same paths from ``--concurrency`` threads,
+then latency percentiles and requests per second are printed side by side:
+
+    python3 scripts/load_test.py \\
+        --target wsgi=http://localhost:8080 --target asgi=http://localhost:8081 \\
+        --path /d/<app key>/<attachment key> --cookie sessionid=<session> \\
+        --concurrency 32 --requests 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import requests
+
+
+@dataclass
+class RunResult:
+    """Outcome of loading one target."""
+
+    name: str
+    elapsed: float
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure concurrent throughput of one or more running deployments."
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        required=True,
+        help="NAME=BASE_URL of a deployment to load, e.g. asgi=http://localhost:8081 (repeatable).",
+    )
+    parser.add_argument(
+        "--path",
+        action="append",
+        required=True,
+        help="Path to request, e.g. an attachment or PDF download (repeatable; used round-robin).",
+    )
+    parser.add_argument(
+        "--cookie",
+        action="append",
+        default=[],
+        help="NAME=VALUE cookie sent with every request, e.g. sessionid=... (repeatable).",
+    )
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per target.")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds per request.")
+    return parser.parse_args()
+
+
+def split_pair(value: str) -> tuple[str, str]:
+    """Split ``NAME=VALUE`` into its two parts."""
+    name, separator, rest = value.partition("=")
+    if not separator or not name:
+        raise ValueError(f"Expected NAME=VALUE, got {value!r}")
+    return name, rest
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of ``values`` (``fraction`` in 0..1)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_target(
+    name: str,
+    base_url: str,
+    paths: list[str],
+    cookies: dict[str, str],
+    concurrency: int,
+    total: int,
+    timeout: float,
+) -> RunResult:
+    """Send ``total`` GETs to ``base_url`` from ``concurrency`` threads and time them."""
+    local = threading.local()
+
+    def fetch(index: int) -> tuple[float, int | str]:
+        # One keep-alive session per client thread, like a browser.
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            local.session.cookies.update(cookies)
+        started = time.perf_counter()
+        try:
+            with local.session.get(
+                base_url.rstrip("/") + paths[index % len(paths)], stream=True, timeout=timeout
+            ) as response:
+                # Read the whole body: the point is to measure streaming, not headers.
+                for _ in response.iter_content(64 * 1024):
+                    pass
+                outcome = response.status_code
+        except requests.RequestException as exc:
+            outcome = type(exc).__name__
+        return time.perf_counter() - started, outcome
+
+    result = RunResult(name=name, elapsed=0.0)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for latency, outcome in executor.map(fetch, range(total)):
+            result.latencies.append(latency)
+            result.statuses[outcome] += 1
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def format_results(results: list[RunResult]) -> str:
+    """Return a table of throughput and latency percentiles, one row per target."""
+    lines = [
+        f"{'target':<12} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statuses"
+    ]
+    for result in results:
+        throughput = len(result.latencies) / result.elapsed if result.elapsed else 0.0
+        # Statuses mix ints (HTTP codes) and strings (exception names).
+        ordered = sorted(result.statuses.items(), key=lambda item: str(item[0]))
+        statuses = ", ".join(f"{status}: {count}" for status, count in ordered)
+        lines.append(
+            f"{result.name:<12} {throughput:>8.1f} "
+            f"{percentile(result.latencies, 0.50) * 1000:>8.0f} "
+            f"{percentile(result.latencies, 0.95) * 1000:>8.0f} "
+            f"{percentile(result.latencies, 0.99) * 1000:>8.0f}  {statuses}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Load each target in turn and print the comparison."""
+    args = parse_args()
+    cookies = dict(split_pair(cookie) for cookie in args.cookie)
+    results = [
+        run_target(
+            name,
+            base_url,
+            args.path,
+            cookies,
+            args.concurrency,
+            args.requests,
+            args.timeout,
+        )
+        for name, base_url in (split_pair(target) for target in args.target)
+    ]
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Test suite for versioning scripts: sync_version.py and get_image_tag.py"""
+"""Test suite for helper scripts: sync_version.py, get_image_tag.py and load_test.py"""
 
 from __future__ import annotations
 
@@ -19,6 +19,7 @@ from get_image_tag import (
     get_image_tag,
     read_version as read_version_image_tag,
 )
+from load_test import RunResult, format_results, percentile, split_pair
 
 
 class TestReadVersion:
@@ -372,3 +373,35 @@ class TestIntegration:
 
         assert prod_tag != version
         assert uat_tag != f"{version}-uat"
+
+
+class TestLoadTest:
+    """Test the load test's argument parsing and reporting helpers."""
+
+    def test_split_pair(self) -> None:
+        """Test splitting NAME=VALUE, keeping '=' in the value."""
+        assert split_pair("asgi=http://localhost:8081/?a=b") == ("asgi", "http://localhost:8081/?a=b")
+
+    def test_split_pair_invalid(self) -> None:
+        """Test that a value without a name is rejected."""
+        with pytest.raises(ValueError):
+            split_pair("http://localhost:8081")
+
+    def test_percentile_nearest_rank(self) -> None:
+        """Test nearest-rank percentiles, including an empty sample."""
+        values = [float(value) for value in range(1, 101)]
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile([], 0.95) == 0.0
+
+    def test_format_results(self) -> None:
+        """Test one row per target with throughput and status counts."""
+        result = RunResult(name="asgi", elapsed=2.0, latencies=[0.1] * 10)
+        result.statuses.update({200: 9, "Timeout": 1})
+
+        table = format_results([result]).splitlines()
+
+        assert len(table) == 2
+        assert table[1].startswith("asgi")
+        assert "5.0" in table[1]
+        assert "200: 9, Timeout: 1" in table[1]